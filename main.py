@@ -1,21 +1,34 @@
-from datetime import datetime
+import argparse
+from datetime import datetime, date
+from typing import Optional
 from src.config.settings import settings
-from src.utils.logging import get_logger
-from src.pipelines.extractor import StockDataExtractor
+from src.utils.session_index import MINUTES_PER_DAY, get_session_index_for
+from src.models.domain_models import DailyData
+from src.utils.logging import get_logger, RunSummary
+from src.utils.profiling import profiled
 from src.pipelines.transformer import StockDataTransformer
 from src.pipelines.loader import StockDataLoader
+from src.pipelines.rollup import forget_rollups, update_rollups
 
 logger = get_logger(__name__)
 
 
-def run_minute_pipeline():
+def create_extractor():
+    """KIS 추출기 생성 - requests/KIS 모듈은 API를 호출하는 경로에서만 import"""
+    from src.pipelines.extractor import StockDataExtractor
+    return StockDataExtractor()
+
+
+@profiled("minute")
+def run_minute_pipeline(stock_code: str = None):
     """분봉 데이터 파이프라인 실행"""
-    logger.info("분봉 데이터 파이프라인 시작")
-    logger.info(f"대상 종목: {settings.STOCK_CODE} (삼성전자)")
+    stock_code = stock_code or settings.STOCK_CODE
+    summary = RunSummary(logger, "분봉", stock_code)
+    logger.debug("분봉 데이터 파이프라인 시작: %s", stock_code)
     
     try:
         # 초기화
-        extractor = StockDataExtractor()
+        extractor = create_extractor()
         transformer = StockDataTransformer()
         loader = StockDataLoader()
         
@@ -25,35 +38,69 @@ def run_minute_pipeline():
             return False
         
         # 분봉 데이터 처리 (OHLCV + SMA)
-        minute_data = extractor.extract_minute_data()
-        logger.info(f"분봉 데이터 추출: {len(minute_data)}건")
+        minute_data = extractor.extract_minute_data(stock_code)
+        summary.count("추출", len(minute_data))
         
         if minute_data:
             processed_minute_data = transformer.transform_minute_data(minute_data)
-            loader.save_minute_data(processed_minute_data)
-            logger.info(f"분봉 데이터 저장: {len(processed_minute_data)}건 (5분SMA, 30분SMA 포함)")
+            if not loader.save_minute_data(processed_minute_data, deduped=True):
+                # 저장되지 않은 분봉은 상위 주기에 반영하지 않고, 집계 상태는 다음 실행에서 저장소로 다시 예열
+                forget_rollups(stock_code)
+                logger.error("%s 분봉 저장 실패 - 상위 주기 갱신 생략", stock_code)
+                return False
+            summary.count("저장", len(processed_minute_data))
+            summary.count("상위 주기", update_rollups(loader, processed_minute_data))
         else:
-            logger.info("분봉 데이터가 없습니다 (장시간 외 또는 데이터 없음)")
+            logger.debug("분봉 데이터가 없습니다 (장시간 외 또는 데이터 없음)")
         
-        logger.info("분봉 파이프라인 실행 완료!")
+        summary.success = True
         return True
         
     except Exception as e:
-        logger.error(f"분봉 파이프라인 실행 중 오류 발생: {e}")
+        logger.error("분봉 파이프라인 실행 중 오류 발생: %s", e)
         return False
     
     finally:
-        logger.info("분봉 데이터 파이프라인 종료")
+        summary.emit()
+
 
+def build_daily_from_minutes(stock_code: str, session_date: date, transformer: StockDataTransformer, loader: StockDataLoader) -> Optional[DailyData]:
+    """저장된 당일 분봉에 시가(첫 분봉)와 종가(마감 동시호가 분봉)가 모두 있으면 일봉으로 집계
 
-def run_daily_pipeline():
+    체결 없는 분은 비어 있을 수 있으므로 DAILY_MAX_MISSING_MINUTES건까지 허용하고,
+    그보다 많이 비면 복구가 실패한 것으로 보고 일봉 API를 사용한다 (고가/저가/거래량이 틀어지지 않도록).
+    """
+    index = get_session_index_for(session_date)
+    if index is None:
+        return None
+    
+    minute_data = loader.get_minute_data(stock_code, session_date.isoformat())
+    base_key = session_date.toordinal() * MINUTES_PER_DAY
+    present_slots = {index.slot_of(data.minute_key - base_key) for data in minute_data}
+    if 0 not in present_slots or index.closing_slot not in present_slots:
+        logger.debug("저장된 분봉에 시가/종가 분봉 없음 (%s건) - 일봉 API 사용", len(minute_data))
+        return None
+    
+    missing_count = len(index.missing_slots(present_slots))
+    if missing_count > settings.DAILY_MAX_MISSING_MINUTES:
+        logger.warning("%s 저장된 분봉 %s분 누락 (허용 %s분) - 일봉 API 사용", stock_code, missing_count,
+                       settings.DAILY_MAX_MISSING_MINUTES)
+        return None
+    if missing_count:
+        logger.debug("체결 없는 분 %s건 제외하고 일봉 집계", missing_count)
+    return transformer.aggregate_daily_data(minute_data)
+
+
+@profiled("daily")
+def run_daily_pipeline(stock_code: str = None):
     """일봉 데이터 파이프라인 실행"""
-    logger.info("일봉 데이터 파이프라인 시작")
-    logger.info(f"대상 종목: {settings.STOCK_CODE} (삼성전자)")
+    stock_code = stock_code or settings.STOCK_CODE
+    summary = RunSummary(logger, "일봉", stock_code)
+    logger.debug("일봉 데이터 파이프라인 시작: %s", stock_code)
     
     try:
-        # 초기화
-        extractor = StockDataExtractor()
+        # 초기화 (추출기는 API가 필요할 때만 생성)
+        extractor = None
         transformer = StockDataTransformer()
         loader = StockDataLoader()
         
@@ -63,44 +110,117 @@ def run_daily_pipeline():
             return False
         
         # 일봉 데이터 처리 (당일만, OHLCV)
-        today = datetime.now().strftime("%Y%m%d")
-        daily_data = extractor.extract_daily_data(start_date=today, end_date=today)
-        logger.info(f"일봉 데이터 추출: {len(daily_data)}건")
+        today = datetime.now()
+        today_str = today.strftime("%Y%m%d")
+        daily_data = []
+        
+        # 저장된 당일 분봉으로 일봉 집계 (API 호출 없음)
+        if settings.DAILY_FROM_MINUTE:
+            derived_data = build_daily_from_minutes(stock_code, today.date(), transformer, loader)
+            if derived_data is not None:
+                daily_data = [derived_data]
+                summary.count("분봉 집계", 1)
+                
+                # 선택적 공식 일봉 대조
+                if settings.DAILY_RECONCILE:
+                    extractor = create_extractor()
+                    official_data = extractor.extract_daily_data(start_date=today_str, end_date=today_str, stock_code=stock_code)
+                    if official_data:
+                        mismatches = transformer.reconcile_daily_data(derived_data, official_data[0])
+                        if mismatches:
+                            logger.warning("분봉 집계 일봉 불일치 (공식 일봉으로 저장): %s", mismatches)
+                            daily_data = official_data[:1]
+        
+        # 분봉이 불완전하면 일봉 API 호출
+        if not daily_data:
+            extractor = extractor or create_extractor()
+            daily_data = extractor.extract_daily_data(start_date=today_str, end_date=today_str, stock_code=stock_code)
+            summary.count("API 추출", len(daily_data))
         
         if daily_data:
             processed_daily_data = transformer.transform_daily_data(daily_data)
             loader.save_daily_data(processed_daily_data)
-            logger.info(f"일봉 데이터 저장: {len(processed_daily_data)}건 (OHLCV)")
+            summary.count("저장", len(processed_daily_data))
         else:
-            logger.info("일봉 데이터가 없습니다 (주말/공휴일 또는 데이터 없음)")
+            logger.debug("일봉 데이터가 없습니다 (주말/공휴일 또는 데이터 없음)")
+        
+        summary.success = True
+        return True
+        
+    except Exception as e:
+        logger.error("일봉 파이프라인 실행 중 오류 발생: %s", e)
+        return False
+    
+    finally:
+        summary.emit()
+
+
+@profiled("repair")
+def run_repair_pipeline(stock_code: str = None):
+    """분봉 누락 복구 파이프라인 실행 (당일)"""
+    stock_code = stock_code or settings.STOCK_CODE
+    summary = RunSummary(logger, "분봉 복구", stock_code)
+    logger.debug("분봉 누락 복구 파이프라인 시작: %s", stock_code)
+    
+    try:
+        # 복구 모듈은 KIS 추출기를 함께 import하므로 복구 경로에서만 로드
+        from src.pipelines.repair import MinuteGapRepairer
+        
+        loader = StockDataLoader()
+        
+        # DynamoDB 연결 확인
+        if not loader.health_check():
+            logger.error("DynamoDB 연결 실패")
+            return False
+        
+        repaired_count = MinuteGapRepairer(loader=loader).repair_session(stock_code)
+        summary.count("복구", repaired_count)
         
-        logger.info("일봉 파이프라인 실행 완료!")
+        summary.success = True
         return True
         
     except Exception as e:
-        logger.error(f"일봉 파이프라인 실행 중 오류 발생: {e}")
+        logger.error("분봉 누락 복구 중 오류 발생: %s", e)
         return False
     
     finally:
-        logger.info("일봉 데이터 파이프라인 종료")
+        summary.emit()
 
 
-def run_pipeline():
+def run_pipeline(stock_code: str = None):
     """전체 주식 데이터 파이프라인 실행 (호환성 유지용)"""
     logger.info("전체 주식 데이터 파이프라인 시작")
 
     # 분봉 파이프라인 실행
-    minute_success = run_minute_pipeline()
+    minute_success = run_minute_pipeline(stock_code)
     
     # 일봉 파이프라인 실행
-    daily_success = run_daily_pipeline()
+    daily_success = run_daily_pipeline(stock_code)
     
     success = minute_success and daily_success
-    logger.info(f"전체 파이프라인 실행 {'완료' if success else '실패'}!")
+    logger.info("전체 파이프라인 실행 %s!", '완료' if success else '실패')
     
     return success
 
 
-if __name__ == "__main__":
-    success = run_pipeline()
+PIPELINES = {
+    "all": run_pipeline,
+    "minute": run_minute_pipeline,
+    "daily": run_daily_pipeline,
+    "repair": run_repair_pipeline,
+}
+
+
+def main():
+    """파이프라인 1회 실행 - 선택한 파이프라인이 쓰는 모듈만 import"""
+    parser = argparse.ArgumentParser(description="주식 데이터 파이프라인 1회 실행")
+    parser.add_argument("job", nargs="?", default="all", choices=list(PIPELINES), help="실행할 파이프라인 (기본: all)")
+    parser.add_argument("--stock-code", default=None, help="종목 코드 (기본: STOCK_CODE)")
+    args = parser.parse_args()
+
+    success = PIPELINES[args.job](args.stock_code)
     print("실행 완료" if success else "실행 실패")
+
+
+if __name__ == "__main__":
+    main()
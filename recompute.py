@@ -0,0 +1,27 @@
+import argparse
+from datetime import date
+from pathlib import Path
+
+from src.config.settings import settings
+from src.pipelines.recompute import IndicatorRecomputer
+
+
+def main():
+    """저장된 분봉 지표 일괄 재계산 (KIS 호출 없음)"""
+    parser = argparse.ArgumentParser(description="저장된 분봉 지표(SMA) 일괄 재계산")
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="종료일 (기본: 오늘)")
+    parser.add_argument("--stock-codes", default=None, help="쉼표로 구분한 종목 (기본: STOCK_CODES)")
+    parser.add_argument("--workers", type=int, default=8, help="병렬 처리 단위(종목 x 월) 수")
+    parser.add_argument("--checkpoint", type=Path, default=Path("data/recompute_checkpoint.json"), help="진행 상황 파일")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 지우고 처음부터")
+    args = parser.parse_args()
+
+    stock_codes = args.stock_codes.split(",") if args.stock_codes else settings.get_stock_codes()
+    recomputer = IndicatorRecomputer(checkpoint_path=args.checkpoint)
+    success = recomputer.run(stock_codes, args.start, args.end, workers=args.workers, reset=args.reset)
+    print("실행 완료" if success else "실행 실패")
+
+
+if __name__ == "__main__":
+    main()
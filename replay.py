@@ -0,0 +1,37 @@
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+from src.config.settings import settings
+from src.pipelines.replay import SOURCE_CSV, SOURCE_PARQUET, SOURCE_STORE, ReplayEngine
+
+
+def main():
+    """저장된 분봉을 변환기에 재생 (백테스트/지표 로직 검증, KIS 호출 없음)"""
+    parser = argparse.ArgumentParser(description="저장된 분봉 고속 재생")
+    parser.add_argument("--source", choices=[SOURCE_STORE, SOURCE_CSV, SOURCE_PARQUET], default=SOURCE_STORE,
+                        help="입력 (store: STORAGE_BACKEND 저장소, csv/parquet: --path의 <종목> 파일)")
+    parser.add_argument("--path", type=Path, default=None, help="csv/parquet 파일 디렉토리")
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="종료일 (기본: 오늘)")
+    parser.add_argument("--stock-codes", default=None, help="쉼표로 구분한 종목 (기본: STOCK_CODES)")
+    parser.add_argument("--workers", type=int, default=4, help="종목 병렬 처리 프로세스 수")
+    parser.add_argument("--output", type=Path, default=None, help="지표 출력 디렉토리 (<종목>.csv)")
+    parser.add_argument("--verify", action="store_true", help="입력에 저장된 지표와 비교 (불일치 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    if args.source != SOURCE_STORE and args.path is None:
+        parser.error("csv/parquet 입력에는 --path가 필요합니다")
+
+    stock_codes = args.stock_codes.split(",") if args.stock_codes else settings.get_stock_codes()
+    engine = ReplayEngine(args.source, args.path, output_dir=args.output, verify=args.verify)
+    results, failed = engine.run(stock_codes, args.start, args.end, workers=args.workers)
+
+    mismatches = sum(result.mismatches for result in results)
+    print("실행 완료" if not failed and not mismatches else "실행 실패")
+    sys.exit(0 if not failed and not mismatches else 1)
+
+
+if __name__ == "__main__":
+    main()
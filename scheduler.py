@@ -1,105 +1,210 @@
 from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
-from datetime import datetime
+from apscheduler.triggers.interval import IntervalTrigger
+from datetime import datetime, time as dt_time, timedelta
+from typing import List, Optional
+import argparse
 import logging
+import multiprocessing
+import time
 
-from main import run_minute_pipeline, run_daily_pipeline
+from main import run_minute_pipeline, run_daily_pipeline, run_repair_pipeline
 from src.config.settings import settings
 from src.utils.logging import get_logger
+from src.utils.profiling import install_profile_signal
+from src.utils.circuit_breaker import STATE_CLOSED, get_circuit_states
 from src.utils.date_utils import get_market_status
+from src.utils.shard_utils import ShardCoordinator
+from src.utils.market_triggers import TradingMinuteTrigger, SessionCloseTrigger
 
 logger = get_logger(__name__)
 
 
-def minute_job():
+def get_target_stock_codes(coordinator: Optional[ShardCoordinator] = None) -> List[str]:
+    """이번 실행에서 수집할 종목 (워커 모드면 담당 샤드만)"""
+    stock_codes = settings.get_stock_codes()
+    if coordinator is None:
+        return stock_codes
+    return coordinator.get_my_stock_codes(stock_codes)
+
+
+def minute_job(coordinator: Optional[ShardCoordinator] = None):
     """1분봉 데이터 수집"""
     current_time = datetime.now()
     
     try:
-        # 하위 로그 레벨 조정
-        original_level = logging.getLogger().level
-        logging.getLogger().setLevel(logging.ERROR)
-        
-        success = run_minute_pipeline()
+        stock_codes = get_target_stock_codes(coordinator)
+        failed_codes = [code for code in stock_codes if not run_minute_pipeline(code)]
         
-        # 로그 레벨 복원
-        logging.getLogger().setLevel(original_level)
-        
-        if success:
-            logger.info(f"[{current_time.strftime('%H:%M')}] 1분봉 수집 완료")
+        if not failed_codes:
+            logger.info("[%s] 1분봉 수집 완료 (%s종목)", current_time.strftime('%H:%M'), len(stock_codes))
         else:
-            logger.error(f"[{current_time.strftime('%H:%M')}] 1분봉 수집 실패")
+            # 차단 중인 의존성이 있으면 함께 표시 (차단 중에는 종목별 호출이 즉시 실패)
+            blocked = [name for name, state in get_circuit_states().items() if state["state"] != STATE_CLOSED]
+            suffix = f" - 차단: {', '.join(blocked)}" if blocked else ""
+            logger.error("[%s] 1분봉 수집 실패 (%s/%s종목)%s", current_time.strftime('%H:%M'), len(failed_codes), len(stock_codes), suffix)
     except Exception as e:
-        logging.getLogger().setLevel(original_level)
-        logger.error(f"[{current_time.strftime('%H:%M')}] 오류: {str(e)[:50]}...")
+        logger.error("[%s] 오류: %s...", current_time.strftime('%H:%M'), str(e)[:50])
 
 
-def daily_job():
+def daily_job(coordinator: Optional[ShardCoordinator] = None):
     """일봉 데이터 수집"""
     current_time = datetime.now()
     
     try:
-        # 하위 로그 레벨 조정
-        original_level = logging.getLogger().level
-        logging.getLogger().setLevel(logging.ERROR)
-        
-        success = run_daily_pipeline()
+        stock_codes = get_target_stock_codes(coordinator)
+        failed_codes = [code for code in stock_codes if not run_daily_pipeline(code)]
         
-        # 로그 레벨 복원
-        logging.getLogger().setLevel(original_level)
+        if not failed_codes:
+            logger.info("[%s] 일봉 수집 완료 (%s종목)", current_time.strftime('%H:%M'), len(stock_codes))
+        else:
+            logger.error("[%s] 일봉 수집 실패 (%s/%s종목)", current_time.strftime('%H:%M'), len(failed_codes), len(stock_codes))
+    except Exception as e:
+        logger.error("[%s] 오류: %s...", current_time.strftime('%H:%M'), str(e)[:50])
+
+
+def repair_job(coordinator: Optional[ShardCoordinator] = None):
+    """당일 분봉 누락 복구"""
+    current_time = datetime.now()
+    
+    try:
+        stock_codes = get_target_stock_codes(coordinator)
+        failed_codes = [code for code in stock_codes if not run_repair_pipeline(code)]
         
-        if success:
-            logger.info(f"[{current_time.strftime('%H:%M')}] 일봉 수집 완료")
+        if not failed_codes:
+            logger.info("[%s] 분봉 누락 복구 완료 (%s종목)", current_time.strftime('%H:%M'), len(stock_codes))
         else:
-            logger.error(f"[{current_time.strftime('%H:%M')}] 일봉 수집 실패")
+            logger.error("[%s] 분봉 누락 복구 실패 (%s/%s종목)", current_time.strftime('%H:%M'), len(failed_codes), len(stock_codes))
     except Exception as e:
-        logging.getLogger().setLevel(original_level)
-        logger.error(f"[{current_time.strftime('%H:%M')}] 오류: {str(e)[:50]}...")
+        logger.error("[%s] 오류: %s...", current_time.strftime('%H:%M'), str(e)[:50])
 
 
-def main():
-    """스케줄러 실행"""
-    # 외부 라이브러리 로깅 레벨 조정
+def configure_library_logging():
+    """외부 라이브러리 로깅 레벨 조정"""
     logging.getLogger('apscheduler').setLevel(logging.WARNING)
     logging.getLogger('boto3').setLevel(logging.WARNING)
     logging.getLogger('botocore').setLevel(logging.WARNING)
     logging.getLogger('urllib3').setLevel(logging.WARNING)
     logging.getLogger('requests').setLevel(logging.WARNING)
-    
+
+
+def build_scheduler(coordinator: Optional[ShardCoordinator] = None) -> BlockingScheduler:
+    """수집 작업이 등록된 스케줄러 생성"""
     scheduler = BlockingScheduler()
     
-    # 1분봉 수집
+    # 1분봉 수집 (거래 세션 안에서만, 휴장일 제외)
     scheduler.add_job(
         minute_job,
-        CronTrigger(
-            day_of_week='mon-fri',
-            hour=f"{settings.MINUTE_JOB_HOUR_START}-{settings.MINUTE_JOB_HOUR_END}",
-            minute='*',
-            second=0
-        ),
+        TradingMinuteTrigger(),
+        args=[coordinator],
         id='minute_collection',
         max_instances=1
     )
     
-    # 일봉 수집
+    # 분봉 누락 복구 (장 마감 직후, 일봉 수집 전)
+    scheduler.add_job(
+        repair_job,
+        SessionCloseTrigger(delay=timedelta(minutes=settings.REPAIR_JOB_DELAY_MIN)),
+        args=[coordinator],
+        id='minute_repair',
+        max_instances=1
+    )
+    
+    # 일봉 수집 (거래일 장 마감 이후)
     scheduler.add_job(
         daily_job,
-        CronTrigger(
-            day_of_week='mon-fri',
-            hour=settings.DAILY_JOB_HOUR,
-            minute=0,
-            second=0
+        SessionCloseTrigger(
+            delay=timedelta(minutes=settings.DAILY_JOB_DELAY_MIN),
+            not_before=dt_time(settings.DAILY_JOB_HOUR, 0)
         ),
+        args=[coordinator],
         id='daily_collection',
         max_instances=1
     )
     
+    # 워커 lease 갱신
+    if coordinator is not None:
+        scheduler.add_job(
+            coordinator.heartbeat,
+            IntervalTrigger(seconds=settings.WORKER_HEARTBEAT_SEC),
+            id='worker_heartbeat',
+            max_instances=1
+        )
+    
+    return scheduler
+
+
+def worker_main(worker_id: int):
+    """샤드 워커 프로세스 - 자체 커넥션 풀과 스케줄러로 담당 종목 수집"""
+    configure_library_logging()
+    install_profile_signal()
+    
+    coordinator = ShardCoordinator(worker_id)
+    coordinator.heartbeat()
+    scheduler = build_scheduler(coordinator)
+    
+    logger.info("워커 %s 시작 - 담당 종목 %s개", worker_id, len(get_target_stock_codes(coordinator)))
+    
+    try:
+        scheduler.start()
+    except KeyboardInterrupt:
+        logger.info("워커 %s 종료", worker_id)
+        scheduler.shutdown()
+    finally:
+        coordinator.release()
+
+
+def run_workers(worker_count: int):
+    """N개 워커 프로세스 실행 및 감시 - 죽은 워커는 재시작"""
+    context = multiprocessing.get_context("spawn")
+    workers = {}
+    
+    def start_worker(worker_id: int):
+        process = context.Process(target=worker_main, args=(worker_id,), name=f"worker-{worker_id}")
+        process.start()
+        workers[worker_id] = process
+    
+    for worker_id in range(worker_count):
+        start_worker(worker_id)
+    
+    logger.info("워커 %s개 시작 - 수집 종목 %s개", worker_count, len(settings.get_stock_codes()))
+    
+    try:
+        while True:
+            time.sleep(settings.WORKER_HEARTBEAT_SEC)
+            for worker_id, process in list(workers.items()):
+                if not process.is_alive():
+                    # 재시작 전까지는 lease 만료 후 다른 워커가 해당 샤드를 이어받음
+                    logger.warning("워커 %s 비정상 종료 (exitcode=%s), 재시작", worker_id, process.exitcode)
+                    start_worker(worker_id)
+    except KeyboardInterrupt:
+        logger.info("워커 종료 대기")
+        for process in workers.values():
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+
+
+def main():
+    """스케줄러 실행"""
+    parser = argparse.ArgumentParser(description="주식 데이터 수집 스케줄러")
+    parser.add_argument("--workers", type=int, default=settings.WORKER_COUNT, help="샤드 워커 프로세스 수")
+    args = parser.parse_args()
+    
+    configure_library_logging()
+    install_profile_signal()
+    
+    if args.workers > 1:
+        run_workers(args.workers)
+        return
+    
+    scheduler = build_scheduler()
+    
     # 현재 시장 상태 표시
     current_time = datetime.now()
     status = get_market_status(current_time)
     
     if "휴장일" in status:
-        logger.info(f"현재는 {status}입니다")
+        logger.info("현재는 %s입니다", status)
     elif "장 시작 전" in status:
         logger.info("현재는 장 시작 전 시간입니다")
     elif "장 마감" in status:
@@ -107,9 +212,9 @@ def main():
     elif "장중" in status:
         logger.info("현재는 장중입니다")
     else:
-        logger.info(f"현재 시장 상태: {status}")
+        logger.info("현재 시장 상태: %s", status)
     
-    logger.info(f"스케줄러 시작 - 1분봉({settings.MINUTE_JOB_HOUR_START}:00-{settings.MINUTE_JOB_HOUR_END}:30), 일봉({settings.DAILY_JOB_HOUR}:00)")
+    logger.info("스케줄러 시작 - 1분봉(거래 세션 중 매분), 일봉(장 마감 %s분 후, %s:00 이후)", settings.DAILY_JOB_DELAY_MIN, settings.DAILY_JOB_HOUR)
     
     try:
         scheduler.start()
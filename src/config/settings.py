@@ -1,33 +1,120 @@
-from pydantic import Field
+import logging
+from typing import Any, List
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 
+# 거래 캘린더 도입으로 삭제된 설정
+REMOVED_SETTINGS = {"MINUTE_JOB_HOUR_START", "MINUTE_JOB_HOUR_END"}
+
+
 class Settings(BaseSettings):
     # 한국투자증권 OpenAPI 설정
     KIS_APP_KEY: str = Field(..., env="KIS_APP_KEY")
     KIS_APP_SECRET: str = Field(..., env="KIS_APP_SECRET")
     KIS_BASE_URL: str = Field(default="https://openapi.koreainvestment.com:9443")
+    KIS_WS_URL: str = Field(default="ws://ops.koreainvestment.com:21000")  # 실시간 시세 WebSocket
+    KIS_WS_RECONNECT_MAX_SEC: float = Field(default=30.0)  # 실시간 연결 끊김 시 재접속 대기 최대값 (1초부터 2배씩)
+    KIS_RATE_LIMIT_PER_SEC: int = Field(default=15)  # 전체 워커가 공유하는 초당 호출 수
+    KIS_TOKEN_BACKGROUND_REFRESH: bool = Field(default=True)  # 만료 전 백그라운드 토큰 갱신
+    KIS_TOKEN_REFRESH_AHEAD_MIN: int = Field(default=60)  # 만료 몇 분 전에 갱신할지
+    KIS_FAST_DECODE: bool = Field(default=True)  # orjson/msgspec 설치 시 고속 응답 파싱 사용
+    KIS_SINGLE_FLIGHT: bool = Field(default=True)  # 프로세스 내 동일 요청(tr_id+params) 동시 호출 병합
+    KIS_RESPONSE_CACHE_SEC: float = Field(default=2.0)  # 동일 요청 응답 재사용 시간 (0이면 병합만)
+    KIS_RESPONSE_STORE: bool = Field(default=False)  # 확정된 응답(지난 일봉, 완료된 분봉 구간)을 data/kis_responses/에 저장해 재사용
+    KIS_RESPONSE_STORE_MAX_MB: int = Field(default=512)  # 응답 저장소 최대 크기 (초과 시 오래 안 쓴 응답부터 삭제)
+    
+    # 저장소 설정
+    STORAGE_BACKEND: str = Field(default="dynamodb")  # dynamodb | sqlite
+    SQLITE_PATH: str = Field(default="data/stock_data.db")
     
     # AWS DynamoDB 설정
     AWS_REGION: str = Field(default="ap-northeast-2")
-    AWS_ACCESS_KEY_ID: str = Field(..., env="AWS_ACCESS_KEY_ID")
-    AWS_SECRET_ACCESS_KEY: str = Field(..., env="AWS_SECRET_ACCESS_KEY")
+    AWS_ACCESS_KEY_ID: str = Field(default="")  # STORAGE_BACKEND=sqlite면 불필요
+    AWS_SECRET_ACCESS_KEY: str = Field(default="")
     DYNAMODB_TABLE_NAME: str = Field(default="samsung_stock_data")
+    DYNAMODB_LOW_LEVEL_WRITE: bool = Field(default=True)  # 타입 지정 속성 맵 + client.batch_write_item 저장
+    DYNAMODB_ITEM_LAYOUT: str = Field(default="standard")  # 분봉 아이템 형식: standard | compact | packed
+    DYNAMODB_PACK_BY: str = Field(default="hour")  # packed 묶음 단위: hour | session
+    DYNAMODB_MINUTE_BUCKET: str = Field(default="")  # 분봉 파티션 버킷: "" | month | day (STOCK#005930#MINUTE#2025-09)
+    DYNAMODB_QUERY_WORKERS: int = Field(default=8)  # 버킷 파티션 병렬 조회 스레드 수
+    INDICATOR_SCALE: int = Field(default=2)  # compact/packed 저장 시 지표 소수 자릿수
+    ROLLUP_INTERVALS: str = Field(default="5,15,60")  # 분봉에서 증분 집계할 상위 주기(분), 비우면 사용 안 함
     
     # 데이터 수집 설정
     STOCK_CODE: str = Field(default="005930")
+    STOCK_CODES: str = Field(default="")  # 쉼표로 구분한 수집 종목 (비어 있으면 STOCK_CODE)
+    DAILY_FROM_MINUTE: bool = Field(default=True)  # 저장된 분봉으로 일봉 집계 (시가/종가 분봉이 없으면 일봉 API)
+    DAILY_MAX_MISSING_MINUTES: int = Field(default=5)  # 분봉 집계 시 허용할 빈 분 수 (체결 없는 분), 넘으면 일봉 API
+    DAILY_RECONCILE: bool = Field(default=False)  # 집계 일봉을 공식 일봉과 대조 (종목당 1회 호출)
     RETRY_COUNT: int = Field(default=3)
     RETRY_DELAY: int = Field(default=1)
     
     # 로깅 설정
     LOG_LEVEL: str = Field(default="INFO")
+    LOG_LEVELS: str = Field(default="")  # 모듈별 레벨 (예: "src.pipelines=WARNING,src.kis=INFO")
+    LOG_ASYNC: bool = Field(default=True)  # 큐 + 백그라운드 스레드로 로그 출력
+    
+    # 프로파일링 설정 (data/profiles/에 저장)
+    PROFILE_MODE: str = Field(default="")  # "" (끔) | cprofile | tracemalloc
+    PROFILE_EVERY_N: int = Field(default=0)  # 파이프라인/종목별 N번째 실행마다 기록 (0이면 사용 안 함)
+    PROFILE_SLOW_MS: int = Field(default=0)  # 이보다 오래 걸린 실행의 다음 회차 기록 (0이면 사용 안 함)
+    PROFILE_KEEP: int = Field(default=50)  # 보관할 프로파일 파일 수
     
-    # 스케줄러 설정
-    MINUTE_JOB_HOUR_START: int = Field(default=9)
-    MINUTE_JOB_HOUR_END: int = Field(default=15)
+    # 스케줄러 설정 (분봉 수집은 거래 캘린더의 세션 시간을 따름)
     DAILY_JOB_HOUR: int = Field(default=16)
+    DAILY_JOB_DELAY_MIN: int = Field(default=30)  # 장 마감 후 일봉 수집까지 최소 대기 시간
+    REPAIR_JOB_DELAY_MIN: int = Field(default=5)  # 장 마감 후 분봉 누락 복구까지 대기 시간
+    TRADING_CALENDAR_FILE: str = Field(default="")  # 추가 휴장일/특수 세션 JSON
+    
+    # 멀티 워커 설정
+    WORKER_COUNT: int = Field(default=1)
+    WORKER_HEARTBEAT_SEC: int = Field(default=10)
+    WORKER_LEASE_TTL_SEC: int = Field(default=30)  # 하트비트가 끊긴 워커의 샤드를 재분배하기까지의 시간
+    
+    # 차단기 설정 (KIS/DynamoDB 장애 시 즉시 실패, DynamoDB 저장은 data/spool/에 쌓았다가 복구 후 저장)
+    CIRCUIT_BREAKER: bool = Field(default=True)
+    CIRCUIT_FAILURE_RATE: float = Field(default=0.5)  # 최근 호출 중 이 비율 이상 실패하면 차단
+    CIRCUIT_WINDOW: int = Field(default=20)  # 실패율을 계산할 최근 호출 수
+    CIRCUIT_MIN_CALLS: int = Field(default=5)  # 실패율 판단에 필요한 최소 호출 수
+    CIRCUIT_OPEN_SEC: int = Field(default=30)  # 차단 유지 시간 (이후 1건으로 복구 시험)
     
     class Config:
         env_file = ".env"
         case_sensitive = True
 
-settings = Settings()
\ No newline at end of file
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_removed_settings(cls, values: Any) -> Any:
+        """삭제된 설정이 남은 .env도 읽히도록 제거 후 경고 (나머지 알 수 없는 설정은 오류)"""
+        if isinstance(values, dict):
+            for name in sorted(REMOVED_SETTINGS.intersection(values)):
+                values.pop(name)
+                # src.utils.logging은 settings를 import하므로 표준 로거 사용
+                logging.getLogger(__name__).warning("%s 설정은 더 이상 사용하지 않습니다 (거래 캘린더의 세션 시간 사용)", name)
+        return values
+
+    def get_stock_codes(self) -> List[str]:
+        """수집 대상 종목 목록"""
+        codes = [code.strip() for code in self.STOCK_CODES.split(",") if code.strip()]
+        return codes or [self.STOCK_CODE]
+
+
+class LazySettings:
+    """첫 속성 접근 시 Settings()를 생성하는 프록시 - import만으로 .env를 읽지 않음"""
+
+    def __init__(self):
+        object.__setattr__(self, '_settings', None)
+
+    def _load(self) -> Settings:
+        if self._settings is None:
+            object.__setattr__(self, '_settings', Settings())
+        return self._settings
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._load(), name, value)
+
+
+settings = LazySettings()
@@ -1,8 +1,11 @@
 import requests
 import json
 import fcntl
+import os
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from pathlib import Path
 
 from src.config.settings import settings
@@ -23,18 +26,34 @@ class KISAuthManager:
         # 디렉토리 생성
         self.token_cache_path.parent.mkdir(exist_ok=True)
         
-        # 메모리 캐시 (성능 최적화)
-        self._memory_token: Optional[str] = None
-        self._memory_expires_at: Optional[datetime] = None
+        # 메모리 캐시 (토큰, 만료 시각) - 요청 스레드와 갱신 스레드가 함께 쓰므로 한 번에 교체
+        self._memory_token: Optional[Tuple[str, datetime]] = None
+        
+        # 파일 캐시 파싱 결과 (mtime, 데이터) - mtime이 바뀔 때만 다시 읽고 한 번에 교체
+        self._file_cache: Optional[Tuple[int, Dict]] = None
+        
+        # 만료 전 백그라운드 갱신 스레드
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_ahead = timedelta(minutes=settings.KIS_TOKEN_REFRESH_AHEAD_MIN)
+        
+        # 실시간 WebSocket 접속키 (메모리 캐시)
+        self._approval_key: Optional[str] = None
         
         logger.debug("KIS 인증 매니저 초기화 완료")
 
     def _load_token_from_cache(self) -> Optional[Dict]:
-        """파일에서 토큰 정보 로드"""
+        """파일에서 토큰 정보 로드 - 파일이 바뀌지 않았으면 이전 파싱 결과 재사용"""
+        try:
+            mtime = self.token_cache_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._file_cache = None
+            return None
+        
+        file_cache = self._file_cache
+        if file_cache is not None and file_cache[0] == mtime:
+            return file_cache[1]
+        
         try:
-            if not self.token_cache_path.exists():
-                return None
-            
             with open(self.token_cache_path, 'r') as f:
                 cache_data = json.load(f)
             
@@ -43,10 +62,11 @@ class KISAuthManager:
             if expires_str:
                 cache_data['expires_at'] = datetime.fromisoformat(expires_str)
             
+            self._file_cache = (mtime, cache_data)
             return cache_data
             
         except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"토큰 캐시 파일 로드 실패: {e}")
+            logger.warning("토큰 캐시 파일 로드 실패: %s", e)
             return None
     
     def _save_token_to_cache(self, token: str, expires_at: datetime):
@@ -71,7 +91,7 @@ class KISAuthManager:
         except Exception as e:
             logger.error(f"토큰 캐시 파일 저장 실패: {e}")
 
-    def _is_token_valid(self, token_data: Dict) -> bool:
+    def _is_token_valid(self, token_data: Dict, buffer: timedelta = timedelta(minutes=5)) -> bool:
         """토큰 유효성 검사"""
         if not token_data or 'access_token' not in token_data:
             return False
@@ -80,8 +100,8 @@ class KISAuthManager:
         if not expires_at:
             return False
         
-        # 5분 버퍼를 두고 만료 체크
-        buffer_time = datetime.now() + timedelta(minutes=5)
+        # 버퍼(기본 5분)를 두고 만료 체크
+        buffer_time = datetime.now() + buffer
         return expires_at > buffer_time
 
     @retry_with_delay((requests.RequestException,))
@@ -107,7 +127,7 @@ class KISAuthManager:
         logger.info("KIS 새 토큰 발급 성공")
         return result
 
-    def _acquire_lock_and_get_token(self) -> str:
+    def _acquire_lock_and_get_token(self, buffer: timedelta = timedelta(minutes=5)) -> str:
         """락을 획득하고 토큰을 가져오거나 발급"""
         # 락 파일을 이용한 동시성 제어
         try:
@@ -116,19 +136,15 @@ class KISAuthManager:
                 try:
                     fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
                 except IOError:
-                    # 락 획득 실패 시 잠시 대기 후 캐시에서 재로드
-                    logger.debug("다른 프로세스가 토큰 발급 중, 대기...")
-                    import time
-                    time.sleep(2)
-                    cache_data = self._load_token_from_cache()
-                    if cache_data and self._is_token_valid(cache_data):
-                        return cache_data['access_token']
-                    raise ValueError("토큰 발급 대기 후에도 유효한 토큰 없음")
+                    # 다른 프로세스가 발급 중이면 락 해제(발급 완료) 시점까지 대기
+                    logger.debug("다른 프로세스가 토큰 발급 중, 완료 대기...")
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
                 
-                # 락 획득 성공 - 다시 한번 캐시 체크
+                # 락 획득 성공 - 다시 한번 캐시 체크 (대기 중 갱신됐으면 mtime 변경으로 재로드)
                 cache_data = self._load_token_from_cache()
-                if cache_data and self._is_token_valid(cache_data):
+                if cache_data and self._is_token_valid(cache_data, buffer):
                     logger.debug("락 획득 후 캐시에서 유효한 토큰 발견")
+                    self._memory_token = (cache_data['access_token'], cache_data['expires_at'])
                     return cache_data['access_token']
                 
                 # 새 토큰 발급
@@ -141,8 +157,7 @@ class KISAuthManager:
                 
                 # 파일과 메모리에 저장
                 self._save_token_to_cache(access_token, expires_at)
-                self._memory_token = access_token
-                self._memory_expires_at = expires_at
+                self._memory_token = (access_token, expires_at)
                 
                 return access_token
                 
@@ -150,33 +165,75 @@ class KISAuthManager:
             logger.error(f"토큰 발급 프로세스 실패: {e}")
             raise
 
+    def _refresh_loop(self):
+        """만료 REFRESH_AHEAD 전에 미리 토큰 갱신 (요청 경로를 막지 않음)"""
+        while True:
+            memory_token = self._memory_token
+            expires_at = memory_token[1] if memory_token is not None else None
+            if expires_at is not None:
+                wait_sec = (expires_at - self._refresh_ahead - datetime.now()).total_seconds()
+            else:
+                wait_sec = 60
+            
+            if wait_sec > 0:
+                # 다른 프로세스의 갱신도 반영되도록 최대 10분마다 재확인
+                time.sleep(min(wait_sec, 600))
+                cache_data = self._load_token_from_cache()
+                if cache_data and self._is_token_valid(cache_data) and (
+                        expires_at is None or cache_data['expires_at'] > expires_at):
+                    self._memory_token = (cache_data['access_token'], cache_data['expires_at'])
+                continue
+            
+            try:
+                self._acquire_lock_and_get_token(buffer=self._refresh_ahead)
+                memory_token = self._memory_token
+                logger.info("토큰 백그라운드 갱신 완료 (만료: %s)", memory_token[1] if memory_token else None)
+            except Exception as e:
+                logger.warning("토큰 백그라운드 갱신 실패, 1분 후 재시도: %s", e)
+                time.sleep(60)
+
+    def start_background_refresh(self):
+        """백그라운드 갱신 스레드 시작 (프로세스당 1회)"""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, name="kis-token-refresh", daemon=True)
+        self._refresh_thread.start()
+        logger.debug("토큰 백그라운드 갱신 시작")
+
     def get_access_token(self) -> str:
         """액세스 토큰 획득 - 캐시 우선, 필요시 발급"""
         
         # 1. 메모리 캐시 체크 (가장 빠름)
-        if (self._memory_token and self._memory_expires_at and 
-            self._memory_expires_at > datetime.now() + timedelta(minutes=5)):
+        memory_token = self._memory_token
+        if memory_token is not None and memory_token[1] > datetime.now() + timedelta(minutes=5):
             logger.debug("메모리 캐시에서 토큰 반환")
-            return self._memory_token
+            return memory_token[0]
         
         # 2. 파일 캐시 체크
         cache_data = self._load_token_from_cache()
         if cache_data and self._is_token_valid(cache_data):
             # 메모리 캐시 업데이트
-            self._memory_token = cache_data['access_token']
-            self._memory_expires_at = cache_data['expires_at']
+            self._memory_token = (cache_data['access_token'], cache_data['expires_at'])
             logger.debug("파일 캐시에서 토큰 반환")
+            
+            if settings.KIS_TOKEN_BACKGROUND_REFRESH:
+                self.start_background_refresh()
             return cache_data['access_token']
         
         # 3. 새 토큰 발급 (락 사용)
         logger.info("유효한 토큰이 없어 새로 발급")
-        return self._acquire_lock_and_get_token()
+        token = self._acquire_lock_and_get_token()
+        
+        if settings.KIS_TOKEN_BACKGROUND_REFRESH:
+            self.start_background_refresh()
+        return token
 
     def invalidate_token(self):
         """토큰 무효화 (에러 발생 시 사용)"""
         logger.info("토큰 무효화")
         self._memory_token = None
-        self._memory_expires_at = None
+        self._file_cache = None
         
         try:
             if self.token_cache_path.exists():
@@ -184,6 +241,31 @@ class KISAuthManager:
         except Exception as e:
             logger.warning(f"토큰 캐시 파일 삭제 실패: {e}")
 
+    @retry_with_delay((requests.RequestException,))
+    def get_approval_key(self) -> str:
+        """실시간 WebSocket 접속키 발급"""
+        if self._approval_key:
+            return self._approval_key
+        
+        url = f"{settings.KIS_BASE_URL}/oauth2/Approval"
+        headers = {"Content-Type": "application/json"}
+        data = {
+            "grant_type": "client_credentials",
+            "appkey": settings.KIS_APP_KEY,
+            "secretkey": settings.KIS_APP_SECRET,
+        }
+        
+        logger.info("KIS 실시간 접속키 발급 요청")
+        response = requests.post(url, headers=headers, json=data, timeout=10)
+        response.raise_for_status()
+        
+        result = response.json()
+        if "approval_key" not in result:
+            raise ValueError(f"실시간 접속키 발급 실패: {result.get('error_description') or result}")
+        
+        self._approval_key = result["approval_key"]
+        return self._approval_key
+
     def get_auth_headers(self, tr_id: Optional[str] = None) -> Dict[str, str]:
         """인증 헤더 생성"""
         try:
@@ -201,3 +283,16 @@ class KISAuthManager:
             raise
 
     # cleanup_cache 메서드는 사용처가 없어 제거했습니다.
+
+
+_auth_manager: Optional[KISAuthManager] = None
+_auth_manager_pid: Optional[int] = None
+
+
+def get_auth_manager() -> KISAuthManager:
+    """프로세스 공용 인증 매니저 - 메모리 토큰과 갱신 스레드를 실행 간에 재사용"""
+    global _auth_manager, _auth_manager_pid
+    if _auth_manager is None or _auth_manager_pid != os.getpid():
+        _auth_manager = KISAuthManager()
+        _auth_manager_pid = os.getpid()
+    return _auth_manager
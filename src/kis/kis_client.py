@@ -1,13 +1,120 @@
+import os
+import threading
+import time
 import requests
-from typing import Dict, Any
+from datetime import datetime
+from typing import Callable, Dict, Any, Optional, Tuple
 
 from src.config.settings import settings
 from src.utils.logging import get_logger
 from src.utils.retry import retry_with_delay
+from src.utils.rate_limiter import get_kis_rate_limiter
+from src.utils.circuit_breaker import get_circuit_breaker
+from src.utils import json_utils
 from src.kis.kis_auth import KISAuthManager
+from src.kis.response_store import TR_DAILY, TR_MINUTE, get_response_store, has_final_bar, response_trading_date
 
 logger = get_logger(__name__)
 
+# 프로세스별 HTTP 커넥션 풀 (fork된 워커는 부모 세션을 공유하지 않음)
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+
+
+def get_http_session() -> requests.Session:
+    """현재 프로세스 전용 requests 세션 반환"""
+    global _session, _session_pid
+    if _session is None or _session_pid != os.getpid():
+        _session = requests.Session()
+        _session_pid = os.getpid()
+    return _session
+
+
+class _InFlightCall:
+    """진행 중인 호출 1건 - 같은 요청을 기다리는 호출자들이 결과/예외를 공유"""
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """프로세스 내 동일 요청(tr_id + params) 병합 - 동시 요청은 HTTP 호출 1건을 공유, 결과는 짧은 TTL 동안 재사용
+
+    공유된 응답 dict는 여러 호출자가 함께 읽으므로 수정하지 않는다.
+    """
+
+    # 만료 항목 정리 기준 (분봉/일봉 요청 종류가 적어 크게 늘지 않음)
+    MAX_CACHE_ENTRIES = 256
+
+    def __init__(self, ttl_sec: float):
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple, _InFlightCall] = {}
+        self._cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+        self.hits = 0        # TTL 캐시 적중
+        self.coalesced = 0   # 진행 중인 호출에 합류
+        self.misses = 0      # 실제 HTTP 호출
+
+    def call(self, key: Tuple, func: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self.hits += 1
+                return cached[1]
+
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _InFlightCall()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                # 실패한 응답은 캐시하지 않음
+                if call.error is None and self.ttl_sec > 0:
+                    now = time.monotonic()
+                    if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+                        self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+                    self._cache[key] = (now + self.ttl_sec, call.result)
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """hit/miss 카운터"""
+        with self._lock:
+            return {"hits": self.hits, "coalesced": self.coalesced, "misses": self.misses}
+
+
+# 추출기는 실행마다 새 클라이언트를 만들므로 병합기는 프로세스 단위로 공유
+_coalescer: Optional[RequestCoalescer] = None
+_coalescer_lock = threading.Lock()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """현재 프로세스의 요청 병합기 (스케줄러 잡/수동 실행이 함께 사용)"""
+    global _coalescer
+    with _coalescer_lock:
+        if _coalescer is None:
+            _coalescer = RequestCoalescer(settings.KIS_RESPONSE_CACHE_SEC)
+        return _coalescer
+
 
 class KISAPIClient:
     """KIS 시세 관련 REST 호출 래퍼"""
@@ -15,52 +122,97 @@ class KISAPIClient:
     def __init__(self, auth_manager: KISAuthManager):
         self.auth_manager = auth_manager
         self.base_url = settings.KIS_BASE_URL
+        self.rate_limiter = get_kis_rate_limiter()
+        self.breaker = get_circuit_breaker("kis")
+        self.coalescer = get_request_coalescer() if settings.KIS_SINGLE_FLIGHT else None
+        self.response_store = get_response_store()
+
+    def _request(self, endpoint: str, tr_id: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """확정된 응답은 디스크 저장소에서, 나머지는 동일 요청 병합 후 실행 - 인증 헤더(토큰)는 키에서 제외
+
+        저장소 적중 시에는 토큰도 발급받지 않으므로 지난 데이터 재처리는 네트워크 없이 실행된다.
+        """
+        store_key = None
+        if self.response_store is not None:
+            now = datetime.now()
+            trading_date = response_trading_date(tr_id, params, now)
+            if trading_date is not None:
+                store_key = self.response_store.make_key(tr_id, params, trading_date, now)
+                result = self.response_store.get(store_key)
+                if result is not None:
+                    return result
+
+        headers = self.auth_manager.get_auth_headers(tr_id=tr_id)
+        if self.coalescer is None:
+            result = self._make_request(endpoint, headers, params)
+        else:
+            key = (tr_id, tuple(sorted(params.items())))
+            result = self.coalescer.call(key, lambda: self._make_request(endpoint, headers, params))
+
+        if store_key is not None and has_final_bar(tr_id, params, result, now):
+            self.response_store.put(store_key, result)
+        return result
 
     @retry_with_delay((requests.RequestException,))
     def _make_request(self, endpoint: str, headers: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
         """API 요청 실행 - 토큰 오류 시 재발급"""
         url = f"{self.base_url}{endpoint}"
         
+        # 재시도마다 확인 - 차단 중이면 CircuitOpenError(재시도 대상 아님)로 즉시 실패
+        if self.breaker is not None:
+            self.breaker.before_call()
+        
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            # 모든 워커가 공유하는 호출 예산 차감
+            self.rate_limiter.acquire()
+            response = get_http_session().get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             
-            result = response.json()
-            rt_cd = result.get("rt_cd", "")
-            
-            # 토큰 관련 오류 체크
-            if rt_cd in ["EGW00123", "EGW00124"]:  # 토큰 만료/무효
-                logger.warning("토큰 오류 감지, 토큰 무효화 후 재시도")
-                self.auth_manager.invalidate_token()
-                raise requests.RequestException("Token expired, retrying...")
-            
-            # rt_cd가 "0"이거나 빈 문자열이면 성공
-            if rt_cd != "0" and rt_cd != "":
-                error_msg = result.get('msg1') or result.get('msg_cd') or '알 수 없는 API 오류'
-                raise ValueError(f"API 오류 [{rt_cd}]: {error_msg}")
-                
-            return result
-            
         except requests.RequestException as e:
+            # 연결 실패/타임아웃/HTTP 오류만 장애로 집계 (API 오류 응답은 서버가 정상 응답한 것)
+            if self.breaker is not None:
+                self.breaker.record_failure()
             logger.warning(f"API 요청 실패: {e}")
             raise
+        
+        if self.breaker is not None:
+            self.breaker.record_success()
+        
+        # 고속 JSON 라이브러리가 있으면 원본 바이트를 바로 파싱
+        if settings.KIS_FAST_DECODE and json_utils.FAST_JSON_BACKEND:
+            result = json_utils.loads(response.content)
+        else:
+            result = response.json()
+        rt_cd = result.get("rt_cd", "")
+        
+        # 토큰 관련 오류 체크
+        if rt_cd in ["EGW00123", "EGW00124"]:  # 토큰 만료/무효
+            logger.warning("토큰 오류 감지, 토큰 무효화 후 재시도")
+            self.auth_manager.invalidate_token()
+            raise requests.RequestException("Token expired, retrying...")
+        
+        # rt_cd가 "0"이거나 빈 문자열이면 성공
+        if rt_cd != "0" and rt_cd != "":
+            error_msg = result.get('msg1') or result.get('msg_cd') or '알 수 없는 API 오류'
+            raise ValueError(f"API 오류 [{rt_cd}]: {error_msg}")
+            
+        return result
 
-    def call_minute_api(self, stock_code: str) -> Dict[str, Any]:
+    def call_minute_api(self, stock_code: str, hour: str = "") -> Dict[str, Any]:
+        """당일 분봉 조회 - hour(HHMMSS) 이전 30건, 비우면 최신 30건"""
         endpoint = "/uapi/domestic-stock/v1/quotations/inquire-time-itemchartprice"
-        headers = self.auth_manager.get_auth_headers(tr_id="FHKST03010200")
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": stock_code,
-            "FID_INPUT_HOUR_1": "",
+            "FID_INPUT_HOUR_1": hour,
             "FID_PW_DATA_INCU_YN": "Y",
             "FID_ETC_CLS_CODE": "",
         }
-        logger.info(f"분봉 API 호출: {stock_code}")
-        return self._make_request(endpoint, headers, params)
+        logger.debug("분봉 API 호출: %s", stock_code)
+        return self._request(endpoint, TR_MINUTE, params)
 
     def call_daily_api(self, stock_code: str, start_date: str = "", end_date: str = "") -> Dict[str, Any]:
         endpoint = "/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
-        headers = self.auth_manager.get_auth_headers(tr_id="FHKST03010100")
         params = {
             "fid_cond_mrkt_div_code": "J",
             "fid_input_iscd": stock_code,
@@ -69,5 +221,5 @@ class KISAPIClient:
             "fid_period_div_code": "D",
             "fid_org_adj_prc": "0",
         }
-        logger.info(f"일봉 API 호출: {stock_code}")
-        return self._make_request(endpoint, headers, params)
+        logger.debug("일봉 API 호출: %s", stock_code)
+        return self._request(endpoint, TR_DAILY, params)
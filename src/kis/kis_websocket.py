@@ -0,0 +1,166 @@
+import asyncio
+import json
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import AsyncIterator, List, NamedTuple
+
+import websockets
+from websockets.exceptions import WebSocketException
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 국내주식 실시간 체결가
+TRADE_TR_ID = "H0STCNT0"
+TRADE_FIELD_COUNT = 46
+
+# H0STCNT0 필드 위치
+FIELD_STOCK_CODE = 0   # MKSC_SHRN_ISCD
+FIELD_TIME = 1         # STCK_CNTG_HOUR (HHMMSS)
+FIELD_PRICE = 2        # STCK_PRPR
+FIELD_VOLUME = 12      # CNTG_VOL
+FIELD_DATE = 33        # BSOP_DATE (YYYYMMDD)
+
+# 재접속 대기 시작값 (끊길 때마다 2배, 최대 KIS_WS_RECONNECT_MAX_SEC)
+RECONNECT_INITIAL_SEC = 1.0
+
+
+class TradeTick(NamedTuple):
+    """실시간 체결 틱"""
+    stock_code: str
+    date: str   # YYYYMMDD
+    time: str   # HHMMSS
+    price: Decimal
+    volume: int
+
+
+def parse_trade_message(message: str) -> List[TradeTick]:
+    """실시간 체결 메시지 파싱 - "0|H0STCNT0|건수|필드^필드^..." 형식"""
+    parts = message.split("|", 3)
+    if len(parts) < 4 or parts[0] != "0" or parts[1] != TRADE_TR_ID:
+        return []
+
+    fields = parts[3].split("^")
+    today = datetime.now().strftime("%Y%m%d")
+    ticks = []
+
+    for i in range(int(parts[2])):
+        record = fields[i * TRADE_FIELD_COUNT:(i + 1) * TRADE_FIELD_COUNT]
+        if len(record) <= FIELD_VOLUME:
+            break
+
+        ticks.append(TradeTick(
+            stock_code=record[FIELD_STOCK_CODE],
+            date=record[FIELD_DATE] if len(record) > FIELD_DATE and record[FIELD_DATE] else today,
+            time=record[FIELD_TIME],
+            price=Decimal(record[FIELD_PRICE]),
+            volume=int(record[FIELD_VOLUME]),
+        ))
+
+    return ticks
+
+
+class KISWebSocketClient:
+    """KIS 실시간 시세 WebSocket 클라이언트"""
+
+    def __init__(self, approval_key: str, url: str = None, record_path: Path = None, reconnect: bool = True):
+        self.approval_key = approval_key
+        self.url = url or settings.KIS_WS_URL
+        # 수신 메시지 원문 녹화 (재생 서버 입력용)
+        self.record_path = record_path
+        # 재생 서버는 녹화를 다 보내면 연결을 닫으므로 재접속하지 않는다
+        self.reconnect = reconnect
+
+    def _subscribe_message(self, stock_code: str) -> str:
+        """체결가 구독 요청"""
+        return json.dumps({
+            "header": {
+                "approval_key": self.approval_key,
+                "custtype": "P",
+                "tr_type": "1",
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": TRADE_TR_ID, "tr_key": stock_code}},
+        })
+
+    async def stream_ticks(self, stock_codes: List[str]) -> AsyncIterator[TradeTick]:
+        """종목 구독 후 체결 틱을 순서대로 반환 - 연결이 끊기면 지수 백오프로 재접속해 다시 구독"""
+        record_file = open(self.record_path, 'a') if self.record_path else None
+        delay = RECONNECT_INITIAL_SEC
+
+        try:
+            while True:
+                try:
+                    async with websockets.connect(self.url, ping_interval=None) as connection:
+                        for stock_code in stock_codes:
+                            await connection.send(self._subscribe_message(stock_code))
+                        logger.info("실시간 체결 구독: %s종목", len(stock_codes))
+
+                        async for message in connection:
+                            # 메시지를 받았으면 정상 연결로 보고 백오프 초기화
+                            delay = RECONNECT_INITIAL_SEC
+                            if isinstance(message, bytes):
+                                message = message.decode()
+
+                            if record_file:
+                                record_file.write(message + "\n")
+
+                            for tick in await self._handle_message(connection, message):
+                                yield tick
+                    reason = "서버가 연결 종료"
+                except (WebSocketException, OSError, asyncio.TimeoutError) as e:
+                    reason = f"{type(e).__name__}: {e}"
+
+                if not self.reconnect:
+                    logger.info("실시간 연결 종료 (%s)", reason)
+                    return
+
+                logger.warning("실시간 연결 끊김 (%s) - %.0f초 후 재접속", reason, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, settings.KIS_WS_RECONNECT_MAX_SEC)
+        finally:
+            if record_file:
+                record_file.close()
+
+    async def _handle_message(self, connection, message: str) -> List[TradeTick]:
+        """수신 메시지 1건 처리 - 깨진 메시지는 경고만 남기고 건너뜀"""
+        try:
+            # 실시간 데이터 ("0|..." 평문, "1|..." 암호화)
+            if message[:1] in ("0", "1"):
+                return parse_trade_message(message)
+
+            # 제어 메시지 (구독 응답, PINGPONG)
+            control = json.loads(message)
+        except (ValueError, ArithmeticError) as e:
+            logger.warning("실시간 메시지 처리 실패 (%r): %s", message[:50], e)
+            return []
+
+        if not isinstance(control, dict):
+            return []
+        if control.get("header", {}).get("tr_id") == "PINGPONG":
+            await connection.send(message)
+        elif control.get("body", {}).get("rt_cd") not in (None, "0"):
+            logger.warning("실시간 구독 오류: %s", control.get('body', {}).get('msg1'))
+        return []
+
+
+async def run_replay_server(record_path: Path, host: str = "127.0.0.1", port: int = 21000, interval: float = 0.0):
+    """녹화된 실시간 메시지를 재생하는 로컬 WebSocket 서버 (KIS 대체용)"""
+    with open(record_path, 'r') as f:
+        messages = [line.rstrip("\n") for line in f if line.startswith(("0|", "1|"))]
+
+    async def handler(connection):
+        # 첫 구독 요청을 받은 뒤 녹화 순서대로 재생하고 종료
+        await connection.recv()
+        for message in messages:
+            await connection.send(message)
+            if interval > 0:
+                await asyncio.sleep(interval)
+        await connection.close()
+
+    logger.info("재생 서버 시작: ws://%s:%s (%s건)", host, port, len(messages))
+    async with websockets.serve(handler, host, port):
+        await asyncio.Future()
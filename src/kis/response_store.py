@@ -0,0 +1,201 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+from src.utils.trading_calendar import get_trading_calendar
+
+logger = get_logger(__name__)
+
+# 시세 API tr_id
+TR_MINUTE = "FHKST03010200"  # 당일 분봉
+TR_DAILY = "FHKST03010100"   # 기간별 일봉
+
+# 일봉 fid_org_adj_prc 값 (0: 수정주가, 1: 원주가)
+UNADJUSTED_PRICE = "1"
+
+
+def response_trading_date(tr_id: str, params: Dict[str, Any], now: datetime) -> Optional[date]:
+    """응답이 더는 바뀌지 않는 요청이면 그 거래일, 아니면 None (진행 중인 데이터는 저장하지 않음)
+
+    - 일봉: 종료일이 오늘 이전이면 확정 (수정주가는 받은 날에만 재사용 - is_adjusted_daily 참고)
+    - 분봉(당일만 제공): 장 마감 후에는 전부, 장중에는 hour를 지정한 완료된 구간만 확정
+    """
+    today = now.date()
+
+    if tr_id == TR_DAILY:
+        end_date = params.get("fid_input_date_2", "")
+        if len(end_date) != 8:
+            return None
+        trading_date = date(int(end_date[:4]), int(end_date[4:6]), int(end_date[6:]))
+        return trading_date if trading_date < today else None
+
+    if tr_id == TR_MINUTE:
+        session = get_trading_calendar().get_session(today)
+        if session is None:
+            return None
+        # 마감 분봉까지 반영되도록 1분 여유 (실제로 들어 있는지는 저장 전에 has_final_bar로 확인)
+        if now >= datetime.combine(today, session.close_time) + timedelta(minutes=1):
+            return today
+        hour = params.get("FID_INPUT_HOUR_1", "")
+        if hour and hour[:4] < (now - timedelta(minutes=1)).strftime("%H%M"):
+            return today
+        return None
+
+    return None
+
+
+def has_final_bar(tr_id: str, params: Dict[str, Any], result: Dict[str, Any], now: datetime) -> bool:
+    """확정 응답에 마지막 분봉이 실제로 들어 있는지 - 마감 직후 KIS가 아직 반영하지 못한 응답은 저장하지 않음
+
+    분봉은 요청 hour(장 마감 후 전체 요청이면 마감 분봉)의 행이 있어야 하고, 일봉은 항상 True.
+    """
+    if tr_id != TR_MINUTE:
+        return True
+
+    session = get_trading_calendar().get_session(now.date())
+    if session is None:
+        return False
+    close_hour = session.close_time.strftime("%H%M%S")
+    hour = params.get("FID_INPUT_HOUR_1", "")
+    expected_hour = hour[:4] + "00" if hour and hour[:4] + "00" < close_hour else close_hour
+    today = now.strftime("%Y%m%d")
+    return any(row.get("stck_bsop_date") == today and row.get("stck_cntg_hour") == expected_hour
+               for row in result.get("output2") or [])
+
+
+def is_adjusted_daily(tr_id: str, params: Dict[str, Any]) -> bool:
+    """수정주가 일봉 요청 여부 - 액면분할/배당 등 권리 변동이 생기면 지난 가격도 다시 계산된다"""
+    return tr_id == TR_DAILY and params.get("fid_org_adj_prc") != UNADJUSTED_PRICE
+
+
+class ResponseStore:
+    """확정된 KIS 응답의 압축 디스크 저장소 - tr_id + params + 거래일 해시를 파일 이름으로 사용
+
+    읽을 때 파일 mtime을 갱신하고, 전체 크기가 KIS_RESPONSE_STORE_MAX_MB를 넘으면 오래 안 쓴 파일부터 지운다.
+    """
+
+    def __init__(self, root: Path = Path("data/kis_responses"), max_bytes: int = None):
+        self.root = root
+        self.max_bytes = max_bytes if max_bytes is not None else settings.KIS_RESPONSE_STORE_MAX_MB * 1024 * 1024
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # 첫 저장 때 한 번 계산
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(tr_id: str, params: Dict[str, Any], trading_date: date, now: datetime) -> str:
+        """요청 내용 해시 (파라미터 순서와 무관)
+
+        수정주가 일봉은 받은 날짜도 키에 넣어 당일에만 재사용한다 - 권리 변동은 다음 거래일부터 반영되므로
+        다음 날에는 새로 조회하고, 지난 파일은 용량 정리 때 지워진다.
+        """
+        scope = [tr_id, trading_date.isoformat()]
+        if is_adjusted_daily(tr_id, params):
+            scope.append(now.date().isoformat())
+        canonical = json.dumps([*scope, sorted(params.items())], separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json.gz"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """저장된 응답 (없으면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = json.loads(gzip.decompress(f.read()))
+            os.utime(path)  # 최근 사용 표시 (용량 정리 기준)
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("저장된 응답 읽기 실패 (%s): %s", path.name, e)
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return result
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """응답 저장 (임시 파일에 쓴 뒤 이름 변경) 후 용량 초과 시 정리"""
+        path = self._path(key)
+        data = gzip.compress(json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode(), compresslevel=6)
+        try:
+            # 같은 키를 다시 쓰면 기존 파일 크기만큼 빼고 더한다
+            try:
+                old_size = path.stat().st_size
+            except FileNotFoundError:
+                old_size = 0
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".tmp{os.getpid()}")
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            temp_path.replace(path)
+        except OSError as e:
+            logger.warning("응답 저장 실패: %s", e)
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(file.stat().st_size for file in self.root.glob("*/*.json.gz"))
+            else:
+                self._total_bytes += len(data) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """오래 안 쓴 파일부터 최대 크기의 90%까지 삭제 (다른 워커가 먼저 지운 파일은 건너뜀)"""
+        files = []
+        for file in self.root.glob("*/*.json.gz"):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * 0.9
+        removed = 0
+        for _, size, file in files:
+            if total <= target:
+                break
+            file.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        self._total_bytes = total
+        logger.debug("저장된 응답 %s개 정리 (%.1fMB 남음)", removed, total / 1024 / 1024)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+_store: Optional[ResponseStore] = None
+_store_lock = threading.Lock()
+
+
+def get_response_store() -> Optional[ResponseStore]:
+    """프로세스 공용 응답 저장소 (KIS_RESPONSE_STORE=false면 None)"""
+    global _store
+    if not settings.KIS_RESPONSE_STORE:
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = ResponseStore()
+        return _store
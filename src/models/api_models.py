@@ -1,9 +1,14 @@
 from decimal import Decimal
-from typing import List
+from typing import Any, Dict, List
 from pydantic import BaseModel, Field
 from src.models.domain_models import MinuteData, DailyData
 from src.config.settings import settings
-from src.utils.date_utils import format_kis_date_to_iso, format_kis_datetime_to_iso
+from src.utils import json_utils
+from src.utils.logging import get_logger
+from src.utils.date_utils import format_kis_date_to_iso, get_current_timestamp
+from src.utils.session_index import to_minute_key
+
+logger = get_logger(__name__)
 
 
 class KISMinuteItem(BaseModel):
@@ -16,13 +21,13 @@ class KISMinuteItem(BaseModel):
     stck_prpr: str       # 종가
     cntg_vol: str        # 거래량
 
-    def to_minute_data(self, stock_code: str = settings.STOCK_CODE) -> MinuteData:
+    def to_minute_data(self, stock_code: str = None) -> MinuteData:
         """MinuteData로 변환"""
-        timestamp = format_kis_datetime_to_iso(self.stck_bsop_date, self.stck_cntg_hour)
+        stock_code = stock_code or settings.STOCK_CODE
         
-        return MinuteData(
+        return MinuteData.at_minute(
+            to_minute_key(self.stck_bsop_date, self.stck_cntg_hour),
             stock_code=stock_code,
-            timestamp=timestamp,
             open_price=Decimal(self.stck_oprc),
             high_price=Decimal(self.stck_hgpr),
             low_price=Decimal(self.stck_lwpr),
@@ -40,8 +45,9 @@ class KISDailyItem(BaseModel):
     stck_clpr: str       # 종가
     acml_vol: str        # 거래량
 
-    def to_daily_data(self, stock_code: str = settings.STOCK_CODE) -> DailyData:
+    def to_daily_data(self, stock_code: str = None) -> DailyData:
         """DailyData로 변환"""
+        stock_code = stock_code or settings.STOCK_CODE
         date = format_kis_date_to_iso(self.stck_bsop_date)
         
         return DailyData(
@@ -62,9 +68,16 @@ class KISMinuteResponse(BaseModel):
     msg1: str
     output2: List[KISMinuteItem] = Field(default_factory=list)
 
-    def to_minute_data_list(self, stock_code: str = settings.STOCK_CODE) -> List[MinuteData]:
+    def to_minute_data_list(self, stock_code: str = None) -> List[MinuteData]:
         """분봉 데이터 리스트로 변환"""
-        return [item.to_minute_data(stock_code) for item in self.output2]
+        minute_data_list = []
+        for item in self.output2:
+            try:
+                minute_data_list.append(item.to_minute_data(stock_code))
+            except (ValueError, ArithmeticError) as e:
+                # 값이 비었거나 깨진 행만 제외 (응답 전체는 유지)
+                logger.warning("분봉 행 변환 실패 (%s %s): %s", item.stck_bsop_date, item.stck_cntg_hour, e)
+        return minute_data_list
 
 
 class KISDailyResponse(BaseModel):
@@ -73,6 +86,43 @@ class KISDailyResponse(BaseModel):
     msg1: str
     output2: List[KISDailyItem] = Field(default_factory=list)
 
-    def to_daily_data_list(self, stock_code: str = settings.STOCK_CODE) -> List[DailyData]:
+    def to_daily_data_list(self, stock_code: str = None) -> List[DailyData]:
         """일봉 데이터 리스트로 변환"""
         return [item.to_daily_data(stock_code) for item in self.output2]
+
+
+def use_fast_decode() -> bool:
+    """고속 디코딩 사용 여부 (설정 + 고속 JSON 라이브러리 설치)"""
+    return settings.KIS_FAST_DECODE and json_utils.FAST_JSON_BACKEND is not None
+
+
+def decode_minute_rows(raw_data: Dict[str, Any], stock_code: str = None) -> List[MinuteData]:
+    """분봉 응답 고속 변환 - 행 모델 검증 없이 output2의 필요한 필드만 읽어 MinuteData 생성"""
+    stock_code = stock_code or settings.STOCK_CODE
+    created_at = get_current_timestamp()
+    from_trusted_values = MinuteData.from_trusted_values
+    minute_data_list = []
+    
+    for row in raw_data.get("output2") or []:
+        date_str = row.get("stck_bsop_date")
+        time_str = row.get("stck_cntg_hour")
+        # 데이터 없는 빈 행 제외
+        if not date_str or not time_str:
+            continue
+        
+        try:
+            minute_data_list.append(from_trusted_values(
+                to_minute_key(date_str, time_str),
+                stock_code=stock_code,
+                open_price=Decimal(row["stck_oprc"]),
+                high_price=Decimal(row["stck_hgpr"]),
+                low_price=Decimal(row["stck_lwpr"]),
+                close_price=Decimal(row["stck_prpr"]),
+                volume=int(row["cntg_vol"]),
+                created_at=created_at
+            ))
+        except (KeyError, TypeError, ValueError, ArithmeticError) as e:
+            # 모델 경로와 같이 해당 행만 제외
+            logger.warning("분봉 행 변환 실패 (%s %s): %r", date_str, time_str, e)
+    
+    return minute_data_list
@@ -1,7 +1,9 @@
 from decimal import Decimal
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from src.utils.date_utils import get_current_timestamp
+from src.utils.session_index import minute_key_to_timestamp, timestamp_to_minute_key
+from src.utils.partition_utils import minute_partition_key
 
 
 class StockData(BaseModel):
@@ -24,10 +26,50 @@ class MinuteData(StockData):
     timestamp: str  # YYYY-MM-DD HH:MM:SS
     sma_5: Optional[Decimal] = None  # Transform에서 계산 후 설정
     sma_30: Optional[Decimal] = None  # Transform에서 계산 후 설정
+    _minute_key: Optional[int] = PrivateAttr(default=None)
+
+    @classmethod
+    def at_minute(cls, minute_key: int, **values) -> "MinuteData":
+        """정수 분 키로 생성 (검증 경로) - timestamp는 키에서 만든다"""
+        data = cls(timestamp=minute_key_to_timestamp(minute_key), **values)
+        data._minute_key = minute_key
+        return data
+
+    @classmethod
+    def from_trusted_values(cls, minute_key: int, **values) -> "MinuteData":
+        """검증 생략 생성 - 타입이 이미 맞춰진 값 전용 (KIS 응답 고속 디코딩 경로), timestamp는 키에서 만든다"""
+        data = cls.model_construct(timestamp=minute_key_to_timestamp(minute_key), **values)
+        data._minute_key = minute_key
+        return data
+
+    @property
+    def minute_key(self) -> int:
+        """정수 분 키 - 정렬/중복 제거/갭 검출은 문자열 대신 이 값을 사용
+
+        KIS/틱에서 만든 분봉은 생성 시 설정되고, 저장소에서 읽은 분봉만 SK 문자열에서 한 번 변환한다.
+        """
+        if self._minute_key is None:
+            self._minute_key = timestamp_to_minute_key(self.timestamp)
+        return self._minute_key
 
     def get_pk(self) -> str:
-        """DynamoDB 파티션 키"""
-        return f"{self.get_base_pk()}#MINUTE"
+        """DynamoDB 파티션 키 - DYNAMODB_MINUTE_BUCKET이면 월/일 버킷 포함"""
+        return minute_partition_key(self.stock_code, self.timestamp)
+    
+    def get_sk(self) -> str:
+        """DynamoDB 정렬 키"""
+        return self.timestamp
+
+
+class RollupData(StockData):
+    """상위 주기 봉 (5분/15분/60분) - 분봉에서 증분 집계"""
+    interval: int  # 분 단위 주기
+    timestamp: str  # 구간 시작 YYYY-MM-DD HH:MM:SS
+    bar_count: int  # 구간에 포함된 분봉 수
+
+    def get_pk(self) -> str:
+        """DynamoDB 파티션 키 - 주기별 파티션 (STOCK#005930#M5)"""
+        return f"{self.get_base_pk()}#M{self.interval}"
     
     def get_sk(self) -> str:
         """DynamoDB 정렬 키"""
@@ -0,0 +1,450 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union
+import boto3
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
+import time
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+from src.utils.data_utils import (
+    LAYOUT_COMPACT, LAYOUT_PACKED, iter_dynamodb_items, iter_valid_bars, pack_minute_bars, packed_bucket_key, minute_data_from_items,
+    rollup_data_from_item, round_indicator,
+)
+from src.utils.partition_utils import minute_partition_key, minute_partition_keys, recent_partition_keys
+from src.utils.retry import retry_with_delay
+from src.utils.circuit_breaker import STATE_CLOSED, STATE_OPEN, CircuitOpenError, get_circuit_breaker
+from src.models.domain_models import MinuteData, DailyData, RollupData
+from src.pipelines.storage import StorageBackend
+from src.pipelines.spool import LocalSpool
+
+logger = get_logger(__name__)
+
+
+class DynamoDBLoader(StorageBackend):
+    """DynamoDB 데이터 저장"""
+    
+    # AWS DynamoDB 제약사항
+    BATCH_SIZE = 25
+    MAX_UNPROCESSED_RETRIES = 5
+    # UpdateExpression 길이 제한(4KB) 안에서 한 번에 갱신할 packed 분봉 수
+    PACKED_UPDATE_SIZE = 100
+    # 버킷 파티션에서 최근 데이터를 찾을 때 거슬러 올라갈 최대 버킷 수
+    RECENT_LOOKBACK_BUCKETS = 36
+    
+    def __init__(self, table_name: str = None):
+        self.table_name = table_name or settings.DYNAMODB_TABLE_NAME
+        self.dynamodb = boto3.resource('dynamodb', region_name=settings.AWS_REGION)
+        self.table = self.dynamodb.Table(self.table_name)
+        # resource의 meta.client는 TypeSerializer 변환이 걸려 있으므로 별도 low-level client 사용
+        self.client = boto3.client('dynamodb', region_name=settings.AWS_REGION)
+        self.low_level_write = settings.DYNAMODB_LOW_LEVEL_WRITE
+        self.item_layout = settings.DYNAMODB_ITEM_LAYOUT
+        self._deserializer = TypeDeserializer()
+        self.breaker = get_circuit_breaker("dynamodb")
+        self.spool = LocalSpool()
+        logger.debug("DynamoDBLoader 초기화 - 테이블: %s", self.table_name)
+    
+    def save_data(self, data: List[Union[MinuteData, DailyData]], deduped: bool = False) -> bool:
+        """데이터 저장 - deduped=True면 호출자가 이미 중복 제거한 입력으로 보고 중복 검사 생략"""
+        if not data:
+            logger.warning("저장할 데이터가 없습니다")
+            return True
+        
+        self._drain_spool()
+        try:
+            return self._write_data(data, deduped)
+        except CircuitOpenError:
+            # 차단 중에는 로컬 스풀에 쌓고 복구 후 저장 (수집은 계속 진행)
+            valid_data = list(iter_valid_bars(data, deduped=deduped))
+            if not valid_data:
+                logger.error("유효한 데이터가 없습니다")
+                return False
+            self.spool.append(valid_data)
+            return True
+    
+    def _write_data(self, data: List[Union[MinuteData, DailyData]], deduped: bool) -> bool:
+        # packed 레이아웃: 분봉을 시간/세션 아이템에 묶어 갱신
+        if self.item_layout == LAYOUT_PACKED and isinstance(data[0], MinuteData):
+            buckets = pack_minute_bars(iter_valid_bars(data, deduped=deduped), settings.DYNAMODB_PACK_BY)
+            if not buckets:
+                logger.error("유효한 데이터가 없습니다")
+                return False
+            return self._packed_save(data[0].stock_code, buckets)
+        
+        # 중복 제거 + 검증 + 아이템 변환 (단일 순회)
+        items = list(iter_dynamodb_items(data, deduped=deduped, typed=self.low_level_write,
+                                         compact=self.item_layout == LAYOUT_COMPACT))
+        
+        if not items:
+            logger.error("유효한 데이터가 없습니다")
+            return False
+        
+        logger.debug("데이터 정제 완료: %s -> %s건", len(data), len(items))
+        
+        # 배치 저장
+        return self._batch_save(items)
+    
+    def _drain_spool(self) -> None:
+        """차단기가 닫혀 있으면 스풀에 쌓인 데이터를 먼저 저장"""
+        if self.breaker is None or self.breaker.state != STATE_CLOSED or not self.spool.pending():
+            return
+        self.spool.drain(lambda data: self._write_rollups(data) if isinstance(data[0], RollupData)
+                         else self._write_data(data, deduped=True))
+    
+    def _before_write(self) -> None:
+        """재시도마다 차단기 확인 - 열려 있으면 CircuitOpenError(재시도 대상 아님)"""
+        if self.breaker is not None:
+            self.breaker.before_call()
+    
+    def _record_write(self, success: bool) -> None:
+        if self.breaker is not None:
+            if success:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+    
+    @retry_with_delay(exceptions=(ClientError,))
+    def _batch_save(self, items: List[Dict[str, Any]]) -> bool:
+        """배치 저장 - AWS 제약사항 처리"""
+        self._before_write()
+        try:
+            total_items = len(items)
+            
+            # 25개씩 배치 처리
+            for i in range(0, total_items, self.BATCH_SIZE):
+                batch = items[i:i + self.BATCH_SIZE]
+                batch_num = (i // self.BATCH_SIZE) + 1
+                total_batches = (total_items + self.BATCH_SIZE - 1) // self.BATCH_SIZE
+                
+                logger.debug("배치 %s/%s 저장 중 (%s건)", batch_num, total_batches, len(batch))
+                
+                # DynamoDB 배치 저장
+                if self.low_level_write:
+                    self._batch_write_typed(batch)
+                else:
+                    with self.table.batch_writer() as batch_writer:
+                        for item in batch:
+                            batch_writer.put_item(Item=item)
+                
+                # 요청 제한 방지
+                if i + self.BATCH_SIZE < total_items:
+                    time.sleep(0.1)
+            
+            logger.debug("전체 배치 저장 완료: %s건", total_items)
+            self._record_write(True)
+            return True
+            
+        except ClientError as e:
+            self._record_write(False)
+            logger.error("DynamoDB 저장 실패: %s", e)
+            raise
+        except Exception as e:
+            self._record_write(False)
+            logger.error("예상치 못한 오류: %s", e)
+            return False
+    
+    def _batch_write_typed(self, batch: List[Dict[str, Any]]):
+        """타입 지정 속성 맵을 client.batch_write_item으로 저장 - 미처리 아이템은 재전송"""
+        request_items = {self.table_name: [{'PutRequest': {'Item': item}} for item in batch]}
+        
+        for attempt in range(self.MAX_UNPROCESSED_RETRIES + 1):
+            response = self.client.batch_write_item(RequestItems=request_items)
+            request_items = response.get('UnprocessedItems')
+            if not request_items:
+                return
+            time.sleep(0.1 * (2 ** attempt))
+        
+        unprocessed = len(request_items.get(self.table_name, []))
+        raise RuntimeError(f"미처리 아이템 {unprocessed}건 재전송 실패")
+    
+    @retry_with_delay(exceptions=(ClientError,))
+    def _packed_save(self, stock_code: str, buckets: Dict[str, Dict[str, str]]) -> bool:
+        """packed 아이템 갱신 - 분봉마다 "HHMM" 속성만 SET (같은 아이템의 다른 분봉은 유지)"""
+        self._before_write()
+        try:
+            for sk, bars in buckets.items():
+                pk = minute_partition_key(stock_code, sk)
+                names = list(bars)
+                for i in range(0, len(names), self.PACKED_UPDATE_SIZE):
+                    chunk = names[i:i + self.PACKED_UPDATE_SIZE]
+                    self.client.update_item(
+                        TableName=self.table_name,
+                        Key={'PK': {'S': pk}, 'SK': {'S': sk}},
+                        UpdateExpression="SET " + ", ".join(f"#m{j} = :m{j}" for j in range(len(chunk))),
+                        ExpressionAttributeNames={f"#m{j}": name for j, name in enumerate(chunk)},
+                        ExpressionAttributeValues={f":m{j}": {'S': bars[name]} for j, name in enumerate(chunk)},
+                    )
+            
+            logger.debug("packed 아이템 %s건 저장 완료: %s건", len(buckets), sum(len(bars) for bars in buckets.values()))
+            self._record_write(True)
+            return True
+            
+        except ClientError as e:
+            self._record_write(False)
+            logger.error("DynamoDB 저장 실패: %s", e)
+            raise
+        except Exception as e:
+            self._record_write(False)
+            logger.error("예상치 못한 오류: %s", e)
+            return False
+    
+    def get_recent_data(self, stock_code: str, data_type: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """최근 데이터 조회"""
+        try:
+            # 기본 종목코드
+            stock_code = stock_code or settings.STOCK_CODE
+            
+            # PK 생성 규칙
+            if data_type.upper() in ['MINUTE', '분봉']:
+                bars = self._get_recent_minute_data(stock_code, limit)
+                logger.debug("%s 최근 데이터 %s건 조회", data_type, len(bars))
+                # 분봉은 레이아웃과 무관하게 standard 형식으로 반환 - compact/packed 아이템에는 created_at이 없으므로 제외
+                return [
+                    {
+                        "PK": bar.get_pk(),
+                        "SK": bar.get_sk(),
+                        **bar.model_dump(exclude_none=True, exclude=None if 'created_at' in bar.model_fields_set else {'created_at'}),
+                    }
+                    for bar in bars
+                ]
+            elif data_type.upper() in ['DAILY', '일봉']:
+                pk = f"STOCK#{stock_code}#DAILY"
+            else:
+                logger.error("지원하지 않는 데이터 타입: %s", data_type)
+                return []
+            
+            response = self.table.query(
+                KeyConditionExpression=boto3.dynamodb.conditions.Key('PK').eq(pk),
+                ScanIndexForward=False,  # 최신순
+                Limit=limit
+            )
+            
+            items = response.get('Items', [])
+            logger.debug("%s 최근 데이터 %s건 조회", data_type, len(items))
+            return items
+            
+        except ClientError as e:
+            logger.error("데이터 조회 실패: %s", e)
+            return []
+    
+    def _get_recent_minute_data(self, stock_code: str, limit: int) -> List[MinuteData]:
+        """최근 분봉 limit건 (최신순) - 최근 버킷만 먼저 조회하고, 모자랄 때만 이전 버킷들을 병렬로 조회"""
+        pks = recent_partition_keys(stock_code, date.today(), self.RECENT_LOOKBACK_BUCKETS)
+        wave_size = settings.DYNAMODB_QUERY_WORKERS
+        
+        # packed 아이템은 여러 분봉을 담으므로 아이템 Limit만으로도 필요한 건수 이상이 보장됨
+        def build_query(pk: str, count: int) -> Dict[str, Any]:
+            return {
+                'KeyConditionExpression': 'PK = :pk',
+                'ExpressionAttributeValues': {':pk': {'S': pk}},
+                'ScanIndexForward': False,
+                'Limit': count,
+            }
+        
+        # 월/일 버킷이면 대부분 최근 버킷 1개로 충분 (버킷마다 Limit건씩 읽는 RCU 낭비 방지)
+        items = self._client_query(build_query(pks[0], limit), paginate=False)
+        bars = minute_data_from_items(items, stock_code)
+        
+        for i in range(1, len(pks), wave_size):
+            if len(bars) >= limit:
+                break
+            remaining = limit - len(bars)
+            results = self._query_partitions(pks[i:i + wave_size], lambda pk: build_query(pk, remaining), paginate=False)
+            for partition_items in results:
+                items.extend(partition_items)
+            bars = minute_data_from_items(items, stock_code)
+        
+        return bars[::-1][:limit]
+    
+    def _client_query(self, query_kwargs: Dict[str, Any], paginate: bool = True) -> List[Dict[str, Any]]:
+        """low-level client 쿼리 (스레드 안전) - 결과는 resource와 같은 파이썬 값으로 변환"""
+        items = []
+        deserialize = self._deserializer.deserialize
+        query_kwargs = {'TableName': self.table_name, **query_kwargs}
+        while True:
+            response = self.client.query(**query_kwargs)
+            items.extend({name: deserialize(value) for name, value in item.items()} for item in response.get('Items', []))
+            
+            last_key = response.get('LastEvaluatedKey')
+            if not paginate or not last_key:
+                return items
+            query_kwargs = {**query_kwargs, 'ExclusiveStartKey': last_key}
+    
+    def _query_partitions(self, pks: List[str], build_query: Callable[[str], Dict[str, Any]],
+                          paginate: bool = True) -> List[List[Dict[str, Any]]]:
+        """여러 파티션을 병렬로 조회 (파티션 순서대로 결과 반환)"""
+        if len(pks) == 1:
+            return [self._client_query(build_query(pks[0]), paginate)]
+        
+        with ThreadPoolExecutor(max_workers=min(len(pks), settings.DYNAMODB_QUERY_WORKERS)) as executor:
+            return list(executor.map(lambda pk: self._client_query(build_query(pk), paginate), pks))
+    
+    def _query_all(self, query_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """쿼리 전체 페이지 조회 (1MB 단위 페이지네이션)"""
+        items = []
+        while True:
+            response = self.table.query(**query_kwargs)
+            items.extend(response.get('Items', []))
+            
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                return items
+            query_kwargs = {**query_kwargs, 'ExclusiveStartKey': last_key}
+    
+    def get_minute_timestamps(self, stock_code: str, session_date: str) -> List[str]:
+        """해당 일자(YYYY-MM-DD)에 저장된 분봉 SK 목록 - 키만 조회"""
+        # packed 아이템은 분봉 시각이 속성명에 있어 키만으로 알 수 없다
+        if self.item_layout == LAYOUT_PACKED:
+            return [bar.timestamp for bar in self.get_minute_data(stock_code, session_date)]
+        
+        try:
+            items = self._query_all({
+                'KeyConditionExpression': Key('PK').eq(minute_partition_key(stock_code, session_date)) & Key('SK').begins_with(session_date),
+                'ProjectionExpression': 'SK',
+            })
+            logger.debug("%s 저장된 분봉 키 %s건 조회", session_date, len(items))
+            return [item['SK'] for item in items]
+            
+        except ClientError as e:
+            logger.error("분봉 키 조회 실패: %s", e)
+            raise
+    
+    def get_minute_data(self, stock_code: str, session_date: str) -> List[MinuteData]:
+        """해당 일자(YYYY-MM-DD)에 저장된 분봉 전체 조회"""
+        try:
+            items = self._query_all({
+                'KeyConditionExpression': Key('PK').eq(minute_partition_key(stock_code, session_date)) & Key('SK').begins_with(session_date),
+            })
+            logger.debug("%s 저장된 분봉 %s건 조회", session_date, len(items))
+            return minute_data_from_items(items, stock_code)
+            
+        except ClientError as e:
+            logger.error("분봉 조회 실패: %s", e)
+            raise
+    
+    def get_minute_range(self, stock_code: str, start: datetime, end: datetime) -> List[MinuteData]:
+        """기간(양 끝 포함) 분봉 조회 - 기간에 걸친 버킷 파티션을 병렬 조회"""
+        start_ts = start.strftime("%Y-%m-%d %H:%M:%S")
+        end_ts = end.strftime("%Y-%m-%d %H:%M:%S")
+        pks = minute_partition_keys(stock_code, start.date(), end.date())
+        
+        # packed는 시작 분이 든 묶음 SK("YYYY-MM-DD HH" 또는 "YYYY-MM-DD")부터 조회하고, 복원 후 분 단위로 자른다
+        query_start = packed_bucket_key(start_ts, settings.DYNAMODB_PACK_BY) if self.item_layout == LAYOUT_PACKED else start_ts
+        
+        try:
+            results = self._query_partitions(pks, lambda pk: {
+                'KeyConditionExpression': 'PK = :pk AND SK BETWEEN :start AND :end',
+                'ExpressionAttributeValues': {':pk': {'S': pk}, ':start': {'S': query_start}, ':end': {'S': end_ts}},
+            })
+            bars = minute_data_from_items((item for items in results for item in items), stock_code)
+            bars = [bar for bar in bars if start_ts <= bar.timestamp <= end_ts]
+            logger.debug("%s ~ %s 분봉 %s건 조회 (파티션 %s개)", start_ts, end_ts, len(bars), len(pks))
+            return bars
+            
+        except ClientError as e:
+            logger.error("분봉 기간 조회 실패: %s", e)
+            raise
+    
+    def save_rollups(self, data: List[RollupData]) -> bool:
+        """상위 주기 봉 저장 - 구간 1개당 아이템 1개 (분봉 레이아웃과 무관하게 standard 형식)"""
+        if not data:
+            return True
+        
+        self._drain_spool()
+        try:
+            return self._write_rollups(data)
+        except CircuitOpenError:
+            self.spool.append(data)
+            return True
+    
+    def _write_rollups(self, data: List[RollupData]) -> bool:
+        # 집계기가 구간마다 1건만 내보내므로 중복 검사 생략
+        items = list(iter_dynamodb_items(data, deduped=True, typed=self.low_level_write))
+        if not items:
+            logger.error("유효한 데이터가 없습니다")
+            return False
+        return self._batch_save(items)
+    
+    def get_rollups(self, stock_code: str, interval: int, start: datetime, end: datetime) -> List[RollupData]:
+        """기간(양 끝 포함) 상위 주기 봉 조회 - 주기별 파티션 1개 쿼리"""
+        try:
+            items = self._client_query({
+                'KeyConditionExpression': 'PK = :pk AND SK BETWEEN :start AND :end',
+                'ExpressionAttributeValues': {
+                    ':pk': {'S': f"STOCK#{stock_code}#M{interval}"},
+                    ':start': {'S': start.strftime("%Y-%m-%d %H:%M:%S")},
+                    ':end': {'S': end.strftime("%Y-%m-%d %H:%M:%S")},
+                },
+            })
+            logger.debug("%s분봉 %s건 조회", interval, len(items))
+            return [rollup_data_from_item(item) for item in items]
+            
+        except ClientError as e:
+            logger.error("상위 주기 봉 조회 실패: %s", e)
+            raise
+    
+    def normalize_indicator(self, value: Optional[Decimal]) -> Optional[Decimal]:
+        """compact/packed 레이아웃은 지표를 반올림해 저장"""
+        if value is None or self.item_layout not in (LAYOUT_COMPACT, LAYOUT_PACKED):
+            return value
+        return round_indicator(value)
+    
+    def update_indicators(self, data: List[MinuteData]) -> int:
+        """분봉 지표만 갱신 - 아이템 전체를 다시 쓰지 않고 지표 속성만 UpdateItem"""
+        if not data:
+            return 0
+        
+        # packed는 분봉 1건이 속성 1개이므로 해당 분봉 속성만 다시 씀
+        if self.item_layout == LAYOUT_PACKED:
+            if not self._packed_save(data[0].stock_code, pack_minute_bars(data, settings.DYNAMODB_PACK_BY)):
+                raise RuntimeError("packed 분봉 지표 갱신 실패")
+            return len(data)
+        
+        names = ("s5", "s30") if self.item_layout == LAYOUT_COMPACT else ("sma_5", "sma_30")
+        for bar in data:
+            self._update_indicator_item(bar, names)
+        return len(data)
+    
+    @retry_with_delay(exceptions=(ClientError,))
+    def _update_indicator_item(self, bar: MinuteData, names: Tuple[str, str]):
+        """분봉 1건의 지표 속성 SET/REMOVE (값이 없으면 속성 제거)"""
+        set_parts, remove_parts, values = [], [], {}
+        for name, value in zip(names, (bar.sma_5, bar.sma_30)):
+            if value is None:
+                remove_parts.append(name)
+            else:
+                set_parts.append(f"{name} = :{name}")
+                values[f":{name}"] = {'N': str(self.normalize_indicator(value))}
+        
+        expression = " ".join(part for part in (
+            "SET " + ", ".join(set_parts) if set_parts else "",
+            "REMOVE " + ", ".join(remove_parts) if remove_parts else "",
+        ) if part)
+        update_kwargs = {'ExpressionAttributeValues': values} if values else {}
+        
+        self.client.update_item(
+            TableName=self.table_name,
+            Key={'PK': {'S': bar.get_pk()}, 'SK': {'S': bar.get_sk()}},
+            UpdateExpression=expression,
+            **update_kwargs,
+        )
+    
+    def health_check(self) -> bool:
+        """DynamoDB 연결 상태 확인 - 차단 중이면 저장은 스풀로 받으므로 정상으로 본다"""
+        if self.breaker is not None and self.breaker.state == STATE_OPEN:
+            logger.warning("DynamoDB 차단 중 - 저장은 로컬 스풀에 기록")
+            return True
+        try:
+            self.table.meta.client.describe_table(TableName=self.table_name)
+            logger.debug("DynamoDB 테이블 '%s' 연결 정상", self.table_name)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                logger.error("테이블 '%s'을 찾을 수 없습니다", self.table_name)
+            else:
+                logger.error("DynamoDB 연결 오류: %s", e)
+            return False
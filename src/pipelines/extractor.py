@@ -3,9 +3,9 @@ from typing import List
 from src.config.settings import settings
 from src.utils.logging import get_logger
 from src.utils.data_utils import remove_duplicates
-from src.models.api_models import KISMinuteResponse, KISDailyResponse
+from src.models.api_models import KISMinuteResponse, KISDailyResponse, use_fast_decode, decode_minute_rows
 from src.models.domain_models import MinuteData, DailyData
-from src.kis.kis_auth import KISAuthManager
+from src.kis.kis_auth import get_auth_manager
 from src.kis.kis_client import KISAPIClient
 
 logger = get_logger(__name__)
@@ -15,45 +15,52 @@ class StockDataExtractor:
     """삼성전자 주식 데이터 추출"""
     
     def __init__(self):
-        self.auth_manager = KISAuthManager()
+        self.auth_manager = get_auth_manager()
         self.api_client = KISAPIClient(self.auth_manager)
     
-    def extract_minute_data(self) -> List[MinuteData]:
-        """분봉 데이터 가져오기"""
+    def extract_minute_data(self, stock_code: str = None, hour: str = "") -> List[MinuteData]:
+        """분봉 데이터 가져오기 - hour(HHMMSS)를 주면 해당 시각까지의 30건"""
+        stock_code = stock_code or settings.STOCK_CODE
+        
         try:
-            logger.info("분봉 데이터 추출 시작")
+            logger.debug("분봉 데이터 추출 시작")
             
             # KIS API 호출
-            raw_data = self.api_client.call_minute_api(settings.STOCK_CODE)
+            raw_data = self.api_client.call_minute_api(stock_code, hour=hour)
             
-            # 데이터 변환
-            response = KISMinuteResponse(**raw_data)
-            minute_data_list = response.to_minute_data_list(settings.STOCK_CODE)
+            # 데이터 변환 (고속 경로가 없으면 응답 모델 검증 경로)
+            if use_fast_decode():
+                minute_data_list = decode_minute_rows(raw_data, stock_code)
+            else:
+                response = KISMinuteResponse(**raw_data)
+                minute_data_list = response.to_minute_data_list(stock_code)
             
             if not minute_data_list:
                 return []
             
             # 중복 제거
-            unique_data = remove_duplicates(minute_data_list, lambda x: x.timestamp)
+            unique_data = remove_duplicates(minute_data_list, lambda x: x.minute_key)
             
-            logger.info(f"분봉 {len(unique_data)}건 추출 완료")
+            logger.debug("분봉 %s건 추출 완료", len(unique_data))
             return unique_data
             
         except Exception as e:
             logger.error(f"분봉 추출 실패: {e}")
             raise
     
-    def extract_daily_data(self, start_date: str = "", end_date: str = "") -> List[DailyData]:
+    def extract_daily_data(self, start_date: str = "", end_date: str = "", stock_code: str = None) -> List[DailyData]:
         """일봉 데이터 가져오기"""
+        stock_code = stock_code or settings.STOCK_CODE
+        
         try:
-            logger.info("일봉 데이터 추출 시작")
+            logger.debug("일봉 데이터 추출 시작")
             
             # KIS API 호출
-            raw_data = self.api_client.call_daily_api(settings.STOCK_CODE, start_date=start_date, end_date=end_date)
+            raw_data = self.api_client.call_daily_api(stock_code, start_date=start_date, end_date=end_date)
             
             # 데이터 변환
             response = KISDailyResponse(**raw_data)
-            daily_data_list = response.to_daily_data_list(settings.STOCK_CODE)
+            daily_data_list = response.to_daily_data_list(stock_code)
             
             if not daily_data_list:
                 return []
@@ -61,7 +68,7 @@ class StockDataExtractor:
             # 중복 제거
             unique_data = remove_duplicates(daily_data_list, lambda x: x.date)
             
-            logger.info(f"일봉 {len(unique_data)}건 추출 완료")
+            logger.debug("일봉 %s건 추출 완료", len(unique_data))
             return unique_data
             
         except Exception as e:
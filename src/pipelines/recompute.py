@@ -0,0 +1,124 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Set, Tuple
+
+from src.utils.logging import get_logger
+from src.models.domain_models import MinuteData
+from src.pipelines.transformer import StockDataTransformer
+from src.pipelines.loader import StockDataLoader
+
+logger = get_logger(__name__)
+
+
+class RecomputeUnit(NamedTuple):
+    """재계산 작업 단위 - 종목 x 월 (체크포인트 키)"""
+    stock_code: str
+    start: datetime
+    end: datetime
+
+    @property
+    def key(self) -> str:
+        return f"{self.stock_code}:{self.start:%Y-%m}"
+
+
+class IndicatorRecomputer:
+    """저장된 분봉의 지표를 일괄 재계산 - KIS 호출 없이 저장소만 읽고 바뀐 지표만 갱신"""
+
+    def __init__(self, loader: StockDataLoader = None, checkpoint_path: Path = Path("data/recompute_checkpoint.json")):
+        self.loader = loader or StockDataLoader()
+        self.checkpoint_path = checkpoint_path
+        self._checkpoint_lock = threading.Lock()
+        self._completed: Set[str] = set()
+
+    def plan_units(self, stock_codes: List[str], start_date: date, end_date: date) -> List[RecomputeUnit]:
+        """기간을 종목 x 월 단위로 분할"""
+        units = []
+        for stock_code in stock_codes:
+            month_start = start_date.replace(day=1)
+            while month_start <= end_date:
+                next_month = (month_start + timedelta(days=32)).replace(day=1)
+                units.append(RecomputeUnit(
+                    stock_code=stock_code,
+                    start=datetime.combine(max(month_start, start_date), datetime.min.time()),
+                    end=datetime.combine(min(next_month - timedelta(days=1), end_date), datetime.max.time()),
+                ))
+                month_start = next_month
+        return units
+
+    def recompute_bars(self, minute_data: List[MinuteData]) -> List[MinuteData]:
+        """세션(일자)마다 새 변환기로 SMA 재계산 - 저장값과 달라진 분봉만 반환"""
+        sessions: Dict[str, List[MinuteData]] = {}
+        for data in minute_data:
+            sessions.setdefault(data.timestamp[:10], []).append(data)
+
+        changed = []
+        for session_bars in sessions.values():
+            stored = [(data.sma_5, data.sma_30) for data in session_bars]
+            # 윈도우가 차기 전 분봉은 지표가 없어야 하므로 비운 뒤 계산
+            for data in session_bars:
+                data.sma_5 = None
+                data.sma_30 = None
+            StockDataTransformer().calculate_sma(session_bars)
+
+            normalize = self.loader.normalize_indicator
+            for data, (sma_5, sma_30) in zip(session_bars, stored):
+                if normalize(data.sma_5) != sma_5 or normalize(data.sma_30) != sma_30:
+                    changed.append(data)
+
+        return changed
+
+    def _run_unit(self, unit: RecomputeUnit) -> Tuple[int, int]:
+        """작업 단위 1개 처리 - (조회 건수, 갱신 건수)"""
+        minute_data = self.loader.get_minute_range(unit.stock_code, unit.start, unit.end)
+        changed = self.recompute_bars(minute_data)
+        if changed:
+            self.loader.update_minute_indicators(changed)
+        self._mark_completed(unit.key)
+        return len(minute_data), len(changed)
+
+    def _load_checkpoint(self) -> Set[str]:
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                return set(json.load(f).get('completed', []))
+        except FileNotFoundError:
+            return set()
+
+    def _mark_completed(self, key: str) -> None:
+        """완료 단위 기록 (원자적 쓰기) - 재실행 시 건너뜀"""
+        with self._checkpoint_lock:
+            self._completed.add(key)
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.checkpoint_path.with_suffix('.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump({'completed': sorted(self._completed)}, f)
+            temp_path.replace(self.checkpoint_path)
+
+    def run(self, stock_codes: List[str], start_date: date, end_date: date, workers: int = 8, reset: bool = False) -> bool:
+        """기간 전체 재계산 - 작업 단위를 병렬 처리, 실패한 단위는 체크포인트에 남기지 않음"""
+        if reset and self.checkpoint_path.exists():
+            self.checkpoint_path.unlink()
+        self._completed = self._load_checkpoint()
+
+        units = [unit for unit in self.plan_units(stock_codes, start_date, end_date) if unit.key not in self._completed]
+        logger.info("지표 재계산 시작: %s개 단위 (완료 %s개 건너뜀)", len(units), len(self._completed))
+
+        started_at = time.perf_counter()
+        scanned = updated = failed = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._run_unit, unit): unit for unit in units}
+            for future in as_completed(futures):
+                try:
+                    unit_scanned, unit_updated = future.result()
+                    scanned += unit_scanned
+                    updated += unit_updated
+                except Exception as e:
+                    failed += 1
+                    logger.error("지표 재계산 실패 (%s): %s", futures[future].key, e)
+
+        elapsed = time.perf_counter() - started_at
+        logger.info("지표 재계산 완료: 분봉 %s건 조회, %s건 갱신, 실패 %s개 단위 (%.1fs)", scanned, updated, failed, elapsed)
+        return failed == 0
@@ -0,0 +1,125 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+from src.utils.data_utils import remove_duplicates
+from src.utils.session_index import (
+    MINUTES_PER_DAY, SessionIndex, get_session_index_for, timestamp_to_minute_key,
+)
+from src.models.domain_models import MinuteData
+from src.pipelines.extractor import StockDataExtractor
+from src.pipelines.transformer import StockDataTransformer
+from src.pipelines.loader import StockDataLoader
+from src.pipelines.rollup import rebuild_rollups
+
+logger = get_logger(__name__)
+
+
+class MinuteGapRepairer:
+    """저장된 분봉의 누락 구간을 찾아 해당 구간만 KIS에서 다시 수집"""
+
+    # KIS 분봉 API 1회 응답 건수
+    WINDOW_SIZE = 30
+    # 30분 SMA 계산에 필요한 앞선 분봉 수
+    SMA_LOOKBACK = 29
+
+    def __init__(self, extractor: StockDataExtractor = None, loader: StockDataLoader = None):
+        self.extractor = extractor or StockDataExtractor()
+        self.loader = loader or StockDataLoader()
+
+    def find_missing_slots(self, stock_code: str, index: SessionIndex, session_date: date, last_slot: int) -> List[int]:
+        """저장된 SK와 세션 그리드를 비교해 누락 슬롯 반환"""
+        timestamps = self.loader.get_minute_timestamps(stock_code, session_date.isoformat())
+        present_slots = [index.slot_of(timestamp_to_minute_key(ts) % MINUTES_PER_DAY) for ts in timestamps]
+        return index.missing_slots(present_slots, last_slot)
+
+    def plan_windows(self, missing_slots: List[int]) -> List[List[int]]:
+        """누락 슬롯과 SMA 계산 구간을 덮는 최소 호출 계획
+
+        연속 구간별 호출 종료 슬롯 목록을 반환하며,
+        한 구간 안의 호출 결과는 서로 이어져 SMA를 연속 계산할 수 있다.
+        """
+        # 누락 슬롯별 필요 구간 [slot - 29, slot] 병합
+        ranges = []
+        for slot in sorted(missing_slots):
+            start = max(0, slot - self.SMA_LOOKBACK)
+            if ranges and start <= ranges[-1][1] + 1:
+                ranges[-1][1] = slot
+            else:
+                ranges.append([start, slot])
+
+        # 구간마다 30건 단위로 호출 종료 슬롯 결정
+        plan = []
+        for start, end in ranges:
+            window_ends = []
+            cursor = start
+            while cursor <= end:
+                window_end = min(cursor + self.WINDOW_SIZE - 1, end)
+                window_ends.append(window_end)
+                cursor = window_end + 1
+            plan.append(window_ends)
+
+        return plan
+
+    def repair_session(self, stock_code: str = None, session_date: date = None, now: datetime = None) -> int:
+        """당일 세션의 누락 분봉 복구 - 복구 건수 반환"""
+        stock_code = stock_code or settings.STOCK_CODE
+        now = now or datetime.now()
+        session_date = session_date or now.date()
+
+        # KIS 분봉 API는 당일 데이터만 제공
+        if session_date != now.date():
+            logger.warning("분봉 복구는 당일만 지원합니다: %s", session_date)
+            return 0
+
+        index = get_session_index_for(session_date)
+        if index is None:
+            logger.info("%s 휴장일 - 복구 대상 없음", session_date)
+            return 0
+
+        # 진행 중인 분은 제외하고 직전 분까지 검사
+        previous_minute = now - timedelta(minutes=1)
+        last_minute = previous_minute.hour * 60 + previous_minute.minute
+        last_slot = index.last_slot_at(last_minute)
+        if last_slot < 0:
+            return 0
+
+        missing_slots = self.find_missing_slots(stock_code, index, session_date, last_slot)
+        if not missing_slots:
+            logger.info("%s %s 누락 분봉 없음", stock_code, session_date)
+            return 0
+
+        plan = self.plan_windows(missing_slots)
+        call_count = sum(len(window_ends) for window_ends in plan)
+        logger.info("%s 누락 분봉 %s건 - KIS 호출 %s회로 복구", stock_code, len(missing_slots), call_count)
+
+        base_key = session_date.toordinal() * MINUTES_PER_DAY
+        missing_keys = {base_key + index.minute_of(slot) for slot in missing_slots}
+        repaired: Dict[int, MinuteData] = {}
+
+        for window_ends in plan:
+            window_data = []
+            for window_end in window_ends:
+                minute = index.minute_of(window_end)
+                window_data.extend(self.extractor.extract_minute_data(stock_code, hour=f"{minute // 60:02d}{minute % 60:02d}00"))
+
+            # 구간마다 새 변환기로 SMA 연속 계산
+            window_data = remove_duplicates(window_data, lambda x: x.minute_key)
+            for data in StockDataTransformer().calculate_sma(window_data):
+                if data.minute_key in missing_keys:
+                    repaired[data.minute_key] = data
+
+        if not repaired:
+            logger.warning("%s 복구할 분봉을 KIS에서 받지 못했습니다", stock_code)
+            return 0
+
+        if len(repaired) < len(missing_keys):
+            logger.warning("%s 일부 분봉 미복구: %s건 (체결 없음 등)", stock_code, len(missing_keys) - len(repaired))
+
+        if not self.loader.save_minute_data(list(repaired.values()), deduped=True):
+            logger.error("%s 복구 분봉 저장 실패", stock_code)
+            return 0
+        rebuild_rollups(self.loader, list(repaired.values()))
+        logger.info("%s 분봉 %s건 복구 완료", stock_code, len(repaired))
+        return len(repaired)
@@ -0,0 +1,245 @@
+import csv
+import multiprocessing
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from src.utils.logging import get_logger
+from src.utils.session_index import timestamp_to_minute_key
+from src.models.domain_models import MinuteData
+from src.pipelines.transformer import StockDataTransformer
+
+logger = get_logger(__name__)
+
+# 재생 입력 종류
+SOURCE_STORE = "store"      # 설정된 저장소 (STORAGE_BACKEND: DynamoDB/SQLite)
+SOURCE_CSV = "csv"          # <디렉토리>/<종목>.csv
+SOURCE_PARQUET = "parquet"  # <디렉토리>/<종목>.parquet (pyarrow 필요)
+
+
+class BarSource(ABC):
+    """재생 입력 인터페이스 - 종목의 분봉을 세션(일자) 단위로 시간순 제공"""
+
+    @abstractmethod
+    def iter_sessions(self, stock_code: str, start_date: date, end_date: date) -> Iterator[List[MinuteData]]:
+        ...
+
+    def normalize_indicator(self, value: Optional[Decimal]) -> Optional[Decimal]:
+        """입력에 저장된 지표값 표현 (검증 시 같은 기준으로 비교)"""
+        return value
+
+
+def _group_sessions(bars: Iterator[MinuteData], start_date: date, end_date: date) -> Iterator[List[MinuteData]]:
+    """시간순 분봉 스트림을 세션 단위로 묶음 - 기간 밖 분봉은 건너뜀"""
+    start_str, end_str = start_date.isoformat(), end_date.isoformat()
+    session: List[MinuteData] = []
+    for bar in bars:
+        session_date = bar.timestamp[:10]
+        if session_date < start_str or session_date > end_str:
+            continue
+        if session and session[0].timestamp[:10] != session_date:
+            yield session
+            session = []
+        session.append(bar)
+    if session:
+        yield session
+
+
+class StoreBarSource(BarSource):
+    """저장소(DynamoDB/SQLite)에서 월 단위로 읽어 재생 - 메모리에는 한 달치만 유지"""
+
+    def __init__(self):
+        # 워커 프로세스 안에서 생성 (boto3 클라이언트는 프로세스 간 공유하지 않음)
+        from src.pipelines.loader import StockDataLoader
+        self.loader = StockDataLoader()
+
+    def iter_sessions(self, stock_code: str, start_date: date, end_date: date) -> Iterator[List[MinuteData]]:
+        month_start = start_date.replace(day=1)
+        while month_start <= end_date:
+            next_month = (month_start + timedelta(days=32)).replace(day=1)
+            bars = self.loader.get_minute_range(
+                stock_code,
+                datetime.combine(max(month_start, start_date), datetime.min.time()),
+                datetime.combine(min(next_month - timedelta(days=1), end_date), datetime.max.time()),
+            )
+            yield from _group_sessions(iter(bars), start_date, end_date)
+            month_start = next_month
+
+    def normalize_indicator(self, value: Optional[Decimal]) -> Optional[Decimal]:
+        return self.loader.normalize_indicator(value)
+
+
+def _bar_from_record(stock_code: str, record: dict) -> MinuteData:
+    """파일 레코드 -> MinuteData (검증 생략 경로, 가격은 문자열 그대로 Decimal로 복원)"""
+    sma_5, sma_30 = record.get("sma_5"), record.get("sma_30")
+    return MinuteData.from_trusted_values(
+        timestamp_to_minute_key(record["timestamp"]),
+        stock_code=stock_code,
+        open_price=Decimal(record["open_price"]),
+        high_price=Decimal(record["high_price"]),
+        low_price=Decimal(record["low_price"]),
+        close_price=Decimal(record["close_price"]),
+        volume=int(record["volume"]),
+        sma_5=Decimal(sma_5) if sma_5 not in (None, "") else None,
+        sma_30=Decimal(sma_30) if sma_30 not in (None, "") else None,
+    )
+
+
+class CsvBarSource(BarSource):
+    """<디렉토리>/<종목>.csv를 한 줄씩 읽어 재생 (timestamp 오름차순 정렬된 파일)
+
+    컬럼: timestamp, open_price, high_price, low_price, close_price, volume (sma_5/sma_30은 있으면 검증에 사용)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def iter_sessions(self, stock_code: str, start_date: date, end_date: date) -> Iterator[List[MinuteData]]:
+        with open(self.path / f"{stock_code}.csv", newline="") as f:
+            bars = (_bar_from_record(stock_code, record) for record in csv.DictReader(f))
+            yield from _group_sessions(bars, start_date, end_date)
+
+
+class ParquetBarSource(BarSource):
+    """<디렉토리>/<종목>.parquet를 배치 단위로 읽어 재생 (선택 의존성 pyarrow)
+
+    가격 컬럼은 문자열/정수/decimal이어야 실시간 경로와 같은 Decimal 표현이 된다 (float는 "70000.0"처럼 달라짐).
+    """
+
+    def __init__(self, path: Path):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("parquet 재생에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        self._parquet = pyarrow.parquet
+        self.path = Path(path)
+
+    def iter_sessions(self, stock_code: str, start_date: date, end_date: date) -> Iterator[List[MinuteData]]:
+        parquet_file = self._parquet.ParquetFile(self.path / f"{stock_code}.parquet")
+        yield from _group_sessions(self._iter_bars(parquet_file, stock_code), start_date, end_date)
+
+    @staticmethod
+    def _iter_bars(parquet_file, stock_code: str) -> Iterator[MinuteData]:
+        for batch in parquet_file.iter_batches():
+            # CSV 입력과 같은 경로를 타도록 값을 문자열로 바꿔 복원
+            columns = {name: [None if value is None else str(value) for value in column.to_pylist()]
+                       for name, column in zip(batch.schema.names, batch.columns)}
+            for i in range(batch.num_rows):
+                yield _bar_from_record(stock_code, {name: values[i] for name, values in columns.items()})
+
+
+def create_bar_source(kind: str, path: Optional[Path] = None) -> BarSource:
+    """입력 종류에 맞는 재생 입력 생성"""
+    if kind == SOURCE_STORE:
+        return StoreBarSource()
+    if kind == SOURCE_CSV:
+        return CsvBarSource(path)
+    if kind == SOURCE_PARQUET:
+        return ParquetBarSource(path)
+    raise ValueError(f"지원하지 않는 재생 입력: {kind}")
+
+
+class ReplayResult(NamedTuple):
+    """종목 1개 재생 결과"""
+    stock_code: str
+    bars: int
+    sessions: int
+    mismatches: int  # verify=True일 때 입력 지표와 다른 분봉 수
+    elapsed: float
+
+
+def replay_symbol(source_kind: str, source_path: Optional[Path], stock_code: str, start_date: date, end_date: date,
+                  output_dir: Optional[Path] = None, verify: bool = False,
+                  transformer_factory: Callable[[], StockDataTransformer] = StockDataTransformer) -> ReplayResult:
+    """종목 1개를 세션마다 새 변환기로 재생 - 실시간 경로(세션 단위 SMA 윈도우)와 같은 계산 순서
+
+    output_dir이 있으면 <종목>.csv(timestamp,sma_5,sma_30)에 지표를 str(Decimal) 그대로 기록한다.
+    """
+    started_at = time.perf_counter()
+    source = create_bar_source(source_kind, source_path)
+    bar_count = session_count = mismatches = 0
+
+    writer = None
+    output_file = None
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = open(output_dir / f"{stock_code}.csv", "w", newline="")
+        writer = csv.writer(output_file)
+        writer.writerow(("timestamp", "sma_5", "sma_30"))
+
+    try:
+        normalize = source.normalize_indicator
+        for session in source.iter_sessions(stock_code, start_date, end_date):
+            stored = {bar.minute_key: (bar.sma_5, bar.sma_30) for bar in session} if verify else None
+            # 윈도우가 차기 전 분봉은 지표가 없어야 하므로 비운 뒤 계산
+            for bar in session:
+                bar.sma_5 = None
+                bar.sma_30 = None
+            session = transformer_factory().calculate_sma(session)
+
+            if verify:
+                mismatches += sum(1 for bar in session
+                                  if (normalize(bar.sma_5), normalize(bar.sma_30)) != stored[bar.minute_key])
+            if writer is not None:
+                writer.writerows((bar.timestamp, "" if bar.sma_5 is None else str(bar.sma_5),
+                                  "" if bar.sma_30 is None else str(bar.sma_30)) for bar in session)
+
+            bar_count += len(session)
+            session_count += 1
+    finally:
+        if output_file is not None:
+            output_file.close()
+
+    return ReplayResult(stock_code, bar_count, session_count, mismatches, time.perf_counter() - started_at)
+
+
+class ReplayEngine:
+    """저장된 분봉을 벽시계 대기 없이 변환기에 흘려보내는 재생기 - 종목별로 프로세스 풀에서 병렬 실행"""
+
+    def __init__(self, source_kind: str = SOURCE_STORE, source_path: Optional[Path] = None,
+                 output_dir: Optional[Path] = None, verify: bool = False,
+                 transformer_factory: Callable[[], StockDataTransformer] = StockDataTransformer):
+        self.source_kind = source_kind
+        self.source_path = source_path
+        self.output_dir = output_dir
+        self.verify = verify
+        # 새 지표 로직 검증용 - 워커로 넘기므로 모듈 최상위 클래스/함수여야 함
+        self.transformer_factory = transformer_factory
+
+    def run(self, stock_codes: List[str], start_date: date, end_date: date, workers: int = 4) -> Tuple[List[ReplayResult], int]:
+        """전체 재생 - (종목별 결과, 실패 종목 수)"""
+        logger.info("재생 시작: %s종목, %s ~ %s, 워커 %s개", len(stock_codes), start_date, end_date, workers)
+        started_at = time.perf_counter()
+        results: List[ReplayResult] = []
+        failed = 0
+
+        # 워커마다 자체 저장소 클라이언트를 만들도록 spawn 사용 (스케줄러 워커와 동일)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = {
+                executor.submit(replay_symbol, self.source_kind, self.source_path, stock_code, start_date, end_date,
+                                self.output_dir, self.verify, self.transformer_factory): stock_code
+                for stock_code in stock_codes
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failed += 1
+                    logger.error("재생 실패 (%s): %s", futures[future], e)
+                    continue
+                results.append(result)
+                logger.debug("%s 재생: 분봉 %s건, 세션 %s개 (%.0f bars/s)", result.stock_code, result.bars,
+                             result.sessions, result.bars / result.elapsed if result.elapsed else 0)
+
+        elapsed = time.perf_counter() - started_at
+        total_bars = sum(result.bars for result in results)
+        summary = f"재생 완료: 분봉 {total_bars}건, {elapsed:.1f}s ({total_bars / elapsed if elapsed else 0:,.0f} bars/s), 실패 {failed}종목"
+        if self.verify:
+            summary += f", 지표 불일치 {sum(result.mismatches for result in results)}건"
+        logger.info(summary)
+        return results, failed
@@ -0,0 +1,202 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+from src.utils.session_index import MINUTES_PER_DAY, minute_key_to_timestamp
+from src.models.domain_models import MinuteData, RollupData
+from src.pipelines.loader import StockDataLoader
+
+logger = get_logger(__name__)
+
+
+def parse_intervals(value: str) -> Tuple[int, ...]:
+    """ROLLUP_INTERVALS("5,15,60") 파싱 - 하루(1440분)를 나누어떨어지는 주기만 허용 (구간이 자정 기준으로 정렬)"""
+    intervals = tuple(sorted({int(part) for part in value.split(",") if part.strip()}))
+    invalid = [interval for interval in intervals if interval <= 1 or MINUTES_PER_DAY % interval]
+    if invalid:
+        raise ValueError(f"지원하지 않는 상위 주기: {invalid}")
+    return intervals
+
+
+class _BucketState:
+    """진행 중인 구간 - 마지막 분봉 이전까지의 집계(base) + 마지막 분봉
+
+    같은 분봉이 다시 들어오면 마지막 분봉만 바꿔 끼우므로 재전송/진행 중인 분 갱신에도 O(1)로 정확하다.
+    """
+    __slots__ = ('bucket_key', 'base', 'last_bar', 'values')
+
+    def __init__(self, bucket_key: int):
+        self.bucket_key = bucket_key
+        self.base: Optional[Tuple] = None  # (open, high, low, volume, bar_count)
+        self.last_bar: Optional[MinuteData] = None
+        self.values: Optional[Tuple] = None  # 마지막으로 내보낸 OHLCV
+
+
+class RollupAggregator:
+    """분봉 -> 상위 주기 봉 증분 집계 (분봉 1건당 주기마다 O(1))"""
+
+    def __init__(self, intervals: Tuple[int, ...]):
+        self.intervals = intervals
+        self._states: Dict[Tuple[str, int], _BucketState] = {}
+        # 스케줄러 잡(분봉/복구)이 여러 스레드에서 같은 집계기를 쓴다
+        self._lock = threading.Lock()
+
+    def is_seeded(self, stock_code: str) -> bool:
+        return (stock_code, self.intervals[-1]) in self._states
+
+    def forget(self, stock_code: str) -> None:
+        """종목 상태 제거 - 다음 분봉에서 저장소로 다시 예열"""
+        with self._lock:
+            for interval in self.intervals:
+                self._states.pop((stock_code, interval), None)
+
+    def update(self, bar: MinuteData) -> List[RollupData]:
+        """분봉 반영 - 값이 바뀐 구간의 상위 주기 봉 반환 (이미 지난 분봉은 무시)"""
+        changed = []
+        with self._lock:
+            for interval in self.intervals:
+                rollup = self._update_interval(bar, interval)
+                if rollup is not None:
+                    changed.append(rollup)
+        return changed
+
+    def _update_interval(self, bar: MinuteData, interval: int) -> Optional[RollupData]:
+        minute_key = bar.minute_key
+        bucket_key = minute_key - minute_key % interval
+        key = (bar.stock_code, interval)
+        state = self._states.get(key)
+
+        if state is not None and minute_key < state.last_bar.minute_key:
+            return None
+        if state is None or bucket_key != state.bucket_key:
+            # 새 구간 시작 (직전 구간은 마지막 변경 때 이미 저장됨)
+            state = self._states[key] = _BucketState(bucket_key)
+        elif minute_key > state.last_bar.minute_key:
+            state.base = self._fold(state.base, state.last_bar)
+
+        state.last_bar = bar
+        open_price, high_price, low_price, volume, bar_count = self._fold(state.base, bar)
+        values = (open_price, high_price, low_price, bar.close_price, volume, bar_count)
+        if values == state.values:
+            return None
+        state.values = values
+
+        return RollupData(
+            stock_code=bar.stock_code,
+            interval=interval,
+            timestamp=minute_key_to_timestamp(bucket_key),
+            open_price=open_price,
+            high_price=high_price,
+            low_price=low_price,
+            close_price=bar.close_price,
+            volume=volume,
+            bar_count=bar_count,
+        )
+
+    @staticmethod
+    def _fold(base: Optional[Tuple], bar: MinuteData) -> Tuple:
+        if base is None:
+            return bar.open_price, bar.high_price, bar.low_price, bar.volume, 1
+        open_price, high_price, low_price, volume, bar_count = base
+        return (open_price, max(high_price, bar.high_price), min(low_price, bar.low_price),
+                volume + bar.volume, bar_count + 1)
+
+
+def aggregate_rollups(bars: Iterable[MinuteData], intervals: Tuple[int, ...]) -> List[RollupData]:
+    """분봉 목록 전체를 상위 주기 봉으로 집계 (구간별 최종값만)"""
+    aggregator = RollupAggregator(intervals)
+    latest: Dict[Tuple[int, str], RollupData] = {}
+    for bar in sorted(bars, key=lambda data: data.minute_key):
+        for rollup in aggregator.update(bar):
+            latest[(rollup.interval, rollup.timestamp)] = rollup
+    return list(latest.values())
+
+
+_aggregator: Optional[RollupAggregator] = None
+_aggregator_lock = threading.Lock()
+
+
+def get_rollup_aggregator() -> Optional[RollupAggregator]:
+    """프로세스 공용 집계기 (ROLLUP_INTERVALS가 비어 있으면 None)"""
+    global _aggregator
+    with _aggregator_lock:
+        if _aggregator is None and settings.ROLLUP_INTERVALS.strip():
+            _aggregator = RollupAggregator(parse_intervals(settings.ROLLUP_INTERVALS))
+        return _aggregator
+
+
+def forget_rollups(stock_code: str) -> None:
+    """종목의 진행 중 집계 상태 제거 - 분봉 저장 실패/복구 후 다음 분봉에서 저장소로 다시 예열"""
+    aggregator = get_rollup_aggregator()
+    if aggregator is not None:
+        aggregator.forget(stock_code)
+
+
+def _bucket_start(bar: MinuteData, interval: int) -> datetime:
+    minute_key = bar.minute_key
+    return datetime.strptime(minute_key_to_timestamp(minute_key - minute_key % interval), "%Y-%m-%d %H:%M:%S")
+
+
+def _history_start(bar: MinuteData, intervals: Tuple[int, ...]) -> datetime:
+    """분봉이 속한 모든 주기 구간 중 가장 이른 시작 시각"""
+    return min(_bucket_start(bar, interval) for interval in intervals)
+
+
+def update_rollups(loader: StockDataLoader, minute_data: List[MinuteData]) -> int:
+    """새 분봉을 상위 주기 봉에 반영하고 바뀐 구간만 저장 - 저장 건수 반환
+
+    프로세스 시작 후 종목의 첫 분봉이면 진행 중인 구간의 저장된 분봉으로 먼저 예열한다.
+    """
+    aggregator = get_rollup_aggregator()
+    if aggregator is None or not minute_data:
+        return 0
+
+    bars = sorted(minute_data, key=lambda data: data.minute_key)
+    first = bars[0]
+    if not aggregator.is_seeded(first.stock_code):
+        start = _history_start(first, aggregator.intervals)
+        end = datetime.strptime(first.timestamp, "%Y-%m-%d %H:%M:%S") - timedelta(minutes=1)
+        if start <= end:
+            history = loader.get_minute_range(first.stock_code, start, end)
+            for bar in history:
+                aggregator.update(bar)
+            logger.debug("%s 상위 주기 집계 예열: 분봉 %s건", first.stock_code, len(history))
+
+    changed: Dict[Tuple[int, str], RollupData] = {}
+    for bar in bars:
+        for rollup in aggregator.update(bar):
+            changed[(rollup.interval, rollup.timestamp)] = rollup
+
+    if changed and not loader.save_rollup_data(list(changed.values())):
+        # 저장 실패한 구간은 다음 분봉에서 다시 기록되도록 예열부터 다시 한다
+        aggregator.forget(first.stock_code)
+        logger.error("%s 상위 주기 봉 저장 실패", first.stock_code)
+        return 0
+    return len(changed)
+
+
+def rebuild_rollups(loader: StockDataLoader, minute_data: List[MinuteData]) -> int:
+    """늦게 채워진 분봉(누락 복구)이 속한 구간을 저장된 분봉으로 다시 집계 - 저장 건수 반환"""
+    intervals = parse_intervals(settings.ROLLUP_INTERVALS) if settings.ROLLUP_INTERVALS.strip() else ()
+    if not intervals or not minute_data:
+        return 0
+
+    stock_code = minute_data[0].stock_code
+    buckets = {(interval, _bucket_start(bar, interval)) for bar in minute_data for interval in intervals}
+    start = min(bucket_start for _, bucket_start in buckets)
+    end = max(bucket_start + timedelta(minutes=interval - 1) for interval, bucket_start in buckets)
+    history = loader.get_minute_range(stock_code, start, end)
+
+    # 구간 밖 분봉으로 만든 앞뒤 구간은 일부만 집계된 값이므로 영향받은 구간만 저장
+    affected = {(interval, bucket_start.strftime("%Y-%m-%d %H:%M:%S")) for interval, bucket_start in buckets}
+    rollups = [rollup for rollup in aggregate_rollups(history, intervals) if (rollup.interval, rollup.timestamp) in affected]
+
+    # 진행 중 상태는 복구 전 분봉으로 만든 것이므로 버리고 다음 분봉에서 다시 예열
+    forget_rollups(stock_code)
+
+    if rollups and not loader.save_rollup_data(rollups):
+        logger.error("%s 상위 주기 봉 재집계 저장 실패", stock_code)
+        return 0
+    return len(rollups)
@@ -0,0 +1,86 @@
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Type, Union
+
+from src.utils.logging import get_logger
+from src.models.domain_models import MinuteData, DailyData, RollupData
+
+logger = get_logger(__name__)
+
+SpooledData = Union[MinuteData, DailyData, RollupData]
+
+# 스풀 레코드의 종류 표시
+_KINDS: Dict[str, Type[SpooledData]] = {"minute": MinuteData, "daily": DailyData, "rollup": RollupData}
+_KIND_OF = {model: kind for kind, model in _KINDS.items()}
+
+
+class LocalSpool:
+    """저장소 장애(차단기 열림) 동안 저장할 데이터를 로컬 jsonl 파일에 쌓고 복구 후 다시 저장
+
+    파일은 저장 호출 1번당 1개 - 드레인은 파일 이름을 바꿔 선점하므로 여러 워커가 동시에 비워도 중복 저장하지 않는다.
+    """
+
+    def __init__(self, spool_dir: Path = Path("data/spool")):
+        self.spool_dir = spool_dir
+        self._lock = threading.Lock()
+        self._sequence = 0
+
+    def append(self, data: List[SpooledData]) -> Path:
+        """데이터를 스풀 파일 1개로 기록 (임시 파일에 쓴 뒤 이름 변경)"""
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._sequence += 1
+            name = f"{datetime.now():%Y%m%d-%H%M%S-%f}-{os.getpid()}-{self._sequence}"
+
+        temp_path = self.spool_dir / f"{name}.tmp"
+        with open(temp_path, "w") as f:
+            for bar in data:
+                f.write(json.dumps({"kind": _KIND_OF[type(bar)], **bar.model_dump(mode="json")}) + "\n")
+        path = temp_path.with_suffix(".jsonl")
+        temp_path.replace(path)
+        logger.warning("저장소 차단 중 - %s건 스풀 기록: %s", len(data), path.name)
+        return path
+
+    def pending(self) -> List[Path]:
+        """드레인 대기 중인 스풀 파일 (오래된 순)"""
+        if not self.spool_dir.exists():
+            return []
+        return sorted(self.spool_dir.glob("*.jsonl"))
+
+    def drain(self, save: Callable[[List[SpooledData]], bool]) -> int:
+        """스풀 파일을 오래된 순으로 다시 저장 - 실패하면 해당 파일은 남기고 중단, 다시 저장한 건수 반환"""
+        drained = 0
+        for path in self.pending():
+            claimed = path.with_suffix(f".draining-{os.getpid()}")
+            try:
+                path.rename(claimed)
+            except FileNotFoundError:
+                continue  # 다른 워커가 선점
+
+            try:
+                data = self._read(claimed)
+                if data and not save(data):
+                    raise RuntimeError("저장 실패")
+            except Exception as e:
+                claimed.rename(path)
+                logger.warning("스풀 드레인 중단 (%s): %s", path.name, e)
+                break
+
+            claimed.unlink()
+            drained += len(data)
+
+        if drained:
+            logger.info("스풀 드레인 완료: %s건 저장", drained)
+        return drained
+
+    @staticmethod
+    def _read(path: Path) -> List[SpooledData]:
+        data = []
+        with open(path, "r") as f:
+            for line in f:
+                record = json.loads(line)
+                data.append(_KINDS[record.pop("kind")](**record))
+        return data
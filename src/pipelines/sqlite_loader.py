@@ -0,0 +1,283 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+from src.utils.data_utils import iter_valid_bars
+from src.models.domain_models import MinuteData, DailyData, RollupData
+from src.pipelines.storage import StorageBackend
+
+logger = get_logger(__name__)
+
+# 가격/지표는 Decimal 정밀도를 유지하도록 TEXT로 저장
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS minute_bars (
+    stock_code TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    open_price TEXT NOT NULL,
+    high_price TEXT NOT NULL,
+    low_price TEXT NOT NULL,
+    close_price TEXT NOT NULL,
+    volume INTEGER NOT NULL,
+    sma_5 TEXT,
+    sma_30 TEXT,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (stock_code, timestamp)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS daily_bars (
+    stock_code TEXT NOT NULL,
+    date TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    open_price TEXT NOT NULL,
+    high_price TEXT NOT NULL,
+    low_price TEXT NOT NULL,
+    close_price TEXT NOT NULL,
+    volume INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (stock_code, date)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS rollup_bars (
+    stock_code TEXT NOT NULL,
+    interval INTEGER NOT NULL,
+    timestamp TEXT NOT NULL,
+    open_price TEXT NOT NULL,
+    high_price TEXT NOT NULL,
+    low_price TEXT NOT NULL,
+    close_price TEXT NOT NULL,
+    volume INTEGER NOT NULL,
+    bar_count INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (stock_code, interval, timestamp)
+) WITHOUT ROWID;
+"""
+
+MINUTE_COLUMNS = "stock_code, timestamp, open_price, high_price, low_price, close_price, volume, sma_5, sma_30, created_at"
+DAILY_COLUMNS = "stock_code, date, timestamp, open_price, high_price, low_price, close_price, volume, created_at"
+ROLLUP_COLUMNS = "stock_code, interval, timestamp, open_price, high_price, low_price, close_price, volume, bar_count, created_at"
+
+
+def _text(value: Optional[Decimal]) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+def _minute_row(bar: MinuteData) -> tuple:
+    return (bar.stock_code, bar.timestamp, str(bar.open_price), str(bar.high_price), str(bar.low_price),
+            str(bar.close_price), bar.volume, _text(bar.sma_5), _text(bar.sma_30), bar.created_at)
+
+
+def _daily_row(bar: DailyData) -> tuple:
+    return (bar.stock_code, bar.date, bar.timestamp, str(bar.open_price), str(bar.high_price), str(bar.low_price),
+            str(bar.close_price), bar.volume, bar.created_at)
+
+
+def _rollup_row(bar: RollupData) -> tuple:
+    return (bar.stock_code, bar.interval, bar.timestamp, str(bar.open_price), str(bar.high_price), str(bar.low_price),
+            str(bar.close_price), bar.volume, bar.bar_count, bar.created_at)
+
+
+def _minute_from_row(row: tuple) -> MinuteData:
+    stock_code, timestamp, open_price, high_price, low_price, close_price, volume, sma_5, sma_30, created_at = row
+    return MinuteData(
+        stock_code=stock_code,
+        timestamp=timestamp,
+        open_price=Decimal(open_price),
+        high_price=Decimal(high_price),
+        low_price=Decimal(low_price),
+        close_price=Decimal(close_price),
+        volume=volume,
+        sma_5=Decimal(sma_5) if sma_5 is not None else None,
+        sma_30=Decimal(sma_30) if sma_30 is not None else None,
+        created_at=created_at,
+    )
+
+
+def _daily_from_row(row: tuple) -> DailyData:
+    stock_code, date, timestamp, open_price, high_price, low_price, close_price, volume, created_at = row
+    return DailyData(
+        stock_code=stock_code,
+        date=date,
+        timestamp=timestamp,
+        open_price=Decimal(open_price),
+        high_price=Decimal(high_price),
+        low_price=Decimal(low_price),
+        close_price=Decimal(close_price),
+        volume=volume,
+        created_at=created_at,
+    )
+
+
+def _rollup_from_row(row: tuple) -> RollupData:
+    stock_code, interval, timestamp, open_price, high_price, low_price, close_price, volume, bar_count, created_at = row
+    return RollupData(
+        stock_code=stock_code,
+        interval=interval,
+        timestamp=timestamp,
+        open_price=Decimal(open_price),
+        high_price=Decimal(high_price),
+        low_price=Decimal(low_price),
+        close_price=Decimal(close_price),
+        volume=volume,
+        bar_count=bar_count,
+        created_at=created_at,
+    )
+
+
+class SQLiteLoader(StorageBackend):
+    """로컬 SQLite 저장소 (WAL) - AWS 없는 환경, 백테스트/벤치마크용"""
+
+    def __init__(self, db_path: Path = None):
+        self.db_path = Path(db_path or settings.SQLITE_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 스트림 수집기는 여러 스레드에서 저장하므로 연결 1개를 락으로 공유
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        # WAL: 다른 워커 프로세스가 읽는 동안에도 쓰기 가능
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        logger.debug("SQLiteLoader 초기화 - %s", self.db_path)
+
+    def save_data(self, data: List[Union[MinuteData, DailyData]], deduped: bool = False) -> bool:
+        """데이터 저장 - 같은 키는 덮어쓰기 (DynamoDB PutItem과 동일)"""
+        if not data:
+            logger.warning("저장할 데이터가 없습니다")
+            return True
+
+        if isinstance(data[0], MinuteData):
+            sql = f"INSERT OR REPLACE INTO minute_bars ({MINUTE_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            rows = [_minute_row(bar) for bar in iter_valid_bars(data, deduped=deduped)]
+        else:
+            sql = f"INSERT OR REPLACE INTO daily_bars ({DAILY_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            rows = [_daily_row(bar) for bar in iter_valid_bars(data, deduped=deduped)]
+
+        if not rows:
+            logger.error("유효한 데이터가 없습니다")
+            return False
+
+        try:
+            with self._lock, self.connection:
+                self.connection.executemany(sql, rows)
+            logger.debug("SQLite 저장 완료: %s건", len(rows))
+            return True
+
+        except sqlite3.Error as e:
+            logger.error("SQLite 저장 실패: %s", e)
+            return False
+
+    def _fetch(self, sql: str, params: tuple) -> List[tuple]:
+        with self._lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def get_recent_data(self, stock_code: str, data_type: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """최근 데이터 조회 - DynamoDB 아이템과 같은 형식(PK/SK 포함)으로 반환"""
+        stock_code = stock_code or settings.STOCK_CODE
+
+        if data_type.upper() in ['MINUTE', '분봉']:
+            rows = self._fetch(f"SELECT {MINUTE_COLUMNS} FROM minute_bars WHERE stock_code = ? "
+                               f"ORDER BY timestamp DESC LIMIT ?", (stock_code, limit))
+            bars = [_minute_from_row(row) for row in rows]
+        elif data_type.upper() in ['DAILY', '일봉']:
+            rows = self._fetch(f"SELECT {DAILY_COLUMNS} FROM daily_bars WHERE stock_code = ? "
+                               f"ORDER BY date DESC LIMIT ?", (stock_code, limit))
+            bars = [_daily_from_row(row) for row in rows]
+        else:
+            logger.error("지원하지 않는 데이터 타입: %s", data_type)
+            return []
+
+        logger.debug("%s 최근 데이터 %s건 조회", data_type, len(bars))
+        return [{"PK": bar.get_pk(), "SK": bar.get_sk(), **bar.model_dump(exclude_none=True)} for bar in bars]
+
+    def get_minute_timestamps(self, stock_code: str, session_date: str) -> List[str]:
+        """해당 일자(YYYY-MM-DD)에 저장된 분봉 timestamp 목록"""
+        rows = self._fetch("SELECT timestamp FROM minute_bars WHERE stock_code = ? AND timestamp BETWEEN ? AND ? "
+                           "ORDER BY timestamp", (stock_code, f"{session_date} 00:00:00", f"{session_date} 23:59:59"))
+        return [row[0] for row in rows]
+
+    def get_minute_data(self, stock_code: str, session_date: str) -> List[MinuteData]:
+        """해당 일자(YYYY-MM-DD)에 저장된 분봉 전체 조회"""
+        return self._get_minutes(stock_code, f"{session_date} 00:00:00", f"{session_date} 23:59:59")
+
+    def get_minute_range(self, stock_code: str, start: datetime, end: datetime) -> List[MinuteData]:
+        """기간(양 끝 포함) 분봉 조회"""
+        return self._get_minutes(stock_code, start.strftime("%Y-%m-%d %H:%M:%S"), end.strftime("%Y-%m-%d %H:%M:%S"))
+
+    def _get_minutes(self, stock_code: str, start_ts: str, end_ts: str) -> List[MinuteData]:
+        rows = self._fetch(f"SELECT {MINUTE_COLUMNS} FROM minute_bars WHERE stock_code = ? AND timestamp BETWEEN ? AND ? "
+                           f"ORDER BY timestamp", (stock_code, start_ts, end_ts))
+        logger.debug("%s ~ %s 분봉 %s건 조회", start_ts, end_ts, len(rows))
+        return [_minute_from_row(row) for row in rows]
+
+    def save_rollups(self, data: List[RollupData]) -> bool:
+        """상위 주기 봉 저장 - 같은 구간은 덮어쓰기"""
+        if not data:
+            return True
+
+        try:
+            with self._lock, self.connection:
+                self.connection.executemany(f"INSERT OR REPLACE INTO rollup_bars ({ROLLUP_COLUMNS}) "
+                                            f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", [_rollup_row(bar) for bar in data])
+            return True
+
+        except sqlite3.Error as e:
+            logger.error("SQLite 저장 실패: %s", e)
+            return False
+
+    def get_rollups(self, stock_code: str, interval: int, start: datetime, end: datetime) -> List[RollupData]:
+        """기간(양 끝 포함) 상위 주기 봉 조회"""
+        rows = self._fetch(f"SELECT {ROLLUP_COLUMNS} FROM rollup_bars WHERE stock_code = ? AND interval = ? "
+                           f"AND timestamp BETWEEN ? AND ? ORDER BY timestamp",
+                           (stock_code, interval, start.strftime("%Y-%m-%d %H:%M:%S"), end.strftime("%Y-%m-%d %H:%M:%S")))
+        return [_rollup_from_row(row) for row in rows]
+
+    def update_indicators(self, data: List[MinuteData]) -> int:
+        """분봉 지표 컬럼만 일괄 갱신 - 실패는 호출자(재계산)가 단위 실패로 처리하도록 다시 발생"""
+        rows = [(_text(bar.sma_5), _text(bar.sma_30), bar.stock_code, bar.timestamp) for bar in data]
+        try:
+            with self._lock, self.connection:
+                cursor = self.connection.executemany(
+                    "UPDATE minute_bars SET sma_5 = ?, sma_30 = ? WHERE stock_code = ? AND timestamp = ?", rows)
+            return cursor.rowcount
+
+        except sqlite3.Error as e:
+            logger.error("SQLite 지표 갱신 실패: %s", e)
+            raise
+
+    def health_check(self) -> bool:
+        """SQLite 연결 상태 확인"""
+        try:
+            self._fetch("SELECT 1", ())
+            return True
+        except sqlite3.Error as e:
+            logger.error("SQLite 연결 오류: %s", e)
+            return False
+
+    def close(self) -> None:
+        """연결 종료 - 공용 저장소였으면 다음 get_sqlite_loader()가 새로 연결"""
+        key = (os.getpid(), self.db_path.resolve())
+        with _loaders_lock:
+            if _loaders.get(key) is self:
+                del _loaders[key]
+        with self._lock:
+            self.connection.close()
+
+
+_loaders: Dict[Tuple[int, Path], SQLiteLoader] = {}
+_loaders_lock = threading.Lock()
+
+
+def get_sqlite_loader(db_path: Path = None) -> SQLiteLoader:
+    """프로세스·경로당 하나의 저장소 - 실행마다 연결/PRAGMA/스키마 생성을 반복하지 않음"""
+    key = (os.getpid(), Path(db_path or settings.SQLITE_PATH).resolve())
+    with _loaders_lock:
+        loader = _loaders.get(key)
+        if loader is None:
+            loader = _loaders[key] = SQLiteLoader(key[1])
+        return loader
@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Union
+
+from src.config.settings import settings
+from src.models.domain_models import MinuteData, DailyData, RollupData
+
+# STORAGE_BACKEND 값
+BACKEND_DYNAMODB = "dynamodb"
+BACKEND_SQLITE = "sqlite"
+
+
+class StorageBackend(ABC):
+    """저장소 인터페이스 - StockDataLoader가 사용하는 저장/조회 연산"""
+
+    @abstractmethod
+    def save_data(self, data: List[Union[MinuteData, DailyData]], deduped: bool = False) -> bool:
+        ...
+
+    @abstractmethod
+    def get_recent_data(self, stock_code: str, data_type: str, limit: int = 10) -> List[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def get_minute_timestamps(self, stock_code: str, session_date: str) -> List[str]:
+        ...
+
+    @abstractmethod
+    def get_minute_data(self, stock_code: str, session_date: str) -> List[MinuteData]:
+        ...
+
+    @abstractmethod
+    def get_minute_range(self, stock_code: str, start: datetime, end: datetime) -> List[MinuteData]:
+        ...
+
+    @abstractmethod
+    def update_indicators(self, data: List[MinuteData]) -> int:
+        """저장된 분봉의 지표(sma_5/sma_30)만 갱신 - 갱신 건수 반환"""
+        ...
+
+    @abstractmethod
+    def save_rollups(self, data: List[RollupData]) -> bool:
+        """상위 주기 봉 저장 - 같은 구간은 덮어쓰기"""
+        ...
+
+    @abstractmethod
+    def get_rollups(self, stock_code: str, interval: int, start: datetime, end: datetime) -> List[RollupData]:
+        """기간(양 끝 포함) 상위 주기 봉 조회"""
+        ...
+
+    def normalize_indicator(self, value: Optional[Decimal]) -> Optional[Decimal]:
+        """저장 시 지표값 표현 (저장소가 반올림하면 같은 기준으로 비교하도록)"""
+        return value
+
+    @abstractmethod
+    def health_check(self) -> bool:
+        ...
+
+
+def create_storage_backend(backend: str = None, table_name: str = None) -> StorageBackend:
+    """설정(STORAGE_BACKEND)에 맞는 저장소 생성 - 선택한 백엔드 모듈만 import"""
+    backend = (backend or settings.STORAGE_BACKEND).lower()
+
+    if backend == BACKEND_DYNAMODB:
+        from src.pipelines.dynamodb_loader import DynamoDBLoader
+        return DynamoDBLoader(table_name)
+    if backend == BACKEND_SQLITE:
+        from src.pipelines.sqlite_loader import get_sqlite_loader
+        return get_sqlite_loader()
+
+    raise ValueError(f"지원하지 않는 저장소: {backend}")
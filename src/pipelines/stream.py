@@ -0,0 +1,155 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.utils.logging import get_logger
+from src.utils.session_index import MINUTES_PER_DAY, to_minute_key
+from src.models.domain_models import MinuteData
+from src.kis.kis_auth import KISAuthManager, get_auth_manager
+from src.kis.kis_websocket import KISWebSocketClient, TradeTick
+from src.pipelines.transformer import StockDataTransformer
+from src.pipelines.loader import StockDataLoader
+from src.pipelines.rollup import forget_rollups, update_rollups
+
+logger = get_logger(__name__)
+
+
+class MinuteBarAggregator:
+    """체결 틱을 종목별 1분봉 OHLCV로 집계"""
+
+    def __init__(self):
+        self._bars: Dict[str, MinuteData] = {}
+        # 종목별 마지막으로 내보낸 분 (늦게 도착한 틱으로 완료된 분봉을 덮어쓰지 않도록)
+        self._last_emitted: Dict[str, int] = {}
+
+    def add_tick(self, tick: TradeTick) -> Optional[MinuteData]:
+        """틱 반영 - 분이 바뀌면 완료된 직전 분봉 반환"""
+        minute_key = to_minute_key(tick.date, tick.time)
+        if minute_key <= self._last_emitted.get(tick.stock_code, -1):
+            return None
+
+        bar = self._bars.get(tick.stock_code)
+        if bar is not None and bar.minute_key == minute_key:
+            if tick.price > bar.high_price:
+                bar.high_price = tick.price
+            if tick.price < bar.low_price:
+                bar.low_price = tick.price
+            bar.close_price = tick.price
+            bar.volume += tick.volume
+            return None
+
+        if bar is not None and minute_key < bar.minute_key:
+            return None
+
+        self._bars[tick.stock_code] = MinuteData.at_minute(
+            minute_key,
+            stock_code=tick.stock_code,
+            open_price=tick.price,
+            high_price=tick.price,
+            low_price=tick.price,
+            close_price=tick.price,
+            volume=tick.volume
+        )
+
+        if bar is not None:
+            self._last_emitted[tick.stock_code] = bar.minute_key
+        return bar
+
+    def flush_due(self, now: datetime) -> List[MinuteData]:
+        """현재 분 이전에 시작된 분봉 반환 (체결이 끊긴 종목용)"""
+        current_key = now.date().toordinal() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+        due_codes = [code for code, bar in self._bars.items() if bar.minute_key < current_key]
+        return [self._emit(code) for code in due_codes]
+
+    def flush(self) -> List[MinuteData]:
+        """남은 분봉 전부 반환 (스트림 종료 시)"""
+        return [self._emit(code) for code in list(self._bars)]
+
+    def _emit(self, stock_code: str) -> MinuteData:
+        bar = self._bars.pop(stock_code)
+        self._last_emitted[stock_code] = bar.minute_key
+        return bar
+
+
+class StreamingIngestor:
+    """실시간 체결 틱 -> 1분봉 -> 기존 변환/적재 경로"""
+
+    def __init__(self, loader: StockDataLoader = None, auth_manager: KISAuthManager = None,
+                 url: str = None, record_path: Path = None, flush_by_clock: bool = True, reconnect: bool = True):
+        self.loader = loader or StockDataLoader()
+        self.auth_manager = auth_manager or get_auth_manager()
+        self.url = url
+        self.record_path = record_path
+        # 재생 모드에서는 벽시계 기준 분봉 마감을 끈다
+        self.flush_by_clock = flush_by_clock
+        self.reconnect = reconnect
+
+        self.aggregator = MinuteBarAggregator()
+        self.transformers: Dict[str, StockDataTransformer] = {}
+        self.bar_count = 0
+
+    def _get_transformer(self, stock_code: str) -> StockDataTransformer:
+        """종목별 변환기 - 당일 저장된 분봉으로 SMA 윈도우 예열"""
+        transformer = self.transformers.get(stock_code)
+        if transformer is None:
+            transformer = StockDataTransformer()
+            history = self.loader.get_minute_data(stock_code, datetime.now().date().isoformat())
+            transformer.calculate_sma(history[-30:])
+            self.transformers[stock_code] = transformer
+        return transformer
+
+    def handle_bar(self, bar: MinuteData) -> None:
+        """완료된 분봉에 SMA 계산 후 저장"""
+        self._get_transformer(bar.stock_code).calculate_sma([bar])
+        if not self.loader.save_minute_data([bar], deduped=True):
+            forget_rollups(bar.stock_code)
+            logger.error("분봉 저장 실패 (%s %s) - 상위 주기 갱신 생략", bar.stock_code, bar.timestamp)
+            return
+        update_rollups(self.loader, [bar])
+        self.bar_count += 1
+
+    async def _consume_bars(self, queue: asyncio.Queue) -> None:
+        """완료 분봉을 순서대로 저장 (블로킹 I/O는 스레드에서)"""
+        while True:
+            bar = await queue.get()
+            try:
+                if bar is None:
+                    return
+                await asyncio.to_thread(self.handle_bar, bar)
+            except Exception as e:
+                logger.error("분봉 저장 실패 (%s %s): %s", bar.stock_code, bar.timestamp, e)
+            finally:
+                queue.task_done()
+
+    async def _flush_idle_bars(self, queue: asyncio.Queue) -> None:
+        """체결이 없는 종목의 분봉을 분이 바뀌면 마감"""
+        while True:
+            await asyncio.sleep(1)
+            for bar in self.aggregator.flush_due(datetime.now()):
+                queue.put_nowait(bar)
+
+    async def run(self, stock_codes: List[str]) -> int:
+        """스트림 수신 - 저장한 분봉 수 반환"""
+        approval_key = await asyncio.to_thread(self.auth_manager.get_approval_key)
+        client = KISWebSocketClient(approval_key, url=self.url, record_path=self.record_path, reconnect=self.reconnect)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        consumer = asyncio.create_task(self._consume_bars(queue))
+        flusher = asyncio.create_task(self._flush_idle_bars(queue)) if self.flush_by_clock else None
+
+        try:
+            async for tick in client.stream_ticks(stock_codes):
+                bar = self.aggregator.add_tick(tick)
+                if bar is not None:
+                    queue.put_nowait(bar)
+        finally:
+            if flusher:
+                flusher.cancel()
+            for bar in self.aggregator.flush():
+                queue.put_nowait(bar)
+            queue.put_nowait(None)
+            await consumer
+
+        logger.info("실시간 수집 종료: 분봉 %s건 저장", self.bar_count)
+        return self.bar_count
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Dict, Tuple
 from collections import deque
 from decimal import Decimal
 
@@ -21,22 +21,27 @@ class StockDataTransformer:
     
     def transform_minute_data(self, minute_data: List[MinuteData]) -> List[MinuteData]:
         """분봉 데이터 변환 - SMA 계산 포함"""
-        logger.info("분봉 데이터 변환 시작")
+        logger.debug("분봉 데이터 변환 시작")
         
         if not minute_data:
             return []
         
         # 시간순 정렬 및 SMA 계산
+        sorted_data = self.calculate_sma(minute_data)
+        
+        logger.debug("분봉 데이터 변환 완료: %s건 처리, 1건 반환 (최신 1분)", len(sorted_data))
+        
+        # 최신 데이터만 반환 (SMA가 계산된 상태)
+        return [sorted_data[-1]] if sorted_data else []
+    
+    def calculate_sma(self, minute_data: List[MinuteData]) -> List[MinuteData]:
+        """시간순 정렬 후 모든 분봉에 SMA 설정"""
         sorted_data = sort_stock_data(minute_data, reverse=False)
         
-        # 모든 데이터에 대해 SMA 계산
         for data in sorted_data:
             self._update_sma(data)
         
-        logger.info(f"분봉 데이터 변환 완료: {len(sorted_data)}건 처리, 1건 반환 (최신 1분)")
-        
-        # 최신 데이터만 반환 (SMA가 계산된 상태)
-        return [sorted_data[-1]] if sorted_data else []
+        return sorted_data
     
     def _update_sma(self, data: MinuteData) -> None:
         """SMA 계산 로직"""
@@ -63,7 +68,7 @@ class StockDataTransformer:
 
     def transform_daily_data(self, daily_data: List[DailyData]) -> List[DailyData]:
         """일봉 데이터 변환"""
-        logger.info("일봉 데이터 변환 시작")
+        logger.debug("일봉 데이터 변환 시작")
         
         if not daily_data:
             return []
@@ -71,5 +76,37 @@ class StockDataTransformer:
         # 날짜순 정렬 (최신순)
         sorted_data = sort_stock_data(daily_data, reverse=True)
         
-        logger.info(f"일봉 데이터 변환 완료: {len(sorted_data)}건")
+        logger.debug("일봉 데이터 변환 완료: %s건", len(sorted_data))
         return sorted_data
+    
+    def aggregate_daily_data(self, minute_data: List[MinuteData]) -> Optional[DailyData]:
+        """하루치 분봉으로 일봉 OHLCV 생성 - 추가 API 호출 없음"""
+        if not minute_data:
+            return None
+        
+        sorted_data = sort_stock_data(minute_data, reverse=False)
+        first, last = sorted_data[0], sorted_data[-1]
+        date = first.timestamp[:10]
+        
+        daily_data = DailyData(
+            stock_code=first.stock_code,
+            date=date,
+            timestamp=f"{date} 09:00:00",  # 일봉은 09:00:00으로 통일
+            open_price=first.open_price,
+            high_price=max(data.high_price for data in sorted_data),
+            low_price=min(data.low_price for data in sorted_data),
+            close_price=last.close_price,
+            volume=sum(data.volume for data in sorted_data)
+        )
+        
+        logger.debug("분봉 %s건으로 일봉 생성: %s", len(sorted_data), date)
+        return daily_data
+    
+    def reconcile_daily_data(self, derived: DailyData, official: DailyData) -> Dict[str, Tuple[object, object]]:
+        """분봉 집계 일봉과 공식 일봉 비교 - 불일치 필드 반환"""
+        fields = ['open_price', 'high_price', 'low_price', 'close_price', 'volume']
+        return {
+            field: (getattr(derived, field), getattr(official, field))
+            for field in fields
+            if getattr(derived, field) != getattr(official, field)
+        }
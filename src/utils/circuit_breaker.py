@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 차단기 상태
+STATE_CLOSED = "closed"        # 정상 - 모든 호출 통과
+STATE_OPEN = "open"            # 차단 - 호출 즉시 실패
+STATE_HALF_OPEN = "half_open"  # 시험 - 호출 1건만 통과시켜 복구 확인
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열려 호출하지 않음 - 재시도 대상 예외(RequestException/ClientError)가 아니므로 즉시 실패"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} 차단 중 ({retry_after:.0f}초 후 재시도)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """실패율 기반 차단기 - 최근 호출 중 실패 비율이 기준을 넘으면 일정 시간 호출을 막고 1건으로 복구를 시험
+
+    재시도 루프 안(시도 1회마다)에서 사용하므로 차단되면 남은 재시도도 대기 없이 끝난다.
+    """
+
+    def __init__(self, name: str, failure_rate: float, window: int, min_calls: int, open_sec: float):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_sec = open_sec
+        self._lock = threading.Lock()
+        self._outcomes = deque(maxlen=window)  # 최근 호출 결과 (True: 실패)
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._probe_started = 0.0
+        self.rejected = 0  # 차단으로 막은 호출 수
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def before_call(self) -> None:
+        """호출 전 확인 - 차단 중이면 CircuitOpenError"""
+        with self._lock:
+            if self._state == STATE_CLOSED:
+                return
+
+            elapsed = time.monotonic() - self._opened_at
+            if self._state == STATE_OPEN and elapsed >= self.open_sec:
+                self._state = STATE_HALF_OPEN
+                self._probing = False
+                logger.info("%s 차단기 시험 호출 허용", self.name)
+
+            # 반개방 상태에서는 시험 호출 1건만 통과 (결과 없이 끝난 시험 호출은 open_sec 후 다시 허용)
+            if self._state == STATE_HALF_OPEN and (not self._probing or time.monotonic() - self._probe_started >= self.open_sec):
+                self._probing = True
+                self._probe_started = time.monotonic()
+                return
+
+            self.rejected += 1
+            raise CircuitOpenError(self.name, max(0.0, self.open_sec - elapsed))
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state == STATE_HALF_OPEN:
+                self._state = STATE_CLOSED
+                self._probing = False
+                self._outcomes.clear()
+                logger.info("%s 차단기 닫힘 (복구 확인)", self.name)
+            self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == STATE_HALF_OPEN:
+                self._open()
+                return
+
+            self._outcomes.append(True)
+            if self._state == STATE_CLOSED and len(self._outcomes) >= self.min_calls:
+                failures = sum(self._outcomes)
+                if failures / len(self._outcomes) >= self.failure_rate:
+                    self._open()
+
+    def _open(self) -> None:
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._probing = False
+        logger.warning("%s 차단기 열림 - %.0f초 동안 호출 즉시 실패", self.name, self.open_sec)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """상태 조회용 - 상태, 최근 실패율, 차단 호출 수"""
+        with self._lock:
+            failures = sum(self._outcomes)
+            return {
+                "state": self._state,
+                "failure_rate": failures / len(self._outcomes) if self._outcomes else 0.0,
+                "calls": len(self._outcomes),
+                "rejected": self.rejected,
+            }
+
+
+# 클라이언트/로더는 실행마다 새로 만들어지므로 차단기는 의존성별로 프로세스에 하나
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> Optional[CircuitBreaker]:
+    """의존성(kis, dynamodb)별 차단기 - CIRCUIT_BREAKER=false면 None"""
+    if not settings.CIRCUIT_BREAKER:
+        return None
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(
+                name,
+                failure_rate=settings.CIRCUIT_FAILURE_RATE,
+                window=settings.CIRCUIT_WINDOW,
+                min_calls=settings.CIRCUIT_MIN_CALLS,
+                open_sec=settings.CIRCUIT_OPEN_SEC,
+            )
+        return breaker
+
+
+def get_circuit_states() -> Dict[str, Dict[str, Any]]:
+    """현재 프로세스의 차단기 상태 전체"""
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
@@ -1,12 +1,27 @@
-from typing import List, Dict, Any, Union, Callable, TypeVar
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+from typing import List, Dict, Any, Union, Callable, Iterable, Iterator, TypeVar
 
+from src.config.settings import settings
 from src.utils.logging import get_logger
-from src.models.domain_models import MinuteData, DailyData, StockData
+from src.models.domain_models import MinuteData, DailyData, RollupData, StockData
 
 logger = get_logger(__name__)
 
 T = TypeVar('T')
 
+# DynamoDB 아이템 레이아웃
+LAYOUT_STANDARD = "standard"  # 필드명 그대로 + stock_code/timestamp/created_at
+LAYOUT_COMPACT = "compact"    # 짧은 속성명, 지표 반올림, PK/SK와 중복되는 필드 제외
+LAYOUT_PACKED = "packed"      # 시간(또는 세션) 단위로 분봉을 한 아이템에 묶음
+
+# compact 분봉 속성명
+COMPACT_MINUTE_FIELDS = (
+    ("open_price", "o"), ("high_price", "h"), ("low_price", "l"), ("close_price", "c"),
+    ("volume", "v"), ("sma_5", "s5"), ("sma_30", "s30"),
+)
+INDICATOR_FIELDS = ("sma_5", "sma_30")
+
 
 def remove_duplicates(data_list: List[T], key_func: Callable[[T], Any]) -> List[T]:
     """중복 데이터 제거 - 키 함수 기반"""
@@ -19,7 +34,7 @@ def remove_duplicates(data_list: List[T], key_func: Callable[[T], Any]) -> List[
             seen.add(key)
             unique_data.append(item)
     
-    logger.info(f"중복 제거: {len(data_list)} -> {len(unique_data)}건")
+    logger.debug("중복 제거: %s -> %s건", len(data_list), len(unique_data))
     return unique_data
 
 
@@ -30,7 +45,7 @@ def sort_stock_data(data: List[Union[MinuteData, DailyData]], reverse: bool = Fa
     
     # MinuteData인지 확인
     if isinstance(data[0], MinuteData):
-        return sorted(data, key=lambda x: x.timestamp, reverse=reverse)
+        return sorted(data, key=lambda x: x.minute_key, reverse=reverse)
     # DailyData인지 확인
     elif isinstance(data[0], DailyData):
         return sorted(data, key=lambda x: x.date, reverse=reverse)
@@ -78,13 +93,180 @@ def to_dynamodb_item(data: Union[MinuteData, DailyData]) -> Dict[str, Any]:
     return {k: v for k, v in item.items() if v is not None}
 
 
+def iter_valid_bars(data: Iterable[Union[MinuteData, DailyData]], deduped: bool = False) -> Iterator[Union[MinuteData, DailyData]]:
+    """중복 제거 + 검증을 한 번의 순회로 처리 - deduped=True면 중복 검사 생략"""
+    seen = set()
+    
+    for bar in data:
+        # 분봉은 minute_key, 일봉은 date 기준 (먼저 나온 항목 우선)
+        if not deduped:
+            key = bar.minute_key if isinstance(bar, MinuteData) else bar.date
+            if key in seen:
+                continue
+            seen.add(key)
+        
+        if validate_stock_data(bar):
+            yield bar
+
+
+@lru_cache(maxsize=1)
+def _indicator_quant() -> Decimal:
+    return Decimal(1).scaleb(-settings.INDICATOR_SCALE)
+
+
+def round_indicator(value: Decimal) -> Decimal:
+    """지표값을 INDICATOR_SCALE 자리로 반올림 (28자리 Decimal 저장 방지)"""
+    return value.quantize(_indicator_quant(), rounding=ROUND_HALF_UP)
+
+
+def iter_dynamodb_items(data: Iterable[Union[MinuteData, DailyData]], deduped: bool = False,
+                        typed: bool = False, compact: bool = False) -> Iterator[Dict[str, Any]]:
+    """중복 제거 + 검증 + DynamoDB 아이템 변환을 한 번의 순회로 처리 (바 1건당 dict 1개)
+
+    typed=True면 low-level client용 속성 맵({"S": ...}, {"N": ...})으로 바로 만든다.
+    compact=True면 분봉을 짧은 속성명/반올림 지표로 저장한다 (일봉은 기존 형식).
+    """
+    for bar in iter_valid_bars(data, deduped):
+        if compact and isinstance(bar, MinuteData):
+            item = {"PK": bar.get_pk(), "SK": bar.get_sk()}
+            for field, name in COMPACT_MINUTE_FIELDS:
+                value = bar.__dict__[field]
+                if value is None:
+                    continue
+                if field in INDICATOR_FIELDS:
+                    value = round_indicator(value)
+                item[name] = {"N": str(value)} if typed else value
+            if typed:
+                item["PK"] = {"S": item["PK"]}
+                item["SK"] = {"S": item["SK"]}
+        # model_dump 대신 필드 dict를 직접 읽어 None이 아닌 값만 담는다
+        elif typed:
+            item = {"PK": {"S": bar.get_pk()}, "SK": {"S": bar.get_sk()}}
+            for field, value in bar.__dict__.items():
+                if value is None:
+                    continue
+                # 필드는 str 아니면 Decimal/int - Decimal은 KIS 응답 문자열 그대로 str()로 복원됨
+                item[field] = {"S": value} if type(value) is str else {"N": str(value)}
+        else:
+            item = {"PK": bar.get_pk(), "SK": bar.get_sk()}
+            for field, value in bar.__dict__.items():
+                if value is not None:
+                    item[field] = value
+        yield item
+
+
+def packed_bucket_key(timestamp: str, pack_by: str) -> str:
+    """packed 아이템 SK - hour: "YYYY-MM-DD HH", session: "YYYY-MM-DD" """
+    return timestamp[:13] if pack_by == "hour" else timestamp[:10]
+
+
+def pack_minute_bars(bars: Iterable[MinuteData], pack_by: str) -> Dict[str, Dict[str, str]]:
+    """분봉을 packed 아이템 단위로 묶음 - {SK: {"HHMM": "o,h,l,c,v,s5,s30"}}"""
+    buckets: Dict[str, Dict[str, str]] = {}
+    
+    for bar in bars:
+        sma_5 = "" if bar.sma_5 is None else str(round_indicator(bar.sma_5))
+        sma_30 = "" if bar.sma_30 is None else str(round_indicator(bar.sma_30))
+        encoded = f"{bar.open_price},{bar.high_price},{bar.low_price},{bar.close_price},{bar.volume},{sma_5},{sma_30}"
+        
+        bucket = buckets.setdefault(packed_bucket_key(bar.timestamp, pack_by), {})
+        bucket[bar.timestamp[11:13] + bar.timestamp[14:16]] = encoded
+    
+    return buckets
+
+
+def _unpack_minute_item(item: Dict[str, Any], stock_code: str) -> List[MinuteData]:
+    """packed 아이템을 분봉 목록으로 복원"""
+    session_date = item['SK'][:10]
+    bars = []
+    
+    for name, encoded in item.items():
+        if len(name) != 4 or not name.isdigit():
+            continue
+        open_price, high_price, low_price, close_price, volume, sma_5, sma_30 = encoded.split(",")
+        bars.append(MinuteData(
+            stock_code=stock_code,
+            timestamp=f"{session_date} {name[:2]}:{name[2:]}:00",
+            open_price=Decimal(open_price),
+            high_price=Decimal(high_price),
+            low_price=Decimal(low_price),
+            close_price=Decimal(close_price),
+            volume=int(volume),
+            sma_5=Decimal(sma_5) if sma_5 else None,
+            sma_30=Decimal(sma_30) if sma_30 else None,
+        ))
+    
+    return bars
+
+
+def minute_data_from_item(item: Dict[str, Any], stock_code: str) -> MinuteData:
+    """DynamoDB 분봉 아이템(standard/compact)을 MinuteData로 복원"""
+    if 'o' in item:
+        return MinuteData(
+            stock_code=stock_code,
+            timestamp=item['SK'],
+            open_price=item['o'],
+            high_price=item['h'],
+            low_price=item['l'],
+            close_price=item['c'],
+            volume=int(item['v']),
+            sma_5=item.get('s5'),
+            sma_30=item.get('s30'),
+        )
+    
+    # 저장된 created_at만 넘긴다 (없으면 model_fields_set에 남지 않아 조회 시각과 구분됨)
+    stored = {'created_at': item['created_at']} if 'created_at' in item else {}
+    return MinuteData(
+        stock_code=item.get('stock_code', stock_code),
+        timestamp=item['SK'],
+        open_price=item['open_price'],
+        high_price=item['high_price'],
+        low_price=item['low_price'],
+        close_price=item['close_price'],
+        volume=int(item['volume']),
+        sma_5=item.get('sma_5'),
+        sma_30=item.get('sma_30'),
+        **stored,
+    )
+
+
+def minute_data_from_items(items: Iterable[Dict[str, Any]], stock_code: str) -> List[MinuteData]:
+    """레이아웃이 섞인 분봉 아이템들을 시간순 MinuteData 목록으로 복원 (같은 분은 1건만)"""
+    bars: Dict[int, MinuteData] = {}
+    for item in items:
+        # packed 아이템의 SK에는 분 단위가 없다
+        if ':' in item['SK']:
+            bar = minute_data_from_item(item, stock_code)
+            bars[bar.minute_key] = bar
+        else:
+            for bar in _unpack_minute_item(item, stock_code):
+                bars[bar.minute_key] = bar
+    return [bars[minute_key] for minute_key in sorted(bars)]
+
+
+def rollup_data_from_item(item: Dict[str, Any]) -> RollupData:
+    """DynamoDB 상위 주기 봉 아이템을 RollupData로 복원"""
+    return RollupData(
+        stock_code=item['stock_code'],
+        interval=int(item['interval']),
+        timestamp=item['SK'],
+        open_price=item['open_price'],
+        high_price=item['high_price'],
+        low_price=item['low_price'],
+        close_price=item['close_price'],
+        volume=int(item['volume']),
+        bar_count=int(item['bar_count']),
+        created_at=item['created_at'],
+    )
+
+
 def to_dynamodb_items(data: List[Union[MinuteData, DailyData]]) -> List[Dict[str, Any]]:
     """여러 데이터를 DynamoDB 아이템 리스트로 변환"""
     if not data:
         return []
     
-    logger.info(f"DynamoDB 아이템 변환 시작: {len(data)}건")
+    logger.debug("DynamoDB 아이템 변환 시작: %s건", len(data))
     items = [to_dynamodb_item(item) for item in data]
-    logger.info(f"DynamoDB 아이템 변환 완료: {len(items)}건")
+    logger.debug("DynamoDB 아이템 변환 완료: %s건", len(items))
     
     return items
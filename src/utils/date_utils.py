@@ -1,9 +1,19 @@
-from datetime import datetime, date, time
+import time
+from datetime import datetime, date
+
+from src.utils.trading_calendar import get_trading_calendar
+
+# 같은 초 안의 반복 호출은 포맷 결과 재사용 (초 단위 값, 문자열)
+_timestamp_cache = (-1, "")
 
 
 def get_current_timestamp() -> str:
     """현재 타임스탬프를 문자열로 반환"""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _timestamp_cache
+    current_second = int(time.time())
+    if _timestamp_cache[0] != current_second:
+        _timestamp_cache = (current_second, datetime.fromtimestamp(current_second).strftime("%Y-%m-%d %H:%M:%S"))
+    return _timestamp_cache[1]
 
 
 def format_kis_date_to_iso(date_str: str) -> str:
@@ -24,29 +34,26 @@ def format_kis_datetime_to_iso(date_str: str, time_str: str) -> str:
 
 
 def is_trading_day(target_date: date = None) -> bool:
-    """거래일인지 확인 (평일만 거래)"""
+    """거래일인지 확인 (주말, 휴장일 제외)"""
     if target_date is None:
         target_date = datetime.now().date()
     
-    # 주말(토요일=5, 일요일=6) 제외
-    return target_date.weekday() < 5
+    return get_trading_calendar().is_trading_day(target_date)
 
 
 def is_trading_time(current_time: datetime = None) -> bool:
-    """거래시간인지 확인 (평일 09:00-15:30)"""
+    """거래시간인지 확인 (거래 캘린더의 세션 기준, 기본 09:00-15:30)"""
     if current_time is None:
         current_time = datetime.now()
     
     # 거래일 체크
-    if not is_trading_day(current_time.date()):
+    session = get_trading_calendar().get_session(current_time.date())
+    if session is None:
         return False
     
-    # 거래시간 체크 (09:00-15:30)
-    market_open = time(9, 0)
-    market_close = time(15, 30)
+    # 거래시간 체크
     current_time_only = current_time.time()
-    
-    return market_open <= current_time_only <= market_close
+    return session.open_time <= current_time_only <= session.close_time
 
 
 def get_market_status(current_time: datetime = None) -> str:
@@ -65,8 +72,8 @@ def get_market_status(current_time: datetime = None) -> str:
     if is_trading_time(current_time):
         return "장중"
     else:
-        hour = current_time.hour
-        if hour < 9:
+        session = get_trading_calendar().get_session(current_time.date())
+        if current_time.time() < session.open_time:
             return "장 시작 전"
         else:
             return "장 마감"
\ No newline at end of file
@@ -0,0 +1,24 @@
+import json
+from typing import Any, Optional, Union
+
+# 선택 의존성: orjson > msgspec > 표준 json 순으로 사용
+FAST_JSON_BACKEND: Optional[str] = None
+
+try:
+    import orjson
+
+    FAST_JSON_BACKEND = "orjson"
+    _fast_loads = orjson.loads
+except ImportError:
+    try:
+        import msgspec
+
+        FAST_JSON_BACKEND = "msgspec"
+        _fast_loads = msgspec.json.Decoder().decode
+    except ImportError:
+        _fast_loads = json.loads
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """JSON 파싱 - 고속 라이브러리가 있으면 원본 바이트를 바로 파싱"""
+    return _fast_loads(content)
@@ -1,28 +1,135 @@
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
 from src.config.settings import settings
 
+# 모든 로거가 공유하는 핸들러 (최초 로그 호출 시 생성)
+_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+_module_levels: Optional[Dict[str, int]] = None
+_config_lock = threading.RLock()
 
-def get_logger(name: str) -> logging.Logger:
-    """로거 생성 및 설정"""
-    logger = logging.getLogger(name)
 
-    # 중복 핸들러 방지
-    if logger.handlers:
-        return logger
+class _LazyQueueHandler(QueueHandler):
+    """포맷팅 없이 레코드만 큐에 넣는 핸들러 - 포맷/출력은 백그라운드 스레드에서"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
-    # 로그 레벨 설정 
-    logger.setLevel(getattr(logging, settings.LOG_LEVEL.upper()))
-    
-    # 포맷터 설정
-    formatter = logging.Formatter(
+
+def _create_formatter() -> logging.Formatter:
+    return logging.Formatter(
         fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
-    
+
+
+def _get_handler() -> logging.Handler:
+    """공용 핸들러 생성 - LOG_ASYNC면 큐 + 백그라운드 writer"""
+    global _handler, _listener
+    if _handler is not None:
+        return _handler
+
     # 콘솔 핸들러
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    return logger
\ No newline at end of file
+    console_handler.setFormatter(_create_formatter())
+
+    if settings.LOG_ASYNC:
+        log_queue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        _handler = _LazyQueueHandler(log_queue)
+    else:
+        _handler = console_handler
+
+    return _handler
+
+
+def _get_level(name: str) -> int:
+    """모듈별 로그 레벨 - LOG_LEVELS에서 가장 구체적인 접두어 우선, 없으면 LOG_LEVEL"""
+    global _module_levels
+    if _module_levels is None:
+        _module_levels = {}
+        for entry in settings.LOG_LEVELS.split(","):
+            if "=" in entry:
+                module, level = entry.split("=", 1)
+                _module_levels[module.strip()] = getattr(logging, level.strip().upper())
+
+    matched = [module for module in _module_levels if name == module or name.startswith(module + ".")]
+    if matched:
+        return _module_levels[max(matched, key=len)]
+    return getattr(logging, settings.LOG_LEVEL.upper())
+
+
+class _LazyConfigHandler(logging.Handler):
+    """로거별 핸들러 - 첫 레코드 때 레벨 설정과 공용 핸들러 생성 (import 시점에 settings를 읽지 않도록)
+
+    설정 전 로거 레벨은 최저값이라 첫 레코드가 반드시 여기로 들어오고, 이후에는 공용 핸들러로 넘기기만 한다.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__()
+        self._logger = logger
+        self._configured = False
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if not self._configured:
+            self._configure()
+            # 설정 전에 통과한 레코드는 실제 레벨로 다시 거름
+            if record.levelno < self._logger.getEffectiveLevel():
+                return False
+        return _get_handler().handle(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.handle(record)
+
+    def _configure(self) -> None:
+        with _config_lock:
+            if not self._configured:
+                # 로그 레벨 설정 (시작 시 1회, 실행 중 변경하지 않음)
+                self._logger.setLevel(_get_level(self._logger.name))
+                _get_handler()
+                self._configured = True
+
+
+def get_logger(name: str) -> logging.Logger:
+    """로거 생성 - 설정(settings)은 첫 로그 호출 때 읽음"""
+    logger = logging.getLogger(name)
+    with _config_lock:
+        # 다른 곳에서 핸들러까지 설정한 로거나 이미 준비한 로거는 그대로 사용
+        if not logger.handlers:
+            logger.setLevel(1)
+            logger.addHandler(_LazyConfigHandler(logger))
+    return logger
+
+
+class RunSummary:
+    """파이프라인 1회 실행 요약 - 단계별 INFO 대신 종료 시 1건만 기록"""
+
+    def __init__(self, logger: logging.Logger, pipeline: str, stock_code: str):
+        self.logger = logger
+        self.pipeline = pipeline
+        self.stock_code = stock_code
+        self.counts: Dict[str, int] = {}
+        self.success = False
+        self._started_at = time.perf_counter()
+
+    def count(self, step: str, value: int) -> None:
+        """단계별 처리 건수 기록"""
+        self.counts[step] = value
+
+    def emit(self) -> None:
+        """요약 레코드 출력"""
+        elapsed_ms = (time.perf_counter() - self._started_at) * 1000
+        level = logging.INFO if self.success else logging.ERROR
+        if self.logger.isEnabledFor(level):
+            counts_text = ", ".join(f"{step} {value}건" for step, value in self.counts.items())
+            self.logger.log(level, "[%s] %s %s - %s (%.0fms)", self.pipeline, self.stock_code,
+                            "완료" if self.success else "실패", counts_text or "처리 없음", elapsed_ms)
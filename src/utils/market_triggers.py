@@ -0,0 +1,75 @@
+from datetime import datetime, time, timedelta
+from typing import Optional
+
+from apscheduler.triggers.base import BaseTrigger
+
+from src.utils.trading_calendar import TradingCalendar, get_trading_calendar
+
+# 휴장일이 연속돼도 이 기간 안에는 다음 거래일이 있다고 가정
+MAX_LOOKAHEAD_DAYS = 30
+
+
+class TradingMinuteTrigger(BaseTrigger):
+    """거래 세션 안의 매 분 정각에만 실행 (휴장일, 장외 시간 제외)"""
+
+    def __init__(self, calendar: TradingCalendar = None):
+        self.calendar = calendar or get_trading_calendar()
+
+    def get_next_fire_time(self, previous_fire_time: Optional[datetime], now: datetime) -> Optional[datetime]:
+        # 다음 분 정각 후보 (이전 실행 이후 또는 현재 시각 올림)
+        if previous_fire_time is not None:
+            candidate = previous_fire_time.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        else:
+            candidate = now.replace(second=0, microsecond=0)
+            if candidate < now:
+                candidate += timedelta(minutes=1)
+
+        for _ in range(MAX_LOOKAHEAD_DAYS):
+            session = self.calendar.get_session(candidate.date())
+            if session is not None:
+                open_at = datetime.combine(candidate.date(), session.open_time, tzinfo=candidate.tzinfo)
+                close_at = datetime.combine(candidate.date(), session.close_time, tzinfo=candidate.tzinfo)
+                if candidate <= close_at:
+                    return max(candidate, open_at)
+
+            # 다음 날 자정부터 다시 탐색
+            candidate = datetime.combine(candidate.date() + timedelta(days=1), time(0, 0), tzinfo=candidate.tzinfo)
+
+        return None
+
+    def __str__(self):
+        return "trading_minute"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}>"
+
+
+class SessionCloseTrigger(BaseTrigger):
+    """거래일 장 마감 후 1회 실행 - 마감 + delay와 not_before 중 늦은 시각"""
+
+    def __init__(self, delay: timedelta, not_before: time = time(0, 0), calendar: TradingCalendar = None):
+        self.delay = delay
+        self.not_before = not_before
+        self.calendar = calendar or get_trading_calendar()
+
+    def get_next_fire_time(self, previous_fire_time: Optional[datetime], now: datetime) -> Optional[datetime]:
+        start = previous_fire_time + timedelta(seconds=1) if previous_fire_time is not None else now
+        target_date = start.date()
+
+        for _ in range(MAX_LOOKAHEAD_DAYS):
+            session = self.calendar.get_session(target_date)
+            if session is not None:
+                close_at = datetime.combine(target_date, session.close_time, tzinfo=start.tzinfo) + self.delay
+                not_before_at = datetime.combine(target_date, self.not_before, tzinfo=start.tzinfo)
+                fire_at = max(close_at, not_before_at)
+                if fire_at >= start:
+                    return fire_at
+            target_date += timedelta(days=1)
+
+        return None
+
+    def __str__(self):
+        return f"session_close[delay={self.delay}, not_before={self.not_before}]"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} (delay={self.delay!r}, not_before={self.not_before!r})>"
@@ -0,0 +1,65 @@
+from datetime import date, timedelta
+from typing import List
+
+from src.config.settings import settings
+
+# 분봉 파티션 버킷 전략 (DYNAMODB_MINUTE_BUCKET)
+BUCKET_NONE = ""        # STOCK#005930#MINUTE (종목당 파티션 1개)
+BUCKET_MONTH = "month"  # STOCK#005930#MINUTE#2025-09
+BUCKET_DAY = "day"      # STOCK#005930#MINUTE#2025-09-11
+
+
+def minute_base_pk(stock_code: str) -> str:
+    """버킷 없는 분봉 파티션 키"""
+    return f"STOCK#{stock_code}#MINUTE"
+
+
+def minute_bucket_of(date_str: str, strategy: str = None) -> str:
+    """일자(YYYY-MM-DD...)가 속한 버킷 - 버킷 전략이 없으면 빈 문자열"""
+    strategy = settings.DYNAMODB_MINUTE_BUCKET if strategy is None else strategy
+    if strategy == BUCKET_MONTH:
+        return date_str[:7]
+    if strategy == BUCKET_DAY:
+        return date_str[:10]
+    return ""
+
+
+def minute_partition_key(stock_code: str, date_str: str, strategy: str = None) -> str:
+    """분봉 파티션 키 - 일자/시각 문자열의 앞부분으로 버킷 결정"""
+    bucket = minute_bucket_of(date_str, strategy)
+    return f"{minute_base_pk(stock_code)}#{bucket}" if bucket else minute_base_pk(stock_code)
+
+
+def _previous_bucket_date(day: date, strategy: str) -> date:
+    """직전 버킷에 속한 날짜"""
+    if strategy == BUCKET_MONTH:
+        return day.replace(day=1) - timedelta(days=1)
+    return day - timedelta(days=1)
+
+
+def minute_partition_keys(stock_code: str, start_date: date, end_date: date, strategy: str = None) -> List[str]:
+    """기간(양 끝 포함)을 덮는 분봉 파티션 키 목록 (과거 -> 최근)"""
+    strategy = settings.DYNAMODB_MINUTE_BUCKET if strategy is None else strategy
+    if not strategy:
+        return [minute_base_pk(stock_code)]
+
+    keys = []
+    day = end_date
+    while day >= start_date:
+        keys.append(minute_partition_key(stock_code, day.isoformat(), strategy))
+        day = _previous_bucket_date(day, strategy)
+    return keys[::-1]
+
+
+def recent_partition_keys(stock_code: str, latest_date: date, count: int, strategy: str = None) -> List[str]:
+    """latest_date가 속한 버킷부터 과거로 count개 (최근 -> 과거)"""
+    strategy = settings.DYNAMODB_MINUTE_BUCKET if strategy is None else strategy
+    if not strategy:
+        return [minute_base_pk(stock_code)]
+
+    keys = []
+    day = latest_date
+    for _ in range(count):
+        keys.append(minute_partition_key(stock_code, day.isoformat(), strategy))
+        day = _previous_bucket_date(day, strategy)
+    return keys
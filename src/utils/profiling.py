@@ -0,0 +1,160 @@
+import cProfile
+import signal
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Any, Dict, Optional, Set, Tuple
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# PROFILE_MODE 값
+MODE_OFF = ""
+MODE_CPROFILE = "cprofile"
+MODE_TRACEMALLOC = "tracemalloc"
+
+PROFILE_DIR = Path("data/profiles")
+TRACEMALLOC_TOP = 50  # tracemalloc 리포트에 남길 할당 위치 수
+
+
+class RunProfiler:
+    """파이프라인 실행 샘플링 프로파일러 - N번째 실행, 느린 실행 다음 회차, 시그널로 켠 동안의 실행만 기록"""
+
+    def __init__(self, profile_dir: Path = PROFILE_DIR):
+        self.profile_dir = profile_dir
+        self._mode: Optional[str] = None
+        self._forced = False
+        self._lock = threading.Lock()
+        # cProfile/tracemalloc는 프로세스에 하나만 켤 수 있으므로 동시 실행은 건너뜀
+        self._active = threading.Lock()
+        self._run_counts: Dict[Tuple[str, str], int] = {}
+        self._armed: Set[Tuple[str, str]] = set()
+
+    @property
+    def mode(self) -> str:
+        if self._mode is None:
+            self._mode = settings.PROFILE_MODE.lower()
+        return self._mode
+
+    def toggle(self) -> bool:
+        """모든 실행 프로파일링 켜기/끄기 (PROFILE_MODE가 비어 있으면 cProfile 사용)"""
+        self._forced = not self._forced
+        return self._forced
+
+    def _should_profile(self, key: Tuple[str, str]) -> bool:
+        if self._forced:
+            return True
+        with self._lock:
+            count = self._run_counts.get(key, 0) + 1
+            self._run_counts[key] = count
+            if key in self._armed:
+                self._armed.discard(key)
+                return True
+            every_n = settings.PROFILE_EVERY_N
+            return every_n > 0 and count % every_n == 0
+
+    def _check_slow(self, key: Tuple[str, str], elapsed_ms: float) -> None:
+        """PROFILE_SLOW_MS를 넘긴 실행은 같은 파이프라인/종목의 다음 실행을 프로파일링"""
+        slow_ms = settings.PROFILE_SLOW_MS
+        if slow_ms > 0 and elapsed_ms > slow_ms:
+            with self._lock:
+                self._armed.add(key)
+            logger.warning("느린 실행 감지 (%s %s: %.0fms > %sms) - 다음 실행 프로파일링", key[0], key[1], elapsed_ms, slow_ms)
+
+    def run(self, pipeline: str, stock_code: str, func: Callable, *args, **kwargs) -> Any:
+        """func 실행 - 꺼져 있으면 모드 확인 1회 외 추가 비용 없음"""
+        if self.mode == MODE_OFF and not self._forced:
+            return func(*args, **kwargs)
+
+        key = (pipeline, stock_code)
+        if not self._should_profile(key) or not self._active.acquire(blocking=False):
+            started_at = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._check_slow(key, (time.perf_counter() - started_at) * 1000)
+
+        try:
+            return self._profile(key, func, *args, **kwargs)
+        finally:
+            self._active.release()
+
+    def _profile(self, key: Tuple[str, str], func: Callable, *args, **kwargs) -> Any:
+        mode = self.mode or MODE_CPROFILE
+        profiler = None
+        if mode == MODE_TRACEMALLOC:
+            tracemalloc.start()
+        else:
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        started_at = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed_ms = (time.perf_counter() - started_at) * 1000
+            if profiler is not None:
+                profiler.disable()
+                self._write(key, elapsed_ms, ".prof", profiler.dump_stats)
+            else:
+                snapshot = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+                self._write(key, elapsed_ms, ".txt", lambda path: self._dump_tracemalloc(snapshot, path))
+
+    @staticmethod
+    def _dump_tracemalloc(snapshot: tracemalloc.Snapshot, path: Path) -> None:
+        stats = snapshot.statistics("lineno")
+        with open(path, "w") as f:
+            f.write(f"총 {sum(stat.size for stat in stats) / 1024:.1f} KiB, 할당 위치 상위 {TRACEMALLOC_TOP}개\n")
+            for stat in stats[:TRACEMALLOC_TOP]:
+                f.write(f"{stat}\n")
+
+    def _write(self, key: Tuple[str, str], elapsed_ms: float, suffix: str, dump: Callable[[Path], None]) -> None:
+        """data/profiles/<파이프라인>_<종목>_<시각>_<소요ms>.<확장자> 저장 후 오래된 파일 정리"""
+        pipeline, stock_code = key
+        try:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            path = self.profile_dir / f"{pipeline}_{stock_code}_{datetime.now():%Y%m%d-%H%M%S-%f}_{elapsed_ms:.0f}ms{suffix}"
+            dump(path)
+            logger.info("프로파일 저장: %s", path)
+            self._rotate()
+        except OSError as e:
+            logger.error("프로파일 저장 실패: %s", e)
+
+    def _rotate(self) -> None:
+        """최근 PROFILE_KEEP개만 남김"""
+        profiles = [path for path in self.profile_dir.iterdir() if path.suffix in (".prof", ".txt")]
+        profiles.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+        for path in profiles[settings.PROFILE_KEEP:]:
+            path.unlink(missing_ok=True)
+
+
+_profiler = RunProfiler()
+
+
+def profiled(pipeline: str) -> Callable:
+    """파이프라인 함수(stock_code 인자) 프로파일링 데코레이터"""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(stock_code: str = None, *args, **kwargs) -> Any:
+            return _profiler.run(pipeline, stock_code or settings.STOCK_CODE, func, stock_code, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def install_profile_signal(signum: int = getattr(signal, "SIGUSR1", None)) -> None:
+    """시그널(기본 SIGUSR1)로 프로파일링 켜기/끄기 - 메인 스레드에서 호출"""
+    if signum is None:
+        return
+
+    def handle(signum, frame):
+        # 시그널 핸들러에서는 플래그만 바꾸고 로그는 남기지 않음 (로깅 락 재진입 방지)
+        _profiler.toggle()
+
+    signal.signal(signum, handle)
@@ -0,0 +1,74 @@
+import fcntl
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class FileRateLimiter:
+    """프로세스 간 공유 호출 제한 - 파일 락 기반 토큰 버킷"""
+
+    def __init__(self, rate_per_sec: int, state_path: Path = Path("data/kis_rate.state")):
+        self.rate_per_sec = max(1, rate_per_sec)
+        self.state_path = state_path
+
+        # 디렉토리 생성
+        self.state_path.parent.mkdir(exist_ok=True)
+
+    def acquire(self) -> None:
+        """호출 1건 예산 획득 (부족하면 대기)"""
+        while True:
+            wait_sec = self._try_acquire()
+            if wait_sec <= 0:
+                return
+            time.sleep(wait_sec)
+
+    def _try_acquire(self) -> float:
+        """예산 차감 시도 - 성공 시 0, 실패 시 대기할 시간 반환"""
+        with open(self.state_path, 'a+') as state_file:
+            fcntl.flock(state_file.fileno(), fcntl.LOCK_EX)
+            try:
+                state_file.seek(0)
+                raw = state_file.read()
+                now = time.time()
+
+                try:
+                    state = json.loads(raw) if raw else {}
+                except json.JSONDecodeError:
+                    state = {}
+
+                # 경과 시간만큼 토큰 보충 (최대 1초분)
+                tokens = state.get('tokens', float(self.rate_per_sec))
+                updated_at = state.get('updated_at', now)
+                tokens = min(float(self.rate_per_sec), tokens + (now - updated_at) * self.rate_per_sec)
+
+                wait_sec = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait_sec = (1 - tokens) / self.rate_per_sec
+
+                state_file.seek(0)
+                state_file.truncate()
+                json.dump({'tokens': tokens, 'updated_at': now}, state_file)
+                state_file.flush()
+                return wait_sec
+            finally:
+                fcntl.flock(state_file.fileno(), fcntl.LOCK_UN)
+
+
+_kis_rate_limiter: Optional[FileRateLimiter] = None
+
+
+def get_kis_rate_limiter() -> FileRateLimiter:
+    """KIS 호출 제한기 (모든 워커 프로세스가 같은 상태 파일 공유)"""
+    global _kis_rate_limiter
+    if _kis_rate_limiter is None:
+        _kis_rate_limiter = FileRateLimiter(settings.KIS_RATE_LIMIT_PER_SEC)
+        logger.debug("KIS 호출 제한 설정: 초당 %s건", settings.KIS_RATE_LIMIT_PER_SEC)
+    return _kis_rate_limiter
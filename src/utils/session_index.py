@@ -0,0 +1,114 @@
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+from src.utils.trading_calendar import REGULAR_SESSION, TradingSession, get_trading_calendar
+
+MINUTES_PER_DAY = 1440
+# 장 마감 동시호가(단일가 매매) 시간 - 이 동안 분봉 없이 마감 시각에 종가 분봉 1건
+CLOSING_AUCTION_MINUTES = 10
+
+
+class SessionIndex:
+    """거래 세션의 분 단위 슬롯 인덱스
+
+    접속매매 구간(정규장 09:00-15:20 -> 0..380) + 마감 동시호가 종가 분봉(15:30 -> 381).
+    동시호가 중(15:21-15:29)에는 분봉이 없으므로 슬롯도 없다.
+    """
+
+    def __init__(self, session: TradingSession):
+        self.session = session
+        self.open_minute = session.open_time.hour * 60 + session.open_time.minute
+        self.close_minute = session.close_time.hour * 60 + session.close_time.minute
+
+        # 슬롯 -> 하루 중 분 (접속매매 마지막 분 다음이 바로 종가 분봉)
+        continuous_end = self.close_minute - CLOSING_AUCTION_MINUTES
+        self._minutes = list(range(self.open_minute, continuous_end + 1)) + [self.close_minute]
+        self._slots = {minute: slot for slot, minute in enumerate(self._minutes)}
+        self.size = len(self._minutes)
+        self.closing_slot = self.size - 1
+
+        # 슬롯 -> "HH:MM:00" 문자열 (저장/CSV 경계에서만 사용)
+        self._time_strings = [f"{minute // 60:02d}:{minute % 60:02d}:00" for minute in self._minutes]
+
+    def slot_of(self, minute_of_day: int) -> int:
+        """하루 중 분(0..1439)을 슬롯으로 변환 (세션 밖 또는 동시호가 중이면 -1)"""
+        return self._slots.get(minute_of_day, -1)
+
+    def slot_of_kis_time(self, time_str: str) -> int:
+        """KIS 시간(HHMMSS)을 슬롯으로 변환"""
+        return self.slot_of(int(time_str[:2]) * 60 + int(time_str[2:4]))
+
+    def last_slot_at(self, minute_of_day: int) -> int:
+        """해당 분까지 도래한 마지막 슬롯 (개장 전이면 -1)"""
+        return bisect_right(self._minutes, minute_of_day) - 1
+
+    def minute_of(self, slot: int) -> int:
+        """슬롯을 하루 중 분으로 변환"""
+        return self._minutes[slot]
+
+    def format_time(self, slot: int) -> str:
+        """슬롯을 "HH:MM:SS" 문자열로 변환"""
+        return self._time_strings[slot]
+
+    def missing_slots(self, present_slots: Iterable[int], last_slot: int = None) -> List[int]:
+        """0..last_slot 중 비어 있는 슬롯 목록"""
+        last_slot = self.size - 1 if last_slot is None else min(last_slot, self.size - 1)
+        present = set(present_slots)
+        return [slot for slot in range(last_slot + 1) if slot not in present]
+
+
+@lru_cache(maxsize=8)
+def get_session_index(session: TradingSession = REGULAR_SESSION) -> SessionIndex:
+    """세션별 인덱스 (세션 종류가 몇 개 없으므로 캐시)"""
+    return SessionIndex(session)
+
+
+def get_session_index_for(target_date: date) -> Optional[SessionIndex]:
+    """해당 날짜의 세션 인덱스 (휴장일이면 None)"""
+    session = get_trading_calendar().get_session(target_date)
+    return get_session_index(session) if session is not None else None
+
+
+@lru_cache(maxsize=64)
+def _day_number(date_str: str) -> int:
+    """KIS 날짜(YYYYMMDD)를 일 번호로 변환 (날짜 수가 적어 캐시)"""
+    return date(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:8])).toordinal()
+
+
+def to_minute_key(date_str: str, time_str: str) -> int:
+    """KIS 날짜(YYYYMMDD)+시간(HHMMSS)을 정수 분 키로 변환 - 정렬/비교용"""
+    return _day_number(date_str) * MINUTES_PER_DAY + int(time_str[:2]) * 60 + int(time_str[2:4])
+
+
+def timestamp_to_minute_key(timestamp: str) -> int:
+    """"YYYY-MM-DD HH:MM:SS" 문자열을 정수 분 키로 변환"""
+    return to_minute_key(timestamp[:4] + timestamp[5:7] + timestamp[8:10], timestamp[11:13] + timestamp[14:16])
+
+
+def minute_key_to_date(minute_key: int) -> date:
+    """정수 분 키의 날짜"""
+    return date.fromordinal(minute_key // MINUTES_PER_DAY)
+
+
+@lru_cache(maxsize=64)
+def _date_string(day_number: int) -> str:
+    """일 번호를 "YYYY-MM-DD"로 변환 (날짜 수가 적어 캐시)"""
+    return date.fromordinal(day_number).isoformat()
+
+
+def minute_key_to_timestamp(minute_key: int) -> str:
+    """정수 분 키를 "YYYY-MM-DD HH:MM:SS" 문자열로 변환 - 저장/CSV 경계용"""
+    day_number, minute_of_day = divmod(minute_key, MINUTES_PER_DAY)
+    return f"{_date_string(day_number)} {minute_of_day // 60:02d}:{minute_of_day % 60:02d}:00"
+
+
+def session_minute_keys(target_date: date) -> List[int]:
+    """해당 날짜 세션의 모든 분 키 (휴장일이면 빈 목록)"""
+    index = get_session_index_for(target_date)
+    if index is None:
+        return []
+    base = target_date.toordinal() * MINUTES_PER_DAY
+    return [base + index.minute_of(slot) for slot in range(index.size)]
+
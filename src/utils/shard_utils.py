@@ -0,0 +1,75 @@
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import List
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def shard_weight(worker_id: int, stock_code: str) -> int:
+    """워커-종목 조합의 결정적 해시 가중치"""
+    return zlib.crc32(f"{worker_id}:{stock_code}".encode())
+
+
+def assign_owner(stock_code: str, worker_ids: List[int]) -> int:
+    """종목 담당 워커 결정 - 가중치가 가장 큰 워커가 소유 (rendezvous hashing)
+
+    워커가 빠지거나 추가돼도 해당 워커의 종목만 이동한다.
+    """
+    return max(worker_ids, key=lambda worker_id: shard_weight(worker_id, stock_code))
+
+
+class ShardCoordinator:
+    """로컬 파일 lease 기반 샤드 분배"""
+
+    def __init__(self, worker_id: int, lease_dir: Path = Path("data/workers")):
+        self.worker_id = worker_id
+        self.lease_dir = lease_dir
+        self.lease_ttl = settings.WORKER_LEASE_TTL_SEC
+
+        # 디렉토리 생성
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+
+    def _lease_path(self, worker_id: int) -> Path:
+        return self.lease_dir / f"worker-{worker_id}.lease"
+
+    def heartbeat(self) -> None:
+        """lease 갱신 - 원자적 쓰기"""
+        lease_path = self._lease_path(self.worker_id)
+        temp_path = lease_path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump({'worker_id': self.worker_id, 'pid': os.getpid(), 'updated_at': time.time()}, f)
+        temp_path.replace(lease_path)
+
+    def release(self) -> None:
+        """lease 반납 (정상 종료 시 즉시 재분배)"""
+        try:
+            self._lease_path(self.worker_id).unlink()
+        except FileNotFoundError:
+            pass
+
+    def get_live_workers(self) -> List[int]:
+        """lease가 만료되지 않은 워커 목록"""
+        now = time.time()
+        live_workers = {self.worker_id}
+
+        for lease_path in self.lease_dir.glob("worker-*.lease"):
+            try:
+                if now - lease_path.stat().st_mtime <= self.lease_ttl:
+                    live_workers.add(int(lease_path.stem.split("-", 1)[1]))
+            except (FileNotFoundError, ValueError):
+                continue
+
+        return sorted(live_workers)
+
+    def get_my_stock_codes(self, stock_codes: List[str]) -> List[str]:
+        """현재 살아 있는 워커 기준으로 이 워커가 담당할 종목"""
+        live_workers = self.get_live_workers()
+        my_codes = [code for code in stock_codes if assign_owner(code, live_workers) == self.worker_id]
+        logger.debug("워커 %s 담당 종목: %s/%s (활성 워커 %s)", self.worker_id, len(my_codes), len(stock_codes), len(live_workers))
+        return my_codes
@@ -0,0 +1,99 @@
+import json
+from abc import ABC, abstractmethod
+from datetime import date, time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Set
+
+from src.config.settings import settings
+
+
+class TradingSession(NamedTuple):
+    """정규장 시작/마감 시각"""
+    open_time: time
+    close_time: time
+
+
+REGULAR_SESSION = TradingSession(time(9, 0), time(15, 30))
+
+# KRX 휴장일 (주말 제외, 연말 휴장일 포함)
+KRX_HOLIDAYS: Set[date] = {
+    # 2025
+    date(2025, 1, 1), date(2025, 1, 27), date(2025, 1, 28), date(2025, 1, 29), date(2025, 1, 30),
+    date(2025, 3, 3), date(2025, 5, 1), date(2025, 5, 5), date(2025, 5, 6), date(2025, 6, 3),
+    date(2025, 6, 6), date(2025, 8, 15), date(2025, 10, 3), date(2025, 10, 6), date(2025, 10, 7),
+    date(2025, 10, 8), date(2025, 10, 9), date(2025, 12, 25), date(2025, 12, 31),
+    # 2026
+    date(2026, 1, 1), date(2026, 2, 16), date(2026, 2, 17), date(2026, 2, 18), date(2026, 3, 2),
+    date(2026, 5, 1), date(2026, 5, 5), date(2026, 5, 25), date(2026, 6, 3), date(2026, 8, 17),
+    date(2026, 9, 24), date(2026, 9, 25), date(2026, 10, 5), date(2026, 10, 9), date(2026, 12, 25),
+    date(2026, 12, 31),
+}
+
+# 특수 세션 (연초 개장일 10시 개장, 수능일 10시 개장/16시 30분 마감)
+KRX_SPECIAL_SESSIONS: Dict[date, TradingSession] = {
+    date(2025, 1, 2): TradingSession(time(10, 0), time(15, 30)),
+    date(2025, 11, 13): TradingSession(time(10, 0), time(16, 30)),
+    date(2026, 1, 2): TradingSession(time(10, 0), time(15, 30)),
+    date(2026, 11, 19): TradingSession(time(10, 0), time(16, 30)),
+}
+
+
+class TradingCalendar(ABC):
+    """거래 캘린더 인터페이스 - 날짜별 세션 반환 (휴장이면 None)"""
+
+    @abstractmethod
+    def get_session(self, target_date: date) -> Optional[TradingSession]:
+        ...
+
+    def is_trading_day(self, target_date: date) -> bool:
+        return self.get_session(target_date) is not None
+
+
+class KRXTradingCalendar(TradingCalendar):
+    """KRX 거래 캘린더 - 내장 휴장일 테이블 + 선택적 JSON 파일 확장"""
+
+    def __init__(self, holidays: Set[date] = None, special_sessions: Dict[date, TradingSession] = None):
+        self.holidays = set(KRX_HOLIDAYS if holidays is None else holidays)
+        self.special_sessions = dict(KRX_SPECIAL_SESSIONS if special_sessions is None else special_sessions)
+
+    def load_file(self, path: Path) -> None:
+        """휴장일/특수 세션 추가 로드
+
+        형식: {"holidays": ["2027-01-01"], "sessions": {"2027-11-18": ["10:00", "16:30"]}}
+        """
+        with open(path, 'r') as f:
+            calendar_data = json.load(f)
+
+        for holiday in calendar_data.get('holidays', []):
+            self.holidays.add(date.fromisoformat(holiday))
+
+        for session_date, (open_str, close_str) in calendar_data.get('sessions', {}).items():
+            self.special_sessions[date.fromisoformat(session_date)] = TradingSession(
+                time.fromisoformat(open_str), time.fromisoformat(close_str)
+            )
+
+    def get_session(self, target_date: date) -> Optional[TradingSession]:
+        # 주말(토요일=5, 일요일=6) 및 휴장일 제외
+        if target_date.weekday() >= 5 or target_date in self.holidays:
+            return None
+        return self.special_sessions.get(target_date, REGULAR_SESSION)
+
+
+_calendar: Optional[TradingCalendar] = None
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """현재 거래 캘린더 반환 (기본값: KRX)"""
+    global _calendar
+    if _calendar is None:
+        calendar = KRXTradingCalendar()
+        if settings.TRADING_CALENDAR_FILE:
+            calendar.load_file(Path(settings.TRADING_CALENDAR_FILE))
+        _calendar = calendar
+    return _calendar
+
+
+def set_trading_calendar(calendar: TradingCalendar) -> None:
+    """거래 캘린더 교체 (다른 시장 또는 테스트용)"""
+    global _calendar
+    _calendar = calendar
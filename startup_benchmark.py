@@ -0,0 +1,98 @@
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent
+
+# 진입점별로 import되면 안 되는 모듈 (지연 import 회귀 감지)
+DEFAULT_FORBIDDEN = {
+    "main": ["boto3", "botocore", "requests", "apscheduler", "websockets"],
+    "streamer": ["boto3", "apscheduler"],
+    "scheduler": ["boto3", "websockets"],
+}
+
+
+def measure_import(module: str) -> Tuple[int, Dict[str, int], List[str]]:
+    """-X importtime으로 모듈 import 측정 - (전체 us, 직접 의존 모듈별 누적 us, import된 모듈 목록)"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+
+    # "import time: self [us] | cumulative | imported package" - 들여쓰기 2칸이 한 단계
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((depth, int(cumulative), name.strip()))
+
+    # 하위 모듈이 먼저 출력되므로 대상 모듈 줄까지 거꾸로 따라가며 직접 의존 모듈을 모은다
+    target_index = max(i for i, (depth, _, name) in enumerate(entries) if depth == 0 and name == module)
+    total = entries[target_index][1]
+    children: Dict[str, int] = {}
+    imported = []
+    for depth, cumulative, name in reversed(entries[:target_index]):
+        if depth == 0:
+            break
+        imported.append(name)
+        if depth == 1:
+            children[name] = cumulative
+
+    return total, children, imported
+
+
+def run_benchmark(modules: List[str], runs: int, top: int, budget_ms: float = None) -> bool:
+    """진입점별 import 시간(중앙값)과 무거운 의존 모듈 출력 - 예산 초과/금지 모듈 import 시 False"""
+    ok = True
+
+    for module in modules:
+        totals = []
+        children: Dict[str, List[int]] = {}
+        imported = set()
+        for _ in range(runs):
+            total, run_children, run_imported = measure_import(module)
+            totals.append(total)
+            imported.update(run_imported)
+            for name, cumulative in run_children.items():
+                children.setdefault(name, []).append(cumulative)
+
+        median_ms = statistics.median(totals) / 1000
+        print(f"{module}: {median_ms:.1f}ms (중앙값, {runs}회, 최소 {min(totals) / 1000:.1f}ms)")
+
+        heaviest = sorted(children.items(), key=lambda item: statistics.median(item[1]), reverse=True)[:top]
+        for name, values in heaviest:
+            print(f"  {statistics.median(values) / 1000:8.1f}ms  {name}")
+
+        forbidden = [name for name in DEFAULT_FORBIDDEN.get(module, []) if name in imported]
+        if forbidden:
+            print(f"  [실패] 지연 import 대상 모듈이 로드됨: {', '.join(forbidden)}")
+            ok = False
+        if budget_ms is not None and median_ms > budget_ms:
+            print(f"  [실패] 예산 초과: {median_ms:.1f}ms > {budget_ms:.1f}ms")
+            ok = False
+
+    return ok
+
+
+def main():
+    """진입점 import 시간 측정 (CI 회귀 확인용)"""
+    parser = argparse.ArgumentParser(description="진입점 시작 시간(-X importtime) 측정")
+    parser.add_argument("modules", nargs="*", default=["main", "streamer", "scheduler"], help="측정할 진입점 모듈")
+    parser.add_argument("--runs", type=int, default=5, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=8, help="출력할 직접 의존 모듈 수")
+    parser.add_argument("--budget-ms", type=float, default=None, help="진입점별 허용 import 시간 (초과 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    ok = run_benchmark(args.modules, args.runs, args.top, args.budget_ms)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
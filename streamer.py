@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+from pathlib import Path
+from typing import List
+
+from src.config.settings import settings
+from src.utils.logging import get_logger
+from src.kis.kis_websocket import run_replay_server
+from src.pipelines.stream import StreamingIngestor
+
+logger = get_logger(__name__)
+
+
+def run_stream_pipeline(stock_codes: List[str] = None, url: str = None, record_path: Path = None, replay: bool = False):
+    """실시간 체결 기반 분봉 파이프라인 실행"""
+    stock_codes = stock_codes or settings.get_stock_codes()
+    logger.info("실시간 분봉 파이프라인 시작")
+    logger.info("대상 종목: %s", ', '.join(stock_codes))
+
+    try:
+        ingestor = StreamingIngestor(url=url, record_path=record_path, flush_by_clock=not replay, reconnect=not replay)
+
+        # DynamoDB 연결 확인
+        if not ingestor.loader.health_check():
+            logger.error("DynamoDB 연결 실패")
+            return False
+
+        asyncio.run(ingestor.run(stock_codes))
+        logger.info("실시간 분봉 파이프라인 실행 완료!")
+        return True
+
+    except KeyboardInterrupt:
+        logger.info("실시간 분봉 파이프라인 중단")
+        return True
+    except Exception as e:
+        logger.error("실시간 분봉 파이프라인 실행 중 오류 발생: %s", e)
+        return False
+
+    finally:
+        logger.info("실시간 분봉 파이프라인 종료")
+
+
+def main():
+    """실시간 수집 또는 녹화 재생 서버 실행"""
+    parser = argparse.ArgumentParser(description="KIS 실시간 체결 수집")
+    parser.add_argument("--url", default=None, help="WebSocket 주소 (기본: KIS_WS_URL)")
+    parser.add_argument("--record", type=Path, default=None, help="수신 메시지 원문 녹화 파일")
+    parser.add_argument("--replay", action="store_true", help="재생 서버 입력 모드 (벽시계 기준 분봉 마감 끔)")
+    parser.add_argument("--serve", type=Path, default=None, help="녹화 파일을 재생하는 로컬 WebSocket 서버 실행")
+    parser.add_argument("--port", type=int, default=21000, help="재생 서버 포트")
+    args = parser.parse_args()
+
+    if args.serve:
+        try:
+            asyncio.run(run_replay_server(args.serve, port=args.port))
+        except KeyboardInterrupt:
+            logger.info("재생 서버 종료")
+        return
+
+    success = run_stream_pipeline(url=args.url, record_path=args.record, replay=args.replay)
+    print("실행 완료" if success else "실행 실패")
+
+
+if __name__ == "__main__":
+    main()
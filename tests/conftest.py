@@ -0,0 +1,10 @@
+import os
+import sys
+from pathlib import Path
+
+# 설정 필수값과 동기 로그 출력 (실제 API 호출 없음)
+os.environ.setdefault("KIS_APP_KEY", "test-app-key")
+os.environ.setdefault("KIS_APP_SECRET", "test-app-secret")
+os.environ.setdefault("LOG_ASYNC", "false")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
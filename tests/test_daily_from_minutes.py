@@ -0,0 +1,82 @@
+from datetime import date
+from decimal import Decimal
+
+from main import build_daily_from_minutes
+from src.models.domain_models import MinuteData
+from src.pipelines.transformer import StockDataTransformer
+from src.utils.session_index import MINUTES_PER_DAY, get_session_index_for
+
+SESSION_DATE = date(2026, 10, 19)
+
+
+class MemoryLoader:
+    """당일 분봉만 돌려주는 저장소 대역"""
+
+    def __init__(self, bars):
+        self.bars = bars
+
+    def get_minute_data(self, stock_code, date_str):
+        return [bar for bar in self.bars if bar.timestamp.startswith(date_str)]
+
+
+def make_session_bars(skip_minutes=()):
+    """KIS가 실제로 주는 모양의 하루 분봉 - 09:00-15:20 접속매매 + 15:30 종가 분봉 (15:21-15:29 없음)"""
+    index = get_session_index_for(SESSION_DATE)
+    base_key = SESSION_DATE.toordinal() * MINUTES_PER_DAY
+    bars = []
+    for slot in range(index.size):
+        minute = index.minute_of(slot)
+        if minute in skip_minutes:
+            continue
+        price = Decimal(70000 + slot * 10)
+        bars.append(MinuteData.at_minute(
+            base_key + minute,
+            stock_code="005930",
+            open_price=price,
+            high_price=price + 50,
+            low_price=price - 50,
+            close_price=price + 10,
+            volume=100,
+        ))
+    return bars
+
+
+def test_realistic_session_builds_daily_bar():
+    bars = make_session_bars()
+    assert not any("15:21" <= bar.timestamp[11:16] <= "15:29" for bar in bars)
+
+    daily = build_daily_from_minutes("005930", SESSION_DATE, StockDataTransformer(), MemoryLoader(bars))
+
+    assert daily is not None
+    assert daily.date == "2026-10-19"
+    assert daily.open_price == Decimal(70000)
+    assert daily.close_price == bars[-1].close_price
+    assert daily.high_price == max(bar.high_price for bar in bars)
+    assert daily.low_price == Decimal(69950)
+    assert daily.volume == 100 * len(bars)
+
+
+def test_minutes_without_trades_do_not_block_aggregation():
+    bars = make_session_bars(skip_minutes={10 * 60 + 5, 13 * 60 + 41})
+
+    daily = build_daily_from_minutes("005930", SESSION_DATE, StockDataTransformer(), MemoryLoader(bars))
+
+    assert daily is not None
+    assert daily.volume == 100 * len(bars)
+
+
+def test_missing_block_of_minutes_falls_back_to_api():
+    # 복구되지 않은 30분 공백 - 고가/저가/거래량이 틀어지므로 집계하지 않음
+    bars = make_session_bars(skip_minutes=set(range(11 * 60, 11 * 60 + 30)))
+
+    assert build_daily_from_minutes("005930", SESSION_DATE, StockDataTransformer(), MemoryLoader(bars)) is None
+
+
+def test_missing_closing_bar_falls_back_to_api():
+    bars = make_session_bars(skip_minutes={15 * 60 + 30})
+
+    assert build_daily_from_minutes("005930", SESSION_DATE, StockDataTransformer(), MemoryLoader(bars)) is None
+
+
+def test_holiday_has_no_session():
+    assert build_daily_from_minutes("005930", date(2026, 10, 18), StockDataTransformer(), MemoryLoader([])) is None
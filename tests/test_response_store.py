@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from src.kis.response_store import TR_DAILY, TR_MINUTE, ResponseStore, has_final_bar
+
+AFTER_CLOSE = datetime(2026, 10, 19, 15, 31)
+
+
+def minute_response(*hours):
+    return {"rt_cd": "0", "output2": [{"stck_bsop_date": "20261019", "stck_cntg_hour": hour} for hour in hours]}
+
+
+def test_response_without_closing_bar_is_not_final():
+    assert not has_final_bar(TR_MINUTE, {"FID_INPUT_HOUR_1": ""}, minute_response("152000", "151900"), AFTER_CLOSE)
+    assert has_final_bar(TR_MINUTE, {"FID_INPUT_HOUR_1": ""}, minute_response("153000", "152000"), AFTER_CLOSE)
+
+
+def test_intraday_window_needs_requested_hour_bar():
+    now = datetime(2026, 10, 19, 10, 5)
+    params = {"FID_INPUT_HOUR_1": "100000"}
+    assert has_final_bar(TR_MINUTE, params, minute_response("100000", "095900"), now)
+    assert not has_final_bar(TR_MINUTE, params, minute_response("095900"), now)
+    assert has_final_bar(TR_DAILY, {}, {"output2": []}, now)
+
+
+def test_overwrite_keeps_total_size(tmp_path):
+    store = ResponseStore(root=tmp_path, max_bytes=10 * 1024 * 1024)
+    store.put("ab" * 32, minute_response("153000"))
+    first_total = store._total_bytes
+    store.put("ab" * 32, minute_response("153000"))
+    store.put("ab" * 32, minute_response("153000"))
+
+    assert store._total_bytes == first_total
+    assert store.get("ab" * 32) is not None and store.get("cd" * 32) is None
+    assert store.stats() == {"hits": 1, "misses": 1}
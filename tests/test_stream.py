@@ -0,0 +1,166 @@
+import asyncio
+import socket
+from datetime import datetime
+from decimal import Decimal
+
+import websockets
+
+from src.kis.kis_websocket import TRADE_FIELD_COUNT, TRADE_TR_ID, KISWebSocketClient, TradeTick, run_replay_server
+from src.pipelines.stream import MinuteBarAggregator, StreamingIngestor
+
+SESSION_DATE = "20261019"
+
+
+def trade_message(stock_code, time_str, price, volume):
+    """H0STCNT0 체결 메시지 1건 (필요한 필드만 채움)"""
+    fields = [""] * TRADE_FIELD_COUNT
+    fields[0] = stock_code
+    fields[1] = time_str
+    fields[2] = str(price)
+    fields[12] = str(volume)
+    fields[33] = SESSION_DATE
+    return f"0|{TRADE_TR_ID}|001|{'^'.join(fields)}"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class FakeAuth:
+    def get_approval_key(self):
+        return "test-approval-key"
+
+
+class MemoryLoader:
+    """저장 호출만 기록하는 저장소 대역"""
+
+    def __init__(self):
+        self.saved = []
+        self.rollups = []
+
+    def get_minute_data(self, stock_code, date_str):
+        return []
+
+    def get_minute_range(self, stock_code, start, end):
+        return []
+
+    def save_minute_data(self, data, deduped=False):
+        self.saved.extend(data)
+        return True
+
+    def save_rollup_data(self, data):
+        self.rollups.extend(data)
+        return True
+
+
+RECORDED_TICKS = [
+    trade_message("005930", "090001", 70000, 10),
+    trade_message("005930", "090015", 70300, 5),
+    trade_message("005930", "090030", 69900, 7),
+    trade_message("005930", "090059", 70100, 3),
+    trade_message("005930", "090100", 70200, 4),
+    # 이미 마감된 09:00 분봉에 늦게 도착한 틱
+    trade_message("005930", "090058", 99999, 1000),
+    trade_message("005930", "090130", 70150, 6),
+    trade_message("005930", "090205", 70400, 2),
+]
+
+
+def run_against_replay_server(tmp_path, messages):
+    """녹화 파일을 재생 서버로 흘려 StreamingIngestor가 저장한 분봉 반환"""
+    record_path = tmp_path / "ticks.txt"
+    record_path.write_text("\n".join(messages) + "\n")
+    port = free_port()
+    loader = MemoryLoader()
+
+    async def scenario():
+        server = asyncio.create_task(run_replay_server(record_path, port=port))
+        await asyncio.sleep(0.2)
+        try:
+            ingestor = StreamingIngestor(loader=loader, auth_manager=FakeAuth(), url=f"ws://127.0.0.1:{port}",
+                                         flush_by_clock=False, reconnect=False)
+            return await ingestor.run(["005930"])
+        finally:
+            server.cancel()
+
+    bar_count = asyncio.run(scenario())
+    return bar_count, loader
+
+
+def test_replayed_ticks_build_minute_bars(tmp_path):
+    bar_count, loader = run_against_replay_server(tmp_path, RECORDED_TICKS)
+
+    assert bar_count == 3
+    bars = {bar.timestamp: bar for bar in loader.saved}
+    assert list(bars) == ["2026-10-19 09:00:00", "2026-10-19 09:01:00", "2026-10-19 09:02:00"]
+
+    first = bars["2026-10-19 09:00:00"]
+    assert (first.open_price, first.high_price, first.low_price, first.close_price, first.volume) == (
+        Decimal(70000), Decimal(70300), Decimal(69900), Decimal(70100), 25)
+
+    # 늦게 온 틱은 완료된 분봉에 반영하지 않는다
+    second = bars["2026-10-19 09:01:00"]
+    assert (second.open_price, second.high_price, second.close_price, second.volume) == (
+        Decimal(70200), Decimal(70200), Decimal(70150), 10)
+
+
+def test_completed_bars_go_through_transformer_and_rollups(tmp_path, monkeypatch):
+    # 프로세스 공용 상위 주기 집계기를 테스트마다 새로 시작
+    monkeypatch.setattr("src.pipelines.rollup._aggregator", None)
+    messages = [trade_message("005930", f"09{minute:02d}10", 70000 + minute * 100, 10) for minute in range(6)]
+
+    _, loader = run_against_replay_server(tmp_path, messages)
+
+    assert [bar.sma_5 is None for bar in loader.saved] == [True, True, True, True, False, False]
+    assert loader.saved[4].sma_5 == Decimal(70200)
+    assert {rollup.interval for rollup in loader.rollups} == {5, 15, 60}
+    five_minute = [rollup for rollup in loader.rollups if rollup.interval == 5]
+    assert (five_minute[-1].timestamp, five_minute[-1].bar_count, five_minute[-1].volume) == ("2026-10-19 09:05:00", 1, 10)
+    assert (five_minute[-2].timestamp, five_minute[-2].bar_count, five_minute[-2].volume) == ("2026-10-19 09:00:00", 5, 50)
+
+
+def test_idle_minute_is_closed_by_clock():
+    aggregator = MinuteBarAggregator()
+    aggregator.add_tick(TradeTick("005930", SESSION_DATE, "090010", Decimal(70000), 10))
+
+    assert aggregator.flush_due(datetime(2026, 10, 19, 9, 0, 40)) == []
+    flushed = aggregator.flush_due(datetime(2026, 10, 19, 9, 1, 0))
+    assert [bar.timestamp for bar in flushed] == ["2026-10-19 09:00:00"]
+
+    # 마감된 분의 늦은 틱은 새 분봉을 만들지 않음
+    assert aggregator.add_tick(TradeTick("005930", SESSION_DATE, "090059", Decimal(1), 1)) is None
+    assert aggregator.flush() == []
+
+
+def test_client_reconnects_and_skips_undecodable_frames():
+    port = free_port()
+    connections = []
+
+    async def handler(connection):
+        connections.append(connection)
+        await connection.recv()
+        if len(connections) == 1:
+            # 첫 연결: 깨진 제어 메시지 후 비정상 종료
+            await connection.send("not-json")
+            await connection.send(trade_message("005930", "090001", 70000, 1))
+            await connection.close(code=1011)
+            return
+        await connection.send(trade_message("005930", "090002", 70100, 2))
+        await connection.close()
+
+    async def scenario():
+        ticks = []
+        async with websockets.serve(handler, "127.0.0.1", port):
+            client = KISWebSocketClient("test-approval-key", url=f"ws://127.0.0.1:{port}")
+            async for tick in client.stream_ticks(["005930"]):
+                ticks.append(tick)
+                if len(ticks) == 2:
+                    break
+        return ticks
+
+    ticks = asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+
+    assert [tick.time for tick in ticks] == ["090001", "090002"]
+    assert len(connections) == 2